@@ -0,0 +1,77 @@
+"""Compare stdlib logging through `TEDHandler` with a plain `logging.StreamHandler`.
+
+Both write plain text lines with the level, logger name, and message to a `StringIO`. The
+stdlib handler formats and writes every record as it is handled, while `TEDHandler` adds
+records to a `Log`'s buffer and formats and renders them in batches when the log is flushed.
+The handlers are measured in turns and the best of `REPEAT` runs is reported, since the shared
+`logging.Logger` overhead is large and noisy.
+
+Run with `python benchmarks/bench_bridge.py`
+"""
+
+import logging
+from io import StringIO
+from time import perf_counter
+
+from teddecor.Logger import LL, Log, Rep, StreamSink
+from teddecor.Logger.bridge import TEDFormatter, TEDHandler
+
+RECORDS = 50_000
+REPEAT = 9
+
+
+def run(handler: logging.Handler) -> float:
+    logger = logging.getLogger(f"bench.{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    start = perf_counter()
+    for i in range(RECORDS):
+        logger.info("Request handled %d", i)
+    handler.flush()
+    elapsed = perf_counter() - start
+
+    logger.removeHandler(handler)
+    return elapsed / RECORDS * 1e9
+
+
+def handle(handler: logging.Handler) -> float:
+    """Only the handler's share, with the `logging.LogRecord`s made up front."""
+    records = [
+        logging.LogRecord("bench", logging.INFO, __file__, 0, "Request handled %d", (i,), None)
+        for i in range(RECORDS)
+    ]
+
+    start = perf_counter()
+    for record in records:
+        handler.handle(record)
+    handler.flush()
+    return (perf_counter() - start) / RECORDS * 1e9
+
+
+if __name__ == "__main__":
+    stream = logging.StreamHandler(StringIO())
+    stream.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+
+    def log() -> Log:
+        return Log(output=StreamSink(StringIO(), Rep.PLAIN), level=LL.INFO)
+
+    bridged = TEDHandler(log())
+    formatted = TEDHandler(log())
+    formatted.setFormatter(TEDFormatter("*\\[%(levelname)s\\]* %(name)s: %(message)s"))
+
+    handlers = [
+        ("StreamHandler", stream),
+        ("TEDHandler", bridged),
+        ("TEDHandler + TEDFormatter", formatted),
+    ]
+    for title, measure in [("logger.info", run), ("handler.handle", handle)]:
+        print(title)
+        best = {name: float("inf") for name, _ in handlers}
+        for _ in range(REPEAT):
+            for name, handler in handlers:
+                best[name] = min(best[name], measure(handler))
+        baseline = best["StreamHandler"]
+        for name, _ in handlers:
+            print(f"  {name:<25}: {best[name]:>8,.0f} ns/record ({baseline / best[name]:.2f}x)")
@@ -0,0 +1,72 @@
+"""Measure the compact, width aware, layout of pretty printed JSON like payloads.
+
+Compares the size of the output, in bytes and lines, and the time to format it with every item
+on it's own line against `width=80` and `width=120`, where containers that fit are put on one
+line. Most of the bytes are ansi sequences, so the line count shows the change in layout better.
+
+Run with `python benchmarks/bench_layout.py`
+"""
+
+from time import perf_counter
+
+from teddecor.pprint import p_value
+
+REPEAT = 5
+
+
+def users(size: int) -> dict:
+    return {
+        f"user_{i}": {
+            "id": i,
+            "name": f"User {i}",
+            "active": i % 3 == 0,
+            "score": i * 1.5,
+            "tags": ["a", "b", None],
+        }
+        for i in range(size)
+    }
+
+
+def events(size: int) -> list:
+    return [
+        {
+            "id": f"{i:08x}",
+            "type": "PushEvent",
+            "actor": {"id": i, "login": f"dev{i}", "avatar": None},
+            "repo": {"id": i * 7, "name": f"org/repo-{i % 50}"},
+            "payload": {
+                "size": 2,
+                "commits": [
+                    {"sha": f"{i:040x}", "message": "Fix typo", "distinct": True},
+                    {"sha": f"{i + 1:040x}", "message": "Add tests", "distinct": False},
+                ],
+            },
+            "created_at": "2024-01-01T00:00:00Z",
+        }
+        for i in range(size)
+    ]
+
+
+def best(render) -> tuple[float, int, int]:
+    times = []
+    for _ in range(REPEAT):
+        start = perf_counter()
+        output = render()
+        times.append(perf_counter() - start)
+    return min(times), len(output.encode()), output.count("\n") + 1
+
+
+if __name__ == "__main__":
+    for name, value in (("users", users(2_000)), ("events", events(1_000))):
+        print(f"{name}:")
+        base_time, base_size, base_lines = best(lambda: p_value(value, depth=5))
+        print(
+            f"  one item per line : {base_time * 1000:>6,.1f} ms {base_size:>10,} bytes"
+            f" {base_lines:>8,} lines"
+        )
+        for width in (80, 120):
+            time, size, lines = best(lambda: p_value(value, depth=5, width=width))
+            print(
+                f"  width={width:<12}: {time * 1000:>6,.1f} ms {size:>10,} bytes {lines:>8,} lines"
+                f" ({size / base_size:.0%} of the bytes, {time / base_time:.2f}x the time)"
+            )
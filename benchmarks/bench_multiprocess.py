@@ -0,0 +1,45 @@
+"""Measure records/sec of 8 worker processes forwarding records to one `LogListener`.
+
+Run with `python benchmarks/bench_multiprocess.py`
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from time import perf_counter
+
+from teddecor.Logger import LL, Log, LogListener, Rep, StreamSink
+
+WORKERS = 8
+RECORDS = 50_000
+BATCH = 500
+
+logger = Log(level=LL.INFO)
+
+
+def init(queue):
+    logger.forward(queue)
+
+
+def work(worker: int) -> int:
+    for i in range(RECORDS // BATCH):
+        for j in range(BATCH):
+            logger.info("Processed item", i * BATCH + j, worker=worker)
+        logger.flush()
+    return RECORDS
+
+
+if __name__ == "__main__":
+    parent = Log(output=StringIO(), level=LL.INFO).sink(
+        StreamSink(StringIO(), Rep.STRUCTURED)
+    )
+
+    start = perf_counter()
+    with LogListener(parent) as listener:
+        with ProcessPoolExecutor(
+            WORKERS, initializer=init, initargs=(listener.queue,)
+        ) as pool:
+            total = sum(pool.map(work, range(WORKERS)))
+    elapsed = perf_counter() - start
+
+    lines = parent._output.stream.getvalue().count("\n")
+    print(f"{WORKERS} workers: {total / elapsed:>12,.0f} records/sec ({lines:,} lines written)")
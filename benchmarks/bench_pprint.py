@@ -0,0 +1,55 @@
+"""Measure pretty printing a large, JSON like, dict.
+
+Compares rendering straight to ansi sequences with producing TED markup, `decode=False`, and
+parsing it afterwards, which is how every value used to be rendered. Plain text, `style=None`,
+is compared with stripping the markup with `TED.strip`.
+
+Run with `python benchmarks/bench_pprint.py`
+"""
+
+from time import perf_counter
+
+from teddecor import TED
+from teddecor.pprint import p_value
+
+REPEAT = 5
+
+
+def payload(size: int) -> dict:
+    return {
+        f"user_{i}": {
+            "id": i,
+            "name": f"User {i}\twith a tab",
+            "active": i % 3 == 0,
+            "score": i * 1.5,
+            "tags": ["a", "b", None],
+        }
+        for i in range(size)
+    }
+
+
+def best(render, value) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = perf_counter()
+        render(value)
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    value = payload(2_000)
+    size = len(p_value(value, depth=3))
+
+    direct = best(lambda v: p_value(v, depth=3), value)
+    parsed = best(lambda v: TED.parse(p_value(v, depth=3, decode=False)), value)
+
+    print(f"output: {size:,} characters")
+    print(f"markup then TED.parse : {parsed * 1000:>8,.1f} ms")
+    print(f"direct ansi           : {direct * 1000:>8,.1f} ms ({parsed / direct:.1f}x)")
+
+    stripped = best(lambda v: TED.strip(p_value(v, depth=3, decode=False)), value)
+    plain = best(lambda v: p_value(v, depth=3, style=None), value)
+
+    print(f"markup then TED.strip : {stripped * 1000:>8,.1f} ms")
+    print(f"plain, style=None     : {plain * 1000:>8,.1f} ms ({stripped / plain:.1f}x)")
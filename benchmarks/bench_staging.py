@@ -0,0 +1,56 @@
+"""Measure logging throughput from many threads into one shared log.
+
+Compares the shared buffer with per thread staging, `Log.staging()`, at 1, 4 and 16 threads.
+A separate thread flushes while the workers log, like the global `Logger` does in a threaded
+program, and the number of records that reach the sink is checked against what was logged.
+
+Run with `python benchmarks/bench_staging.py`
+"""
+
+from io import StringIO
+from threading import Event, Thread
+from time import perf_counter
+
+from teddecor.Logger import LL, Log, Rep, StreamSink
+
+RECORDS = 400_000
+
+
+def run(log: Log, threads: int) -> tuple[float, int]:
+    output = StringIO()
+    log.output(StreamSink(output, Rep.PLAIN))
+    done = Event()
+
+    def work(count: int):
+        for i in range(count):
+            log.info("Request handled", i)
+
+    def flush():
+        while not done.wait(0.001):
+            log.flush()
+        log.flush()
+
+    workers = [Thread(target=work, args=(RECORDS // threads,)) for _ in range(threads)]
+    flusher = Thread(target=flush)
+
+    start = perf_counter()
+    flusher.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    done.set()
+    flusher.join()
+    elapsed = perf_counter() - start
+
+    return RECORDS / elapsed, output.getvalue().count("\n")
+
+
+if __name__ == "__main__":
+    for threads in (1, 4, 16):
+        shared, shared_lines = run(Log(level=LL.INFO), threads)
+        staged, staged_lines = run(Log(level=LL.INFO).staging(), threads)
+        print(
+            f"{threads:>2} threads: shared {shared:>10,.0f} records/s ({shared_lines:,} written)"
+            f"  staged {staged:>10,.0f} records/s ({staged_lines:,} written)"
+        )
@@ -0,0 +1,29 @@
+"""Compare records/sec of the JSON lines output against the colored text output.
+
+Run with `python benchmarks/bench_structured.py`
+"""
+
+from io import StringIO
+from time import perf_counter
+
+from teddecor.Logger import LL, Log
+
+RECORDS = 100_000
+BATCH = 1_000
+
+
+def run(structured: bool) -> float:
+    log = Log(output=StringIO(), level=LL.DEBUG)
+    start = perf_counter()
+    for i in range(RECORDS // BATCH):
+        for j in range(BATCH):
+            log.info("Request handled", i, j, path="/api/items", status=200)
+        log.flush(structured=structured)
+    return RECORDS / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    colored = run(structured=False)
+    structured = run(structured=True)
+    print(f"colored    : {colored:>12,.0f} records/sec")
+    print(f"json lines : {structured:>12,.0f} records/sec ({structured / colored:.1f}x)")
@@ -0,0 +1,52 @@
+"""Measure the per-call overhead of the `Time` decorator's aggregate mode.
+
+Compares calling a trivial function directly, timing it by hand with a pair of
+`perf_counter_ns` calls, which is the least any timer can cost, and decorating it with
+`Time(aggregate=True)`, which also appends each duration to a list that is folded into the
+function's histogram every `BATCH` calls. The overhead is the difference from the direct call,
+in nanoseconds per call, and includes the folding.
+
+Run with `python benchmarks/bench_time.py`
+"""
+
+from time import perf_counter, perf_counter_ns
+
+from teddecor.decorators import Time
+
+CALLS = 1_000_000
+REPEAT = 5
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def by_hand(a: int, b: int) -> int:
+    start = perf_counter_ns()
+    result = add(a, b)
+    perf_counter_ns() - start
+    return result
+
+
+def best(func) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = perf_counter()
+        for i in range(CALLS):
+            func(i, 1)
+        times.append(perf_counter() - start)
+    return min(times) / CALLS * 1e9
+
+
+if __name__ == "__main__":
+    timed = Time(add, aggregate=True, at_exit=False)
+
+    base = best(add)
+    manual = best(by_hand)
+    aggregate = best(timed)
+
+    print(f"direct call            : {base:>6,.0f} ns/call")
+    print(f"perf_counter_ns by hand: {manual:>6,.0f} ns/call (+{manual - base:,.0f})")
+    print(f"Time(aggregate=True)   : {aggregate:>6,.0f} ns/call (+{aggregate - base:,.0f})")
+    timed.timing.fold()
+    print(f"recorded {timed.timing.count:,} calls, p50 {timed.timing.percentile(50):,} ns")
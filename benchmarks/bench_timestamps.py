@@ -0,0 +1,43 @@
+"""Measure the per-record overhead of adding timestamps to log lines.
+
+Compares plain text output without metadata, with cached timestamps, and with a
+`time.strftime` call per record, which is what wrapping every call by hand costs.
+
+Run with `python benchmarks/bench_timestamps.py`
+"""
+
+from io import StringIO
+from time import localtime, perf_counter, strftime, time
+
+from teddecor.Logger import LL, Log, Rep, StreamSink
+
+RECORDS = 200_000
+BATCH = 1_000
+
+
+def run(log: Log, message=lambda i: ("Request handled", i)) -> float:
+    start = perf_counter()
+    for i in range(RECORDS // BATCH):
+        for j in range(BATCH):
+            log.info(*message(j))
+        log.flush()
+    return (perf_counter() - start) / RECORDS * 1e9
+
+
+def plain() -> Log:
+    return Log(output=StreamSink(StringIO(), Rep.PLAIN), level=LL.INFO)
+
+
+if __name__ == "__main__":
+    base = run(plain())
+    cached = run(plain().metadata())
+    metadata = run(plain().metadata(thread=True, process=True))
+    manual = run(
+        plain(),
+        lambda i: (strftime("%Y-%m-%d %H:%M:%S", localtime(time())), "Request handled", i),
+    )
+
+    print(f"no timestamps        : {base:>8,.0f} ns/record")
+    print(f"cached timestamps    : {cached:>8,.0f} ns/record (+{cached - base:,.0f})")
+    print(f"timestamp+thread+pid : {metadata:>8,.0f} ns/record (+{metadata - base:,.0f})")
+    print(f"strftime per record  : {manual:>8,.0f} ns/record (+{manual - base:,.0f})")
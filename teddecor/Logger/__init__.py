@@ -1,2 +1,58 @@
 from .log import Log, Logger
 from .LL import LL
+from .metrics import LatencyHistogram, Metrics
+from .record import Prefix, Record
+from .recorder import FlightRecorder
+from .sinks import Rep, Sink, StreamSink, RotatingFileSink
+from .staging import Staging
+from .structured import JSONSerializer
+from .suppress import Suppressor
+from .timestamps import TimestampCache
+
+__all__ = [
+    "Log",
+    "Logger",
+    "LL",
+    "LatencyHistogram",
+    "Metrics",
+    "Prefix",
+    "Record",
+    "FlightRecorder",
+    "Rep",
+    "Sink",
+    "StreamSink",
+    "RotatingFileSink",
+    "Staging",
+    "JSONSerializer",
+    "Suppressor",
+    "TimestampCache",
+    "AsyncLog",
+    "TEDFormatter",
+    "TEDHandler",
+    "LogListener",
+    "IndexedFileSink",
+    "LogReader",
+]
+
+_LAZY = {
+    "AsyncLog": "aio",
+    "TEDFormatter": "bridge",
+    "TEDHandler": "bridge",
+    "LogListener": "multiprocess",
+    "IndexedFileSink": "index",
+    "LogReader": "index",
+}
+"""Members whose modules import asyncio, logging, or argparse, which are only imported once the
+member is first used so `import teddecor` stays fast."""
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,144 @@
+"""teddecor.Logger.aio
+
+An asyncio counterpart of `Log`. Logging calls stay chainable and synchronous, since they
+only append to the buffer, while `flush` is awaitable and never blocks the event loop.
+
+Rendering and writing happen on a single writer thread, through `loop.run_in_executor`, so
+records are written in the order they were flushed. When too many flushes are waiting to be
+written, `flush` waits for the writer to catch up, which applies backpressure to the coroutines
+that are logging.
+
+Example:
+    ```python
+    logger = AsyncLog(level=LL.INFO)
+
+    async def handle(request):
+        await logger.info("Handling", request.path).flush()
+    ```
+"""
+
+from __future__ import annotations
+
+import sys
+from asyncio import Future, Semaphore, gather, get_running_loop, wrap_future
+from concurrent.futures import Future as ThreadFuture, ThreadPoolExecutor
+from io import TextIOWrapper
+from typing import Callable, Optional, TextIO
+
+from .LL import LL
+from .log import Log
+from .sinks import Sink
+
+__all__ = ["AsyncLog"]
+
+
+class AsyncLog(Log):
+    """A `Log` with an awaitable `flush` that writes on a background writer thread."""
+
+    _SHARED = (*Log._SHARED, "max_pending", "_executor", "_slots", "_pending", "_submitted")
+
+    def __init__(
+        self,
+        output: TextIO | TextIOWrapper | Sink = sys.stdout,
+        level: str = LL.INFO,
+        compare: Callable = LL.ge,
+        encoding: str = "utf-8",
+        max_pending: int = 8,
+    ):
+        """
+        Args:
+            output (TextIO | TextIOWrapper | Sink, optional): The main output. Defaults to sys.stdout.
+            level (str, optional): The level at which logging should occur. Defaults to LL.INFO.
+            compare (Callable, optional): The compare function for logging. Defaults to LL.ge.
+            encoding (str, optional): The encoding to output with. Defaults to "utf-8".
+            max_pending (int, optional): The number of flushes that can be waiting to be written
+            before `flush` waits for the writer. Defaults to 8.
+        """
+        super().__init__(output, level, compare, encoding)
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[Semaphore] = None
+        self._pending: set[Future] = set()
+        self._submitted: set[ThreadFuture] = set()
+
+    async def flush(
+        self,
+        file: Optional[TextIOWrapper | Sink] = None,
+        structured: bool = False,
+    ):
+        """Hand all values stored in the log buffer to the writer thread.
+
+        Returns as soon as the records are queued to be written, unless `max_pending` flushes are
+        already waiting. Use `drain` to wait for everything to be written.
+
+        Args:
+            file (Optional[TextIOWrapper | Sink]): Write the plain text version of the buffer to
+            only this file or sink instead.
+            structured (bool): Write the buffer as JSON lines, one object per record, to only the
+            given file or the main output. Defaults to False.
+        """
+        records = self._take()
+        if len(records) == 0:
+            return self
+
+        loop = get_running_loop()
+        if self._slots is None:
+            self._slots = Semaphore(self.max_pending)
+
+        await self._slots.acquire()
+        future = loop.run_in_executor(self._writer(), self._write, records, file, structured)
+        self._pending.add(future)
+        future.add_done_callback(self._done)
+
+        return self
+
+    def flush_nowait(
+        self,
+        file: Optional[TextIOWrapper | Sink] = None,
+        structured: bool = False,
+    ):
+        """Hand all values stored in the log buffer to the writer thread without waiting. This
+        can be called from any thread, with or without a running event loop, and is what
+        `TEDHandler` uses. `max_pending` isn't applied. Use `drain` to wait for the records to
+        be written.
+
+        Args:
+            file (Optional[TextIOWrapper | Sink]): Write the plain text version of the buffer to
+            only this file or sink instead.
+            structured (bool): Write the buffer as JSON lines, one object per record, to only the
+            given file or the main output. Defaults to False.
+        """
+        records = self._take()
+        if len(records) > 0:
+            future = self._writer().submit(self._write, records, file, structured)
+            self._submitted.add(future)
+            future.add_done_callback(self._submitted.discard)
+
+        return self
+
+    def _writer(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="teddecor-writer")
+        return self._executor
+
+    def _done(self, future: Future):
+        self._pending.discard(future)
+        self._slots.release()
+
+    async def drain(self):
+        """Wait for every flushed record to be written.
+
+        Raises:
+            Exception: Any exception that was raised while writing.
+        """
+        if len(self._pending) > 0 or len(self._submitted) > 0:
+            await gather(*self._pending, *map(wrap_future, list(self._submitted)))
+        return self
+
+    async def close(self):
+        """Write everything that is buffered and stop the writer thread."""
+        await self.flush()
+        await self.drain()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
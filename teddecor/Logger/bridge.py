@@ -0,0 +1,301 @@
+"""teddecor.Logger.bridge
+
+Route records from the standard library's `logging` module through a `Log`.
+
+`TEDHandler` turns each `logging.LogRecord` into an unrendered record in a `Log`'s buffer, so
+dependencies that log with `logging` share the log's sinks, batching, and format. Records are
+flushed when the buffer holds `capacity` records from the handler or when a record at or above
+`flush_level` is handled. Level numbers are mapped to `LL` levels through a table that is built
+once, and which records are handled is decided by `logging`'s levels.
+
+The `logging.LogRecord` is kept and only formatted when the log is flushed, once for each
+representation the sinks need, like `logging.handlers.MemoryHandler` does. Arguments that are
+changed before the flush are formatted as they are at the flush.
+
+`TEDFormatter` is a `logging.Formatter` whose format string can contain TED markup. The markup
+is parsed once when the formatter is created, leaving a format string with the ansi sequences
+already in place and one without them for plain text.
+
+Example:
+    ```python
+    import logging
+
+    logging.basicConfig(level=logging.INFO, handlers=[TEDHandler(Logger)])
+    logging.getLogger("urllib3").warning("Retrying")
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+from re import compile as re_compile
+from typing import Optional
+
+from teddecor import TED
+
+from .LL import LL
+from .log import Log, Logger, _process
+from .record import Prefix, Record
+from .structured import strip_ansi
+
+__all__ = ["TEDHandler", "TEDFormatter", "LEVELS"]
+
+_NAMED = [
+    (logging.DEBUG, LL.DEBUG, "Debug", "white"),
+    (logging.INFO, LL.INFO, "Info", "cyan"),
+    (logging.WARNING, LL.WARNING, "Warning", "yellow"),
+    (logging.ERROR, LL.ERROR, "Error", "red"),
+    (logging.CRITICAL, LL.ERROR, "Critical", "red"),
+]
+
+
+def _levels() -> list[tuple[str, str, str]]:
+    levels = []
+    for levelno in range(logging.CRITICAL + 1):
+        closest = _NAMED[0]
+        for named in _NAMED:
+            if named[0] <= levelno:
+                closest = named
+        levels.append(closest[1:])
+    return levels
+
+
+LEVELS: list[tuple[str, str, str]] = _levels()
+"""The `LL` level, label, and label color for each `logging` level number up to CRITICAL.
+Numbers between the named levels use the closest named level below them."""
+
+_LIMIT = len(LEVELS)
+_GAPS = (False, False)
+_FORMATTER = logging.Formatter()
+
+_PLACEHOLDERS = {
+    "%": re_compile(r"%\(\w+\)[#0+ -]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa]|%%"),
+    "{": re_compile(r"\{[^{}]*\}|\{\{|\}\}"),
+    "$": re_compile(r"\$\{\w+\}|\$\w+|\$\$"),
+}
+
+
+class TEDHandler(logging.Handler):
+    """A `logging.Handler` that adds records to a `Log`'s buffer."""
+
+    def __init__(
+        self,
+        log: Log = Logger,
+        level: int = logging.NOTSET,
+        capacity: int = 1024,
+        flush_level: int = logging.ERROR,
+    ):
+        """
+        Args:
+            log (Log, optional): The log to add records to. Defaults to the global `Logger`.
+            level (int, optional): The `logging` level of the handler. Defaults to logging.NOTSET.
+            capacity (int, optional): Flush the log after this many records from the handler.
+            Defaults to 1024.
+            flush_level (int, optional): Flush the log right away for records at or above this
+            `logging` level. Defaults to logging.ERROR.
+        """
+        super().__init__(level)
+        self.log = log
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._pending = 0
+        self._prefixes: dict[str, Optional[Prefix]] = {"root": None}
+
+    def _prefix(self, name: str) -> Optional[Prefix]:
+        prefix = self._prefixes.get(name, False)
+        if prefix is False:
+            prefix = self._prefixes[name] = Prefix((name,), {})
+        return prefix
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filter a record and add it to the log's buffer. Unlike other handlers this doesn't
+        take the handler's lock, since records are added to the buffer the same way the log's
+        own methods add them, which doesn't need one."""
+        passed = self.filter(record)
+        if isinstance(passed, logging.LogRecord):
+            record = passed
+        if passed:
+            self.emit(record)
+        return passed
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            log = self.log
+            levelno = record.levelno
+            level, label, clr = LEVELS[levelno if 0 <= levelno < _LIMIT else _LIMIT - 1]
+            formatter = self.formatter
+            thread = record.threadName if log._thread else None
+            process = _process() if log._process else None
+            if isinstance(formatter, TEDFormatter):
+                logged = _Formatted(record, formatter, level, thread, process)
+            else:
+                logged = _Logged(record, formatter, level, thread, process)
+                if formatter is None:
+                    logged.label = label
+                    logged.clr = clr
+                    logged.prefix = self._prefix(record.name)
+                else:
+                    logged.label = logged.clr = logged.prefix = None
+            log._target.append(logged)
+
+            self._pending += 1
+            if levelno >= self.flush_level or self._pending >= self.capacity:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Flush the log that the handler adds records to. Logs with an awaitable flush, like
+        `AsyncLog`, are handed to their writer thread with `flush_nowait`, since `logging`
+        calls the handler synchronously and from any thread."""
+        self._pending = 0
+        flush = getattr(self.log, "flush_nowait", None)
+        if flush is not None:
+            flush()
+        else:
+            self.log.flush()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class _Logged(Record):
+    """A record that keeps it's `logging.LogRecord` and formats it the first time the message
+    is read, when the log is flushed."""
+
+    __slots__ = ("source", "formatter", "_message", "_plain")
+
+    context = None
+    gaps = _GAPS
+
+    def __init__(
+        self,
+        source: logging.LogRecord,
+        formatter: Optional[logging.Formatter],
+        level: str,
+        thread: Optional[str],
+        process: Optional[tuple[int, str]],
+    ):
+        self.source = source
+        self.formatter = formatter
+        self.level = level
+        self.thread = thread
+        self.process = process
+        self._message: Optional[str] = None
+        self._plain: Optional[str] = None
+
+    @property
+    def time(self) -> float:
+        return self.source.created
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            formatter = self.formatter
+            if formatter is None:
+                self._message = _message(self.source) + "\n"
+            else:
+                self._message = formatter.format(self.source) + "\n"
+        return self._message
+
+    @property
+    def plain(self) -> str:
+        if self._plain is None:
+            self._plain = strip_ansi(self.message)
+        return self._plain
+
+
+class _Formatted(_Logged):
+    """A record with a `TEDFormatter`, which has the label and logger name in it's message.
+    The formatter has a plain twin, so the message is formatted for each representation as it's
+    read instead of being stripped."""
+
+    __slots__ = ()
+
+    label = clr = prefix = None
+
+    @property
+    def message(self) -> str:
+        return self.formatter.format(self.source) + "\n"
+
+    @property
+    def plain(self) -> str:
+        return self.formatter.plain.format(self.source) + "\n"
+
+
+def _message(record: logging.LogRecord) -> str:
+    """The message of a record followed by it's traceback, without a formatter."""
+    message = record.getMessage()
+    if record.exc_info is not None:
+        if record.exc_text is None:
+            record.exc_text = _FORMATTER.formatException(record.exc_info)
+        message = message + "\n" + record.exc_text
+    return message
+
+
+class TEDFormatter(logging.Formatter):
+    """A `logging.Formatter` whose format string can contain TED markup, which is parsed once."""
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: str = "%",
+        plain: bool = False,
+    ):
+        """
+        Args:
+            fmt (Optional[str], optional): The format string with TED markup. Defaults to
+            `*[%(levelname)s]* %(name)s: %(message)s` in the chosen style.
+            datefmt (Optional[str], optional): The `time.strftime` format of `asctime`.
+            Defaults to None.
+            style (str, optional): One of `%`, `{`, or `$`. Defaults to "%".
+            plain (bool, optional): Remove the markup instead of rendering it. Defaults to False.
+
+        Raises:
+            ValueError: Raised when style isn't one of `%`, `{`, or `$`.
+        """
+        if style not in _PLACEHOLDERS:
+            raise ValueError(f"style must be one of {', '.join(_PLACEHOLDERS)}, was {style!r}")
+        if fmt is None:
+            fmt = {
+                "%": "*\\[%(levelname)s\\]* %(name)s: %(message)s",
+                "{": "*\\[{levelname}\\]* {name}: {message}",
+                "$": "*\\[${levelname}\\]* ${name}: ${message}",
+            }[style]
+
+        self.markup = fmt
+        """The format string before the markup was parsed."""
+        super().__init__(self.compile(fmt, style, plain), datefmt, style)
+        self.plain = self if plain else TEDFormatter(fmt, datefmt, style, plain=True)
+        """The formatter with the markup removed, used for plain text and structured sinks."""
+        self._time = self._style.usesTime()
+
+    def usesTime(self) -> bool:
+        """Whether the format string has `asctime`. Worked out once since it can't change."""
+        return self._time
+
+    @staticmethod
+    def compile(fmt: str, style: str = "%", plain: bool = False) -> str:
+        """Parse the TED markup in a format string while leaving it's placeholders untouched.
+
+        Args:
+            fmt (str): The format string with TED markup.
+            style (str, optional): One of `%`, `{`, or `$`. Defaults to "%".
+            plain (bool, optional): Remove the markup instead of rendering it. Defaults to False.
+
+        Returns:
+            str: The format string with ansi sequences in place of the markup.
+        """
+        placeholders = []
+
+        def hide(match) -> str:
+            placeholders.append(match.group(0))
+            return f"\x00{len(placeholders) - 1}\x00"
+
+        hidden = _PLACEHOLDERS[style].sub(hide, fmt)
+        compiled = TED.strip(hidden) if plain else TED.parse(hidden)
+        for index, placeholder in enumerate(placeholders):
+            compiled = compiled.replace(f"\x00{index}\x00", placeholder)
+        return compiled
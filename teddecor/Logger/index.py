@@ -0,0 +1,437 @@
+"""teddecor.Logger.index
+
+Indexed log files that can be searched without scanning every byte.
+
+`IndexedFileSink` writes records to a log file like any other sink and, as each batch is
+flushed, appends to a sidecar index next to it. Records are indexed in blocks. The block
+directory, `{path}.idx`, holds a fixed size header for each block with it's byte range in the
+log, the time of it's first and last record, and which levels and labels it contains. The
+offset, time, level, and label of every record are kept apart in `{path}.idx.entries`, so the
+directory stays small and block `n` is always at the same position in it.
+
+`LogReader` memory maps the log, the directory, and the entries. Opening a log only looks at
+the size of the directory. Blocks are written in time order, so the blocks of a time range are
+found by bisecting the times in the directory, and the headers in that range are read to skip
+every block without a matching level or label. Finding all errors or the records between two
+times only reads the entries and records of the blocks that matter. Records are yielded lazily.
+
+The reader can also be used from the command line:
+
+    ```
+    python -m teddecor.Logger.index app.log --level ERROR --last 20
+    ```
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from argparse import ArgumentParser
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from typing import Callable, Iterator, NamedTuple, Optional
+from zlib import crc32
+
+from teddecor import TED
+
+from .LL import LL
+from .record import Record
+from .structured import strip_ansi
+from .sinks import Rep, Sink
+
+__all__ = ["IndexedFileSink", "IndexedRecord", "LogReader", "main"]
+
+_MAGIC = b"TEDIX002"
+_BLOCK = Struct("<QIIddHQQ")
+"""offset in the log, byte length, record count, first time, last time, level mask, label mask,
+and offset of the block's entries."""
+_ENTRY = Struct("<IdBI")
+"""offset in the block, time, level, and label hash of a record."""
+
+_LEVELS: list[Optional[str]] = [None, *LL.all()]
+_CODES: dict[Optional[str], int] = {level: code for code, level in enumerate(_LEVELS)}
+_LABELS: dict[Optional[str], int] = {None: 0}
+
+
+def _label(label: Optional[str]) -> int:
+    """The hash of a label without it's markup. Labels are few so the hashes are cached."""
+    value = _LABELS.get(label)
+    if value is None:
+        value = _LABELS[label] = crc32(strip_ansi(TED.strip(label)).encode("utf-8"))
+    return value
+
+
+class IndexedRecord(NamedTuple):
+    """A record read back from an indexed log file."""
+
+    offset: int
+    """The byte offset of the record in the log file."""
+    time: float
+    """The time of the record."""
+    level: Optional[str]
+    """The `LL` level of the record. None for generic messages."""
+    text: str
+    """The rendered record, including it's trailing newline."""
+
+
+class IndexedFileSink(Sink):
+    """Appends records to a log file and writes a sidecar index, `{path}.idx` and
+    `{path}.idx.entries`, as they are flushed.
+
+    Batches written without their records, such as with `write`, are stored but not indexed.
+    The sink should be the only writer of the file.
+    """
+
+    wants_records = True
+
+    def __init__(
+        self,
+        path: str,
+        block: int = 256,
+        encoding: str = "utf-8",
+        rep: str = Rep.PLAIN,
+        level: str = LL.DEBUG,
+        compare: Callable = LL.ge,
+    ):
+        """
+        Args:
+            path (str): The path of the log file. The index is written to `{path}.idx` and
+            `{path}.idx.entries`.
+            block (int, optional): The max number of records in each block of the index.
+            Defaults to 256.
+            encoding (str, optional): The encoding of the log file. Defaults to "utf-8".
+            rep (str, optional): The representation this sink needs. Defaults to `Rep.PLAIN`.
+            level (str, optional): Level that records are compared against. Defaults to `LL.DEBUG`.
+            compare (Callable, optional): `LL.{gt,lt,eq,ge,le}` or `LL.within`. Defaults to `LL.ge`.
+
+        Raises:
+            ValueError: Raised when block is less than 1.
+        """
+        super().__init__(rep, level, compare)
+        if block < 1:
+            raise ValueError(f"block must be at least 1, was {block}")
+
+        self.path = path
+        self.index_path = path + ".idx"
+        self.block = block
+        self.encoding = encoding
+
+        self._file = open(path, "ab")
+        self._offset = self._file.seek(0, os.SEEK_END)
+        self._entries = open(self.index_path + ".entries", "ab")
+        self._position = self._entries.seek(0, os.SEEK_END)
+        self._index = open(self.index_path, "ab")
+        if self._index.seek(0, os.SEEK_END) == 0:
+            self._index.write(_MAGIC)
+
+    def write(self, text: str) -> int:
+        data = text.encode(self.encoding)
+        self._file.write(data)
+        self._offset += len(data)
+        return len(text)
+
+    def write_records(self, records: list[Record], texts: list[str]):
+        """Write a batch of rendered records and index them.
+
+        Args:
+            records (list[Record]): The records of the batch.
+            texts (list[str]): The rendered text of each record.
+        """
+        encoding = self.encoding
+        data = []
+        index = []
+        entries_data = []
+        for start in range(0, len(records), self.block):
+            entries = []
+            levels = 0
+            labels = 0
+            length = 0
+            for record, text in zip(
+                records[start : start + self.block], texts[start : start + self.block]
+            ):
+                encoded = text.encode(encoding)
+                code = _CODES.get(record.level, 0)
+                label = 0 if record.label is None else _label(record.label)
+                entries.append(_ENTRY.pack(length, record.time, code, label))
+                levels |= 1 << code
+                labels |= 1 << (label & 63)
+                length += len(encoded)
+                data.append(encoded)
+
+            index.append(
+                _BLOCK.pack(
+                    self._offset,
+                    length,
+                    len(entries),
+                    records[start].time,
+                    records[min(start + self.block, len(records)) - 1].time,
+                    levels,
+                    labels,
+                    self._position,
+                )
+            )
+            entries_data.extend(entries)
+            self._offset += length
+            self._position += len(entries) * _ENTRY.size
+
+        self._file.write(b"".join(data))
+        self._entries.write(b"".join(entries_data))
+        self._index.write(b"".join(index))
+
+    def flush(self):
+        # The directory is written last so a reader never sees a block before it's records
+        self._file.flush()
+        self._entries.flush()
+        self._index.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+        self._entries.close()
+        self._index.close()
+
+
+class LogReader:
+    """Searches a log file written by `IndexedFileSink` using it's index."""
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        """
+        Args:
+            path (str): The path of the log file. The index is read from `{path}.idx` and
+            `{path}.idx.entries`.
+            encoding (str, optional): The encoding of the log file. Defaults to "utf-8".
+
+        Raises:
+            ValueError: Raised when `{path}.idx` isn't an index written by `IndexedFileSink`.
+        """
+        self.path = path
+        self.encoding = encoding
+
+        self._files = [open(name, "rb") for name in (path + ".idx", path + ".idx.entries", path)]
+        self._index, self._entries, self._map = (_map(file) for file in self._files)
+        if self._index[: len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError(f"{path + '.idx'!r} is not a log index")
+
+        self.blocks = (len(self._index) - len(_MAGIC)) // _BLOCK.size
+        """The number of blocks in the index."""
+
+    def _header(self, number: int) -> tuple:
+        """The header of a block, read from the directory."""
+        return _BLOCK.unpack_from(self._index, len(_MAGIC) + number * _BLOCK.size)
+
+    def _span(self, start: Optional[float], end: Optional[float]) -> range:
+        """The numbers of the blocks that can hold records between two times, found by
+        bisecting the time of the first and last record of each block."""
+        first = 0 if start is None else bisect_left(_Times(self, 4), start)
+        stop = self.blocks if end is None else bisect_right(_Times(self, 3), end)
+        return range(first, max(first, stop))
+
+    def __len__(self) -> int:
+        """The number of indexed records. Reads the header of every block."""
+        return sum(self._header(number)[2] for number in range(self.blocks))
+
+    def _query(
+        self,
+        level: Optional[str],
+        compare: Callable,
+        label: Optional[str],
+    ) -> tuple[Optional[int], Optional[int]]:
+        levels = None
+        if level is not None:
+            levels = 0
+            for code, _level in enumerate(_LEVELS):
+                if _level is not None and compare(_level, level):
+                    levels |= 1 << code
+        return levels, None if label is None else _label(label)
+
+    def _matches(
+        self,
+        block: tuple,
+        levels: Optional[int],
+        label: Optional[int],
+        start: Optional[float],
+        end: Optional[float],
+    ) -> bool:
+        _, _, _, first, last, block_levels, block_labels, _ = block
+        if levels is not None and block_levels & levels == 0:
+            return False
+        if label is not None and block_labels & (1 << (label & 63)) == 0:
+            return False
+        if start is not None and last < start:
+            return False
+        if end is not None and first > end:
+            return False
+        return True
+
+    def _block(
+        self,
+        block: tuple,
+        levels: Optional[int],
+        label: Optional[int],
+        start: Optional[float],
+        end: Optional[float],
+    ) -> list[IndexedRecord]:
+        offset, length, count, _, _, _, _, position = block
+        if position + count * _ENTRY.size > len(self._entries) or offset + length > len(self._map):
+            # Written after the log was opened, or cut short by a crash
+            return []
+        entries = list(_ENTRY.iter_unpack(self._entries[position : position + count * _ENTRY.size]))
+
+        records = []
+        for i, (relative, time, code, hashed) in enumerate(entries):
+            if levels is not None and levels & (1 << code) == 0:
+                continue
+            if label is not None and hashed != label:
+                continue
+            if (start is not None and time < start) or (end is not None and time > end):
+                continue
+
+            stop = entries[i + 1][0] if i + 1 < count else length
+            text = self._map[offset + relative : offset + stop].decode(self.encoding, "replace")
+            records.append(IndexedRecord(offset + relative, time, _LEVELS[code], text))
+        return records
+
+    def records(
+        self,
+        level: Optional[str] = None,
+        label: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        compare: Callable = LL.eq,
+    ) -> Iterator[IndexedRecord]:
+        """Yield the records that match a query, oldest first. Blocks that can't contain a match
+        are skipped without being read.
+
+        Args:
+            level (Optional[str], optional): Only records whose level compares to this level.
+            Defaults to None.
+            label (Optional[str], optional): Only records with this label. Defaults to None.
+            start (Optional[float], optional): Only records at or after this time. Defaults to None.
+            end (Optional[float], optional): Only records at or before this time. Defaults to None.
+            compare (Callable, optional): `LL.{gt,lt,eq,ge,le}` used to compare levels.
+            Defaults to `LL.eq`.
+
+        Yields:
+            IndexedRecord: The matching records.
+        """
+        levels, hashed = self._query(level, compare, label)
+        for number in self._span(start, end):
+            block = self._header(number)
+            if self._matches(block, levels, hashed, start, end):
+                yield from self._block(block, levels, hashed, start, end)
+
+    def last(
+        self,
+        count: int,
+        level: Optional[str] = None,
+        label: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        compare: Callable = LL.eq,
+    ) -> list[IndexedRecord]:
+        """Get the newest records that match a query, reading blocks from the end of the log.
+
+        Args:
+            count (int): The max number of records to get.
+            See `LogReader.records` for the rest of the arguments.
+
+        Returns:
+            list[IndexedRecord]: The matching records, oldest first.
+        """
+        levels, hashed = self._query(level, compare, label)
+        found: list[IndexedRecord] = []
+        for number in reversed(self._span(start, end)):
+            if len(found) >= count:
+                break
+            block = self._header(number)
+            if self._matches(block, levels, hashed, start, end):
+                found[:0] = self._block(block, levels, hashed, start, end)
+        return found[max(len(found) - count, 0) :]
+
+    def close(self):
+        """Close the memory mapped log file and index."""
+        for mapped in (self._index, self._entries, self._map):
+            if isinstance(mapped, mmap):
+                mapped.close()
+        for file in self._files:
+            file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class _Times:
+    """The time of the first, or last, record of every block, read from the directory as it is
+    indexed so it can be bisected."""
+
+    __slots__ = ("reader", "field")
+
+    def __init__(self, reader: LogReader, field: int):
+        self.reader = reader
+        self.field = field
+
+    def __len__(self) -> int:
+        return self.reader.blocks
+
+    def __getitem__(self, number: int) -> float:
+        return self.reader._header(number)[self.field]
+
+
+def _map(file) -> mmap | bytes:
+    """Memory map a file, or an empty bytes for an empty file which can't be mapped."""
+    if os.fstat(file.fileno()).st_size == 0:
+        return b""
+    return mmap(file.fileno(), 0, access=ACCESS_READ)
+
+
+def _time(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def main(argv: Optional[list[str]] = None):
+    """Search an indexed log file from the command line."""
+    parser = ArgumentParser(
+        prog="python -m teddecor.Logger.index",
+        description="Search a log file written by IndexedFileSink",
+    )
+    parser.add_argument("path", help="the log file, indexed by {path}.idx and {path}.idx.entries")
+    parser.add_argument("--level", type=str.upper, choices=LL.all(), help="only this level")
+    parser.add_argument(
+        "--above", action="store_true", help="include levels above --level as well"
+    )
+    parser.add_argument("--label", help="only records with this label")
+    parser.add_argument("--since", type=_time, help="epoch seconds or ISO date and time")
+    parser.add_argument("--until", type=_time, help="epoch seconds or ISO date and time")
+    parser.add_argument("--last", type=int, metavar="N", help="only the newest N records")
+    args = parser.parse_args(argv)
+
+    query = {
+        "level": args.level,
+        "label": args.label,
+        "start": args.since,
+        "end": args.until,
+        "compare": LL.ge if args.above else LL.eq,
+    }
+    with LogReader(args.path) as reader:
+        if args.last is not None:
+            records = reader.last(args.last, **query)
+        else:
+            records = reader.records(**query)
+        try:
+            for record in records:
+                sys.stdout.write(record.text)
+        except BrokenPipeError:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import os
 import sys
+from operator import attrgetter
+from threading import current_thread
+from time import perf_counter_ns, time
 from io import StringIO, TextIOWrapper
 from typing import Any, Callable, Optional, TextIO
 
@@ -8,25 +12,75 @@ from teddecor import TED
 
 from .encoding import encodings
 from .LL import LL
+from .metrics import Metrics
+from .record import Prefix, Record, join_message
+from .recorder import FlightRecorder
+from .sinks import Rep, Sink, StreamSink
+from .staging import Staging
+from .structured import JSONSerializer, strip_ansi
+from .suppress import Suppressor
+from .timestamps import TimestampCache
 
 
 class Log:
     encoding: str
     """The encoding to output with. Default utf-8"""
 
+    _SHARED = (
+        "buffer",
+        "_staging",
+        "_target",
+        "_sinks",
+        "_output",
+        "_level",
+        "_compare",
+        "_encoding",
+        "_forward",
+        "_recorder",
+        "_suppressor",
+        "_metrics",
+        "_stamp",
+        "_clock",
+        "_thread",
+        "_process",
+    )
+    """Attributes that child logs read from, and write to, their root log."""
+    _root: Optional[Log] = None
+    """The log that a child log shares it's buffer and settings with."""
+
     def __init__(
         self,
-        output: TextIO | TextIOWrapper = sys.stdout,
+        output: TextIO | TextIOWrapper | Sink = sys.stdout,
         level: str = LL.INFO,
         compare: Callable = LL.ge,
         encoding: str = "utf-8",
     ):
+        self.buffer: list[Record] = []
+        self._staging: Optional[Staging] = None
+        self._target: list[Record] | Staging = self.buffer
+        self._sinks: list[Sink] = []
+        self._forward = None
+        self._recorder: Optional[FlightRecorder] = None
+        self._suppressor: Optional[Suppressor] = None
+        self._metrics: Optional[Metrics] = None
+        self._stamp: Optional[Callable[[float], str]] = None
+        self._clock: Callable[[], float] = time
+        self._thread = False
+        self._process = False
+        self._prefix: Optional[Prefix] = None
+        self._serializer = JSONSerializer()
+        self._labels: dict[tuple[str, Optional[str]], str] = {}
+        self._plain_labels: dict[str, str] = {}
+        self._renderers = {
+            Rep.ANSI: self._render,
+            Rep.PLAIN: self._render_plain,
+            Rep.STRUCTURED: self._serializer.serialize,
+        }
         self.config(output, level, compare, encoding)
-        self.buffer = []
 
     def config(
         self,
-        output: TextIO | TextIOWrapper,
+        output: TextIO | TextIOWrapper | Sink,
         level: str,
         compare: Callable,
         encoding: str = "utf-8",
@@ -36,24 +90,44 @@ class Log:
         self.comparator(compare)
         self.encode(encoding)
 
-    def output(self, output: TextIO | TextIOWrapper | StringIO):
+    def output(self, output: TextIO | TextIOWrapper | StringIO | Sink):
         """Set where logging should be printed/outputed to.
 
         Args:
-            output (TextIO): The TextIO object to output to.
+            output (TextIO | Sink): The TextIO object to output colored text to, or the sink
+            to use as the main output.
 
         Raises:
-            TypeError: Raised when output is not a TextIO object.
+            TypeError: Raised when output is not a TextIO object or a Sink.
         """
-        if isinstance(output, (TextIO, TextIOWrapper, StringIO)):
+        if isinstance(output, Sink):
             self._output = output
+        elif isinstance(output, (TextIO, TextIOWrapper, StringIO)):
+            self._output = StreamSink(output, Rep.ANSI)
         else:
             raise TypeError(
-                f"output was {type(output)} must be of type {TextIO} or {TextIOWrapper}"
+                f"output was {type(output)} must be of type {TextIO}, {TextIOWrapper}, or {Sink}"
             )
 
         return self
 
+    def sink(self, *sinks: Sink):
+        """Attach additional sinks. Every flush writes the buffer to the main output and
+        to every attached sink that accepts the record's level.
+
+        Args:
+            *sinks (Sink): The sinks to attach.
+
+        Raises:
+            TypeError: Raised when a sink is not a Sink.
+        """
+        for sink in sinks:
+            if not isinstance(sink, Sink):
+                raise TypeError(f"sink was {type(sink)} must be of type {Sink}")
+            self._sinks.append(sink)
+
+        return self
+
     def level(self, level: str):
         """Set the level at which logging should occur.
 
@@ -117,23 +191,353 @@ class Log:
 
         return self
 
-    def flush(self, file: Optional[TextIOWrapper] = None):
-        """Takes all values stored in the log buffer
-        and flushes them to the TextIO output or stdout as default.
+    def recorder(
+        self,
+        size: int = 1024,
+        trigger: str = LL.ERROR,
+        raw: bool = False,
+        path: Optional[str] = None,
+    ):
+        """Keep the most recent log events that are below this log's level in a flight
+        recorder. When an event at or above `trigger` is logged, the recorded history is
+        added to the buffer before it.
+
+        Args:
+            size (int, optional): The number of events to keep. Defaults to 1024.
+            trigger (str, optional): Level that dumps the history. Defaults to LL.ERROR.
+            raw (bool, optional): Keep the logged arguments instead of joining them into a
+            message. Defaults to False.
+            path (Optional[str], optional): Also keep the history in a memory mapped file so
+            it survives a crash. Read it with `FlightRecorder.read(path)`. Defaults to None.
+        """
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder = FlightRecorder(size, trigger, raw, path)
+
+        return self
+
+    def suppress(
+        self,
+        duplicates: bool = True,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        keys: int = 1024,
+    ):
+        """Suppress repeated log events before they are formatted. Identical consecutive events
+        are collapsed into `Last message repeated N times`, and each label and message template
+        can be limited to `rate` events per second. Counts of what was suppressed are kept on
+        `Log.suppressor`.
+
+        Args:
+            duplicates (bool, optional): Collapse identical consecutive events. Defaults to True.
+            rate (Optional[float], optional): Events per second allowed for each label and
+            message template. Defaults to None, which disables rate limiting.
+            burst (Optional[int], optional): Events allowed at once before the rate applies.
+            Defaults to `rate`.
+            keys (int, optional): The most label and template keys that are tracked for the rate
+            limit. The least recently used key is forgotten first. Defaults to 1024.
+        """
+        self._suppressor = Suppressor(duplicates, rate, burst, keys)
+
+        return self
+
+    @property
+    def suppressor(self) -> Optional[Suppressor]:
+        """The suppressor added with `Log.suppress`, which holds the suppression counters."""
+        return self._suppressor
+
+    def measure(
+        self,
+        path: Optional[str] = None,
+        interval: float = 15.0,
+        name: str = "log",
+    ):
+        """Keep counters of how much logging costs. Records per level, filtered and dropped
+        events, bytes per sink, the buffer high-water mark, and a histogram of flush latency
+        are counted on `Log.metrics`.
+
+        Args:
+            path (Optional[str], optional): Also write the counters in the Prometheus text
+            format to this path, at most once every `interval` seconds as the log is flushed.
+            Defaults to None.
+            interval (float, optional): The min number of seconds between writes of the
+            Prometheus file. Defaults to 15.0.
+            name (str, optional): The value of the `log` label in the Prometheus file.
+            Defaults to "log".
+        """
+        self._metrics = Metrics(path, interval, name)
+
+        return self
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        """The metrics added with `Log.measure`. Use `Log.metrics.snapshot()` to read them."""
+        return self._metrics
+
+    def staging(self, enabled: bool = True):
+        """Stage records in a buffer per thread instead of appending to the shared buffer.
+
+        Threads never wait on each other when logging. Every record is numbered from a global
+        sequence and `flush` collects the buffers of all threads back into logging order. Staged
+        records are only moved to `Log.buffer` when the log is flushed.
+
+        Staging is off by default. With the GIL, appending to the shared buffer is as fast or
+        faster, see `benchmarks/bench_staging.py`, so only turn it on after measuring it for
+        your workload.
+
+        Args:
+            enabled (bool, optional): Whether to stage records per thread. Defaults to True.
         """
+        if enabled and self._staging is None:
+            self._staging = self._target = Staging()
+        elif not enabled and self._staging is not None:
+            self.buffer.extend(self._staging.collect())
+            self._staging = None
+            self._target = self.buffer
+
+        return self
 
-        if file is not None:
-            for log in self.buffer:
-                file.write(TED.strip(log))
+    def metadata(
+        self,
+        timestamp: bool = True,
+        thread: bool = False,
+        process: bool = False,
+        clock: str = "wall",
+        fmt: str = "%Y-%m-%d %H:%M:%S",
+        milliseconds: bool = True,
+    ):
+        """Add timestamps, thread names, and process ids to the log lines.
+
+        Timestamps are rendered through a cache that only reformats the date and time when the
+        second changes, so they are cheap to leave on.
+
+        Args:
+            timestamp (bool, optional): Show the time of each record after it's label. Defaults to True.
+            thread (bool, optional): Record the name of the thread that logged each record.
+            Defaults to False.
+            process (bool, optional): Record the pid and name of the process that logged each
+            record. Defaults to False.
+            clock (str, optional): `wall` for the date and time or `monotonic` for seconds since
+            this was called, which is useful for measuring durations. Defaults to "wall".
+            fmt (str, optional): The `time.strftime` format of wall clock timestamps.
+            Defaults to "%Y-%m-%d %H:%M:%S".
+            milliseconds (bool, optional): Append milliseconds to wall clock timestamps.
+            Defaults to True.
+
+        Raises:
+            ValueError: Raised when clock isn't `wall` or `monotonic`
+        """
+        stamp = TimestampCache(fmt, milliseconds, clock)
+        self._clock = stamp.now
+        self._stamp = stamp.format if timestamp else None
+        self._thread = thread
+        self._process = process
+
+        return self
+
+    def child(self, name: str, clr: str = "yellow", **context: Any) -> Log:
+        """Create a child log for a component of the program. The child prefixes every record
+        with it's path, `parent > name`, and context.
+
+        The child keeps a reference to the root log and reads the buffer, sinks, level, and
+        every other setting through it. Changing a setting on the parent, or on any child,
+        changes it for the whole tree, including children that were created before.
+
+        The prefix is rendered once per representation when the child is created, so logging
+        through a child only costs a string concatenation per record.
+
+        Args:
+            name (str): The name of the child.
+            clr (str, optional): The color of each segment of the path. Defaults to "yellow".
+            **context (Any): Key value pairs added to every record of the child. These are
+            merged with the context of this log.
+
+        Returns:
+            Log: The child log.
+        """
+        path = (*self._prefix.path, name) if self._prefix is not None else (name,)
+        merged = {**self._prefix.context, **context} if self._prefix is not None else context
+
+        root = self if self._root is None else self._root
+        child = object.__new__(_child_type(type(root)))
+        child.__dict__.update(
+            (key, value) for key, value in self.__dict__.items() if key not in self._SHARED
+        )
+        child._root = root
+        child._prefix = Prefix(path, merged, clr)
+        child._renderers = {
+            Rep.ANSI: child._render,
+            Rep.PLAIN: child._render_plain,
+            Rep.STRUCTURED: child._serializer.serialize,
+        }
+        return child
+
+    def forward(self, queue: Any):
+        """Forward flushed records, unrendered, to a `LogListener` in another process instead of
+        writing them to this log's sinks. The records carry the pid and name of this process.
+
+        Args:
+            queue (Any): The listener's queue, `LogListener.queue`. None stops forwarding.
+        """
+        if queue is None:
+            self._forward = None
         else:
-            for log in self.buffer:
-                self._output.write(log)
-            self._output.flush()
-        
-        self.buffer = []
+            from multiprocessing import current_process
+            from os import getpid
+
+            self._forward = (queue, getpid(), current_process().name)
+
+        return self
+
+    def flush(
+        self,
+        file: Optional[TextIOWrapper | Sink] = None,
+        structured: bool = False,
+    ):
+        """Takes all values stored in the log buffer
+        and flushes them to the main output and all attached sinks.
+
+        Each record is rendered at most once per representation and every sink
+        receives it's batch with a single write.
+
+        Args:
+            file (Optional[TextIOWrapper | Sink]): Write the plain text version of the buffer to
+            only this file or sink instead.
+            structured (bool): Write the buffer as JSON lines, one object per record, to only the
+            given file or the main output. Defaults to False.
+        """
+
+        self._write(self._take(), file, structured)
 
         return self
 
+    def _take(self) -> list[Record]:
+        """Take every buffered and staged record, oldest first."""
+        if self._staging is not None:
+            self.buffer.extend(self._staging.collect())
+
+        if self._suppressor is not None:
+            self._suppressor.summarize(self.buffer, self._clock())
+
+        # The buffer is emptied in place since child logs share it
+        records = self.buffer[:]
+        del self.buffer[: len(records)]
+
+        if self._metrics is not None:
+            self._metrics.flushed(records)
+        return records
+
+    def _write(
+        self,
+        records: list[Record],
+        file: Optional[TextIOWrapper | Sink] = None,
+        structured: bool = False,
+    ):
+        """Write flushed records to their destination. See `Log.flush`."""
+        metrics = self._metrics
+        if metrics is not None:
+            start = perf_counter_ns()
+
+        if file is not None or structured:
+            render = self._serializer.serialize if structured else self._render_plain
+            target = file or self._output
+            texts = [render(record) for record in records]
+            if isinstance(target, Sink) and target.wants_records:
+                target.write_records(records, texts)
+            else:
+                target.write("".join(texts))
+            target.flush()
+            if metrics is not None:
+                metrics.wrote(target, texts)
+        elif self._forward is not None:
+            queue, pid, name = self._forward
+            if len(records) > 0:
+                queue.put((pid, name, [record.compact() for record in records]))
+        else:
+            self._dispatch(records)
+
+        if metrics is not None:
+            metrics.timed(perf_counter_ns() - start)
+
+    def _dispatch(self, records: list[Record]):
+        """Render the records once per representation and write them to each sink."""
+        renderers = self._renderers
+        sinks = [self._output, *self._sinks]
+        targets = [
+            (sink, [], [] if sink.wants_records else None) for sink in sinks
+        ]
+
+        if len(targets) == 1 and targets[0][2] is None:
+            # A single sink, the usual case, doesn't need the renders shared between sinks.
+            sink, batch, _ = targets[0]
+            render, accepts = renderers[sink.rep], sink.accepts
+            batch.extend([render(record) for record in records if accepts(record.level)])
+            records = ()
+
+        for record in records:
+            rendered = {}
+            for sink, batch, kept in targets:
+                if sink.accepts(record.level):
+                    text = rendered.get(sink.rep)
+                    if text is None:
+                        text = rendered[sink.rep] = renderers[sink.rep](record)
+                    batch.append(text)
+                    if kept is not None:
+                        kept.append(record)
+
+        metrics = self._metrics
+        for sink, batch, kept in targets:
+            if len(batch) > 0:
+                if kept is not None:
+                    sink.write_records(kept, batch)
+                else:
+                    sink.write("".join(batch))
+                if metrics is not None:
+                    metrics.wrote(sink, batch)
+            sink.flush()
+
+    def _render(self, record: Record) -> str:
+        """Render a record into it's colored text representation."""
+        message = record.message
+        if record.prefix is not None:
+            message = record.prefix.ansi + message
+        if self._stamp is not None:
+            message = self._stamp(record.time) + " " + message
+
+        if record.label is None:
+            line = message
+        else:
+            key = (record.label, record.clr)
+            header = self._labels.get(key)
+            if header is None:
+                if record.clr is not None:
+                    header = TED.parse(f"*\\[[@F{record.clr}]{record.label}[@F]\\]* ")
+                else:
+                    header = TED.parse(f"*\\[{record.label}\\]* ")
+                self._labels[key] = header
+            line = header + message
+
+        return _finish(line, record)
+
+    def _render_plain(self, record: Record) -> str:
+        """Render a record into it's plain text representation."""
+        message = record.plain
+        if record.prefix is not None:
+            message = record.prefix.plain + message
+        if self._stamp is not None:
+            message = self._stamp(record.time) + " " + message
+
+        if record.label is None:
+            line = message
+        else:
+            header = self._plain_labels.get(record.label)
+            if header is None:
+                header = f"[{strip_ansi(TED.strip(record.label))}] "
+                self._plain_labels[record.label] = header
+            line = header + message
+
+        return _finish(line, record)
+
     @classmethod
     def path(cls, *args: str, clr: str = "yellow", spr: str = " > ") -> str:
         """Takes all the arguments, segments of path, and combines them with the given seperator and color.
@@ -147,86 +551,134 @@ class Log:
         """
         return f"{spr}".join([TED.parse(f"[@F {clr}]{arg}[@F] ") for arg in args])
 
-    def __out(self, *args: str, label: str, clr: Optional[str] = None, gaps: Optional[list[bool]] = None):
+    def __out(
+        self,
+        *args: str,
+        level: str,
+        label: str,
+        clr: Optional[str] = None,
+        gaps: Optional[list[bool]] = None,
+        context: Optional[dict[str, Any]] = None,
+    ):
         """Base function for formatting a log output.
 
         Args:
+            level (str): The `LL` level of the output
             label (str): The label to apply to the output
             clr (str): Color to give the label
             gaps (Optional[list[bool]], optional): Whether to put a one line
             space on the top, bottom, or both. Defaults to neither. Array indexes
             equivelant to [top, bottom]. If you enter a single bool value it is
             used for both top and bottom. Ex: `[False]` == `[False,  False]`
+            context (Optional[dict[str, Any]], optional): Extra key value pairs to attach to the output.
         """
+        now = self._clock()
+        if self._suppressor is not None and not self._suppressor.admit(
+            self._target, level, label, clr, args, context, now
+        ):
+            if self._metrics is not None:
+                self._metrics.dropped += 1
+            return self
+
         gaps = gaps or []
 
         if len(gaps) == 1:
-            gaps.append(gaps[0])
-
-        if len(gaps) == 2 and gaps[0]:
-            self.buffer.append("\n")
-
-        message = []
-        for arg in args:
-            if isinstance(arg, list):
-                message.extend([str(a) for a in arg])
-            else:
-                message.append(str(arg))
+            gaps = (gaps[0], gaps[0])
+        elif len(gaps) != 2:
+            gaps = (False, False)
+
+        if self._recorder is not None and self._recorder.triggers(level):
+            self._target.extend(self._recorder.dump())
+
+        self._target.append(
+            Record(
+                level,
+                label,
+                clr,
+                join_message(args),
+                now,
+                context,
+                tuple(gaps),
+                thread=current_thread().name if self._thread else None,
+                prefix=self._prefix,
+                process=_process() if self._process else None,
+            )
+        )
 
-        message = " ".join(message)
-        message += "\n" if not message.endswith("\n") else ""
-        
-        if clr is not None:
-            self.buffer.append(TED.parse(f"*\[[@F{clr}]{label}[@F]\]* ") + message)
-        else:
-            self.buffer.append(TED.parse(f"*\[{label}\]* ") + message)
+        return self
 
-        if len(gaps) == 2 and gaps[1]:
-            self.buffer.append("\n")
-            
+    def _below(
+        self,
+        args: tuple,
+        level: str,
+        label: str,
+        clr: Optional[str],
+        context: dict[str, Any],
+    ):
+        """Handle a log event that is below the log's level."""
+        if self._metrics is not None:
+            self._metrics.filtered += 1
+        if self._recorder is not None:
+            self._recorder.push(args, level, label, clr, context, self._clock())
         return self
 
-    def debug(self, *args: Any):
+    def debug(self, *args: Any, **context: Any):
         """Debug log event."""
 
         if self._compare(LL.DEBUG, self._level):
-            return self.__out(*args, label="Debug", clr="white")
-        return self
+            return self.__out(
+                *args, level=LL.DEBUG, label="Debug", clr="white", context=context
+            )
+        return self._below(args, LL.DEBUG, "Debug", "white", context)
 
-    def info(self, *args: Any):
+    def info(self, *args: Any, **context: Any):
         """Info log event."""
 
         if self._compare(LL.INFO, self._level):
-            return self.__out(*args, label="Info", clr="cyan")
-        return self
+            return self.__out(
+                *args, level=LL.INFO, label="Info", clr="cyan", context=context
+            )
+        return self._below(args, LL.INFO, "Info", "cyan", context)
 
-    def warning(self, *args: Any):
+    def warning(self, *args: Any, **context: Any):
         """Warning log event."""
 
         if self._compare(LL.WARNING, self._level):
-            return self.__out(*args, label="Warning", clr="yellow")
-        return self
+            return self.__out(
+                *args, level=LL.WARNING, label="Warning", clr="yellow", context=context
+            )
+        return self._below(args, LL.WARNING, "Warning", "yellow", context)
 
-    def important(self, *args: Any):
+    def important(self, *args: Any, **context: Any):
         """Important log event."""
 
         if self._compare(LL.IMPORTANT, self._level):
-            return self.__out(*args, label="Important", clr="magenta")
-        return self
+            return self.__out(
+                *args,
+                level=LL.IMPORTANT,
+                label="Important",
+                clr="magenta",
+                context=context,
+            )
+        return self._below(args, LL.IMPORTANT, "Important", "magenta", context)
 
-    def success(self, *args: Any):
+    def success(self, *args: Any, **context: Any):
         """Success log event."""
 
         if self._compare(LL.SUCCESS, self._level):
-            return self.__out(*args, label="Success", clr="green")
-        return self
+            return self.__out(
+                *args, level=LL.SUCCESS, label="Success", clr="green", context=context
+            )
+        return self._below(args, LL.SUCCESS, "Success", "green", context)
 
-    def error(self, *args: Any):
+    def error(self, *args: Any, **context: Any):
         """Error log event."""
 
         if self._compare(LL.ERROR, self._level):
-            return self.__out(*args, label="Error", clr="red")
-        return self
+            return self.__out(
+                *args, level=LL.ERROR, label="Error", clr="red", context=context
+            )
+        return self._below(args, LL.ERROR, "Error", "red", context)
 
     def custom(
         self,
@@ -234,6 +686,7 @@ class Log:
         label: str = LL.CUSTOM,
         clr: Optional[str] = None,
         gaps: list[bool] = [False],
+        **context: Any,
     ):
         """Custom log event. This gives control over label, color, message, and gaps, individually.
 
@@ -242,28 +695,87 @@ class Log:
             clr (str, optional): Color of the label. Defaults to "blue".
             gaps (list[bool], optional): Gaps to apply to the top and bottom of the log.
             Defaults to [False].
+            **context (Any): Extra key value pairs to attach to the log.
         """
 
         if self._compare(LL.CUSTOM, self._level):
-            return self.__out(*args, label=label, clr=clr, gaps=gaps)
-        return self
+            return self.__out(
+                *args, level=LL.CUSTOM, label=label, clr=clr, gaps=gaps, context=context
+            )
+        return self._below(args, LL.CUSTOM, label, clr, context)
 
     def message(self, *args: Any):
         """A generic message to be logged without a label."""
 
-        message = []
-        for arg in args:
-            if isinstance(arg, list):
-                message.extend([str(a) for a in arg])
-            else:
-                message.append(str(arg))
+        self._target.append(
+            Record(
+                None,
+                None,
+                None,
+                join_message(args),
+                self._clock(),
+                thread=current_thread().name if self._thread else None,
+                prefix=self._prefix,
+                process=_process() if self._process else None,
+            )
+        )
+        return self
 
-        message = " ".join(message)
-        message += "\n" if not message.endswith("\n") else ""
 
-        self.buffer.append(message)
-        return self
-        
+_CHILD_TYPES: dict[type, type] = {}
+
+
+def _child_type(cls: type) -> type:
+    """The subclass of a log class whose shared attributes, `cls._SHARED`, are properties that
+    resolve through the root log. Only child logs pay for the indirection."""
+    child = _CHILD_TYPES.get(cls)
+    if child is None:
+        shared = {name: _shared(name) for name in cls._SHARED}
+        child = _CHILD_TYPES[cls] = type(cls.__name__, (cls,), shared)
+        child.__module__ = cls.__module__
+    return child
+
+
+def _shared(name: str) -> property:
+    return property(
+        attrgetter(f"_root.{name}"),
+        lambda log, value: setattr(log._root, name, value),
+    )
+
+
+_PROCESS: tuple[int, str] = (-1, "")
+
+
+def _process() -> tuple[int, str]:
+    """The pid and name of the current process. The name is only looked up again
+    when the pid changes, such as after a fork."""
+    global _PROCESS
+
+    if _PROCESS[0] != os.getpid():
+        from multiprocessing import current_process
+
+        _PROCESS = (os.getpid(), current_process().name)
+    return _PROCESS
+
+
+def _finish(line: str, record: Record) -> str:
+    """Add the thread, process, context, and gaps of a record to it's rendered line."""
+    if record.thread is not None or record.process is not None or record.context:
+        pairs = []
+        if record.thread is not None:
+            pairs.append(f"thread={record.thread}")
+        if record.process is not None:
+            pairs.append(f"pid={record.process[0]} process={record.process[1]}")
+        if record.context:
+            pairs.extend(f"{key}={value}" for key, value in record.context.items())
+        line = line[:-1] + " " + " ".join(pairs) + "\n"
+
+    top, bottom = record.gaps
+    if top:
+        line = "\n" + line
+    if bottom:
+        line += "\n"
+    return line
 
 
 Logger = Log(level=LL.INFO)
@@ -0,0 +1,284 @@
+"""teddecor.Logger.metrics
+
+Counters that show how much logging costs.
+
+A `Log` with metrics, `Log.measure(...)`, counts records per level, events that were filtered
+by the level or dropped by the suppressor, bytes written to each sink, the most records that
+were ever waiting in the buffer, and how long each flush took. Counting is done per flush
+where possible, so it is cheap enough to leave on.
+
+The counters can be read with `Metrics.snapshot()` or written in the Prometheus text format
+with `Metrics.prometheus()`. When a path is given the Prometheus file is rewritten at most
+once every `interval` seconds while the log is flushed.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from time import monotonic
+from typing import Any, Optional
+
+from .LL import LL
+from .sinks import Sink
+
+__all__ = ["Metrics", "LatencyHistogram"]
+
+_SUB_BITS = 4
+_SUB = 1 << _SUB_BITS
+
+_BUCKETS = [
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+]
+"""The `le` bounds, in seconds, of the exported flush latency histogram."""
+
+
+class LatencyHistogram:
+    """A histogram of nanosecond durations with log linear buckets, like an HDR histogram.
+
+    Every power of two is split into 16 buckets, so recorded values keep about 6% precision
+    from nanoseconds up to hours while only the buckets that were hit take memory.
+    """
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        """The sum of every recorded value in nanoseconds."""
+        self.max = 0
+
+    @staticmethod
+    def index(value: int) -> int:
+        """The bucket of a value in nanoseconds."""
+        if value < 2 * _SUB:
+            return value
+        shift = value.bit_length() - _SUB_BITS - 1
+        return shift * _SUB + (value >> shift)
+
+    @staticmethod
+    def upper(index: int) -> int:
+        """The largest value in nanoseconds that falls into a bucket."""
+        if index < 2 * _SUB:
+            return index
+        shift = index // _SUB - 1
+        return ((index - shift * _SUB + 1) << shift) - 1
+
+    def record(self, value: int):
+        """Record a duration.
+
+        Args:
+            value (int): The duration in nanoseconds.
+        """
+        index = self.index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """The duration that the given percent of recorded values are at or below.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            int: The upper bound of the bucket that holds the percentile in nanoseconds.
+        """
+        if self.count == 0:
+            return 0
+        target = max(self.count * percent / 100, 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.upper(index), self.max)
+        return self.max
+
+    def cumulative(self, bounds: list[int]) -> list[int]:
+        """The number of recorded values at or below each bound.
+
+        Args:
+            bounds (list[int]): Ascending bounds in nanoseconds.
+
+        Returns:
+            list[int]: The cumulative count for each bound.
+        """
+        counts = []
+        indexes = sorted(self.counts)
+        seen = 0
+        position = 0
+        for bound in bounds:
+            while position < len(indexes) and self.upper(indexes[position]) <= bound:
+                seen += self.counts[indexes[position]]
+                position += 1
+            counts.append(seen)
+        return counts
+
+
+class Metrics:
+    """The counters of a single `Log` and everything that shares it's buffer."""
+
+    def __init__(self, path: Optional[str] = None, interval: float = 15.0, name: str = "log"):
+        """
+        Args:
+            path (Optional[str], optional): Where to write the Prometheus text file. Defaults to
+            None, which doesn't write a file.
+            interval (float, optional): The min number of seconds between writes of the file.
+            Defaults to 15.0.
+            name (str, optional): The value of the `log` label in the Prometheus output.
+            Defaults to "log".
+        """
+        self.path = path
+        self.interval = interval
+        self.name = name
+
+        self.records: Counter = Counter()
+        """Records flushed per level. Generic messages are counted under None."""
+        self.filtered = 0
+        """Events that were below the log's level."""
+        self.dropped = 0
+        """Events that were dropped by the suppressor."""
+        self.bytes: dict[Sink, int] = {}
+        """Bytes written to each sink."""
+        self.high_water = 0
+        """The most records that were waiting in the buffer at once."""
+        self.latency = LatencyHistogram()
+        """How long each flush took to render and write, in nanoseconds."""
+
+        self._written = monotonic()
+
+    def flushed(self, records: list):
+        """Count the records taken by a flush."""
+        self.records.update([record.level for record in records])
+        if len(records) > self.high_water:
+            self.high_water = len(records)
+
+    def wrote(self, sink: Sink, texts: list[str]):
+        """Count the bytes of a batch written to a sink."""
+        size = 0
+        for text in texts:
+            size += len(text) if text.isascii() else len(text.encode("utf-8"))
+        self.bytes[sink] = self.bytes.get(sink, 0) + size
+
+    def timed(self, nanoseconds: int):
+        """Record the latency of a flush and write the Prometheus file if it is due."""
+        self.latency.record(nanoseconds)
+        if self.path is not None and monotonic() - self._written >= self.interval:
+            self.write()
+
+    def _sinks(self) -> dict[str, int]:
+        names = {}
+        for position, (sink, size) in enumerate(self.bytes.items()):
+            name = getattr(sink, "path", None) or f"{type(sink).__name__}#{position}"
+            names[str(name)] = size
+        return names
+
+    def snapshot(self) -> dict[str, Any]:
+        """The current value of every counter.
+
+        Returns:
+            dict[str, Any]: The counters with flush latencies in seconds.
+        """
+        latency = self.latency
+        return {
+            "records": {
+                level: self.records.get(level, 0) for level in [*LL.all(), None]
+            },
+            "filtered": self.filtered,
+            "dropped": self.dropped,
+            "bytes": self._sinks(),
+            "high_water": self.high_water,
+            "flushes": latency.count,
+            "flush_seconds": {
+                "total": latency.total / 1e9,
+                "max": latency.max / 1e9,
+                "p50": latency.percentile(50) / 1e9,
+                "p90": latency.percentile(90) / 1e9,
+                "p99": latency.percentile(99) / 1e9,
+            },
+        }
+
+    def prometheus(self) -> str:
+        """The counters in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+        log = _escape(self.name)
+        lines = [
+            "# HELP teddecor_log_records_total Records flushed per level.",
+            "# TYPE teddecor_log_records_total counter",
+        ]
+        for level in [*LL.all(), None]:
+            lines.append(
+                f'teddecor_log_records_total{{log="{log}",level="{level or "MESSAGE"}"}} '
+                f"{self.records.get(level, 0)}"
+            )
+        lines.extend(
+            [
+                "# HELP teddecor_log_filtered_total Events below the log level.",
+                "# TYPE teddecor_log_filtered_total counter",
+                f'teddecor_log_filtered_total{{log="{log}"}} {self.filtered}',
+                "# HELP teddecor_log_dropped_total Events dropped by the suppressor.",
+                "# TYPE teddecor_log_dropped_total counter",
+                f'teddecor_log_dropped_total{{log="{log}"}} {self.dropped}',
+                "# HELP teddecor_log_sink_bytes_total Bytes written to each sink.",
+                "# TYPE teddecor_log_sink_bytes_total counter",
+            ]
+        )
+        for sink, size in self._sinks().items():
+            lines.append(
+                f'teddecor_log_sink_bytes_total{{log="{log}",sink="{_escape(sink)}"}} {size}'
+            )
+        lines.extend(
+            [
+                "# HELP teddecor_log_buffer_high_water Most records waiting in the buffer at once.",
+                "# TYPE teddecor_log_buffer_high_water gauge",
+                f'teddecor_log_buffer_high_water{{log="{log}"}} {self.high_water}',
+                "# HELP teddecor_log_flush_seconds Time taken to render and write each flush.",
+                "# TYPE teddecor_log_flush_seconds histogram",
+            ]
+        )
+        latency = self.latency
+        counts = latency.cumulative([int(bound * 1e9) for bound in _BUCKETS])
+        for bound, count in zip(_BUCKETS, counts):
+            lines.append(f'teddecor_log_flush_seconds_bucket{{log="{log}",le="{bound}"}} {count}')
+        lines.extend(
+            [
+                f'teddecor_log_flush_seconds_bucket{{log="{log}",le="+Inf"}} {latency.count}',
+                f'teddecor_log_flush_seconds_sum{{log="{log}"}} {latency.total / 1e9}',
+                f'teddecor_log_flush_seconds_count{{log="{log}"}} {latency.count}',
+            ]
+        )
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """Write the Prometheus text file now. The file is replaced atomically so scrapers never
+        read a partial file."""
+        if self.path is None:
+            return
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.prometheus())
+        os.replace(temporary, self.path)
+        self._written = monotonic()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,109 @@
+"""teddecor.Logger.multiprocess
+
+Collect logs from many processes into a single `Log` in the parent process.
+
+Worker processes forward their flushed records, unrendered, over a `multiprocessing.Queue`
+with `Log.forward(queue)`. A `LogListener` in the parent batches the records, renders them
+once per representation, and writes them through the parent log's sinks. Only the parent
+opens files and each batch is written whole, so output from different workers never
+interleaves mid line.
+
+Example:
+    ```python
+    from concurrent.futures import ProcessPoolExecutor
+
+    def init(queue):
+        Logger.forward(queue)
+
+    def work(n):
+        Logger.info("Working on", n).flush()
+
+    with LogListener(Logger) as listener:
+        with ProcessPoolExecutor(initializer=init, initargs=(listener.queue,)) as pool:
+            pool.map(work, range(10))
+    ```
+"""
+
+from __future__ import annotations
+
+from queue import Empty
+from threading import Thread
+from typing import Any, Optional
+
+from .log import Log
+from .record import Record
+
+__all__ = ["LogListener"]
+
+
+class LogListener:
+    """Receives records forwarded from other processes and writes them through a `Log`'s sinks."""
+
+    def __init__(self, log: Log, queue: Optional[Any] = None, batch: int = 1024):
+        """
+        Args:
+            log (Log): The log whose sinks the forwarded records are written to.
+            queue (Optional[Any], optional): The queue that records are forwarded over. Defaults to
+            a new `multiprocessing.Queue`. Use a `multiprocessing.Manager().Queue()` if the queue
+            needs to be passed as an argument to pool tasks.
+            batch (int, optional): The max number of forwarded flushes that are written together.
+            Defaults to 1024.
+        """
+        if queue is None:
+            from multiprocessing import Queue
+
+            queue = Queue()
+
+        self.log = log
+        self.queue = queue
+        """The queue to give to worker processes with `Log.forward(queue)`."""
+        self.batch = batch
+        self._thread: Optional[Thread] = None
+
+    def start(self):
+        """Start listening for records on a background thread."""
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="teddecor-listener", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Write every record that is already in the queue and stop listening."""
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+    @staticmethod
+    def _records(payload: tuple) -> list[Record]:
+        pid, name, records = payload
+        process = (pid, name)
+        return [Record(*record, process=process) for record in records]
+
+    def _run(self):
+        get, get_nowait = self.queue.get, self.queue.get_nowait
+        running = True
+        while running:
+            payload = get()
+            if payload is None:
+                break
+
+            records = self._records(payload)
+            for _ in range(self.batch - 1):
+                try:
+                    payload = get_nowait()
+                except Empty:
+                    break
+                if payload is None:
+                    running = False
+                    break
+                records.extend(self._records(payload))
+
+            self.log._dispatch(records)
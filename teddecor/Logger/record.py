@@ -0,0 +1,152 @@
+"""teddecor.Logger.record
+
+A record is a single unrendered log event. Records are buffered by `Log` and are
+only rendered when they are flushed, which lets the same record be written as
+colored text, plain text, or structured data.
+"""
+
+from __future__ import annotations
+
+from json.encoder import encode_basestring
+from typing import Any, Optional
+
+from teddecor import TED
+
+from .structured import encode_value, strip_ansi
+
+__all__ = ["Record", "Prefix", "join_message"]
+
+
+class Prefix:
+    """The path and context of a child log, rendered once for each representation."""
+
+    __slots__ = ("path", "context", "ansi", "plain", "structured")
+
+    def __init__(
+        self,
+        path: tuple[str, ...],
+        context: dict[str, Any],
+        clr: str = "yellow",
+    ):
+        """
+        Args:
+            path (tuple[str, ...]): The names of the child logs from the root down.
+            context (dict[str, Any]): Key value pairs added to every record of the child log.
+            clr (str, optional): The color of each segment of the path. Defaults to "yellow".
+        """
+        self.path = path
+        self.context = context
+
+        pairs = "".join(f" {key}={value}" for key, value in context.items())
+        self.ansi = (
+            " > ".join([TED.parse(f"[@F {clr}]{TED.encode(name)}") for name in path])
+            + pairs
+            + ": "
+        )
+        """The prefix for colored text."""
+        self.plain = " > ".join(path) + pairs + ": "
+        """The prefix for plain text."""
+        self.structured = f',"logger":{encode_basestring(".".join(path))}' + "".join(
+            f",{encode_basestring(str(key))}:{encode_value(value)}"
+            for key, value in context.items()
+        )
+        """The fragment added to JSON lines."""
+
+    def __repr__(self) -> str:
+        return f"<Prefix: {'.'.join(self.path)}>"
+
+
+class Record:
+    """A single log event that has not been rendered yet."""
+
+    __slots__ = (
+        "level",
+        "label",
+        "clr",
+        "message",
+        "time",
+        "context",
+        "gaps",
+        "thread",
+        "prefix",
+        "process",
+    )
+
+    def __init__(
+        self,
+        level: Optional[str],
+        label: Optional[str],
+        clr: Optional[str],
+        message: str,
+        time: float,
+        context: Optional[dict[str, Any]] = None,
+        gaps: tuple[bool, bool] = (False, False),
+        thread: Optional[str] = None,
+        prefix: Optional[Prefix] = None,
+        process: Optional[tuple[int, str]] = None,
+    ):
+        self.level = level
+        """The `LL` level of the record. None for generic messages."""
+        self.label = label
+        """The TED markup label of the record. None for generic messages."""
+        self.clr = clr
+        """The color of the label."""
+        self.message = message
+        """The joined message, always ending with a newline."""
+        self.time = time
+        """Time of when the record was created, taken with the log's clock. This is
+        `time.time()` unless the log uses the monotonic clock."""
+        self.context = context
+        """Extra key value pairs given with the record."""
+        self.gaps = gaps
+        """Whether to put an empty line before and after the record."""
+        self.thread = thread
+        """The name of the thread that created the record. Only set when the log records threads."""
+        self.prefix = prefix
+        """The prefix of the child log that created the record."""
+        self.process = process
+        """The pid and name of the process that created the record. Only set when the log
+        records processes or for records that were forwarded from another process."""
+
+    @property
+    def plain(self) -> str:
+        """The message without ansi sequences."""
+        return strip_ansi(self.message)
+
+    def compact(self) -> tuple:
+        """The record as a plain tuple, which is cheap to pickle and send to another process."""
+        return (
+            self.level,
+            self.label,
+            self.clr,
+            self.message,
+            self.time,
+            self.context,
+            self.gaps,
+            self.thread,
+            self.prefix,
+        )
+
+    def __repr__(self) -> str:
+        return f"<Record: {self.level}, {self.message!r}>"
+
+
+def join_message(args: tuple) -> str:
+    """Join log arguments into a single message. Lists are flattened and the
+    message always ends with a newline.
+
+    Args:
+        args (tuple): The arguments given to a log method.
+
+    Returns:
+        str: The joined message.
+    """
+    message = []
+    for arg in args:
+        if isinstance(arg, list):
+            message.extend([str(a) for a in arg])
+        else:
+            message.append(str(arg))
+
+    message = " ".join(message)
+    return message if message.endswith("\n") else message + "\n"
@@ -0,0 +1,192 @@
+"""teddecor.Logger.recorder
+
+A flight recorder keeps the most recent records that were below a `Log`'s level in a fixed
+size circular buffer. Nothing is rendered or written for them until a record at or above the
+trigger level is logged, at which point the recent history is added to the buffer first.
+
+The recorder can also be backed by a memory mapped file so the history survives a crash. Use
+`FlightRecorder.read(path)` to get the history back out of the file.
+"""
+
+from __future__ import annotations
+
+from mmap import mmap
+from struct import Struct
+from typing import Any, Optional
+
+from .LL import LL
+from .record import Record, join_message
+
+__all__ = ["FlightRecorder"]
+
+_MAGIC = b"TEDFR001"
+_HEADER = Struct("<8sQQ")
+"""magic, slot size, and the index of the next slot to write."""
+_LENGTH = Struct("<I")
+
+
+class FlightRecorder:
+    """Fixed size circular buffer of unrendered records."""
+
+    _map: Optional[mmap] = None
+    """The memory mapped file. A class default so `close` works even when `__init__` raised."""
+
+    def __init__(
+        self,
+        size: int = 1024,
+        trigger: str = LL.ERROR,
+        raw: bool = False,
+        path: Optional[str] = None,
+        slot_bytes: int = 512,
+    ):
+        """
+        Args:
+            size (int, optional): The number of records to keep. Defaults to 1024.
+            trigger (str, optional): Records at or above this level dump the history. Defaults to LL.ERROR.
+            raw (bool, optional): Keep the logged arguments instead of joining them into a message.
+            This is cheaper but keeps references to the arguments. Defaults to False.
+            path (Optional[str], optional): Also write the history to a memory mapped file at this path.
+            Defaults to None.
+            slot_bytes (int, optional): Bytes per record in the memory mapped file. Longer records are
+            truncated. Defaults to 512.
+
+        Raises:
+            TypeError: Raised when trigger isn't an attribute in `<class 'LL'>`
+            ValueError: Raised when size is less than 1.
+        """
+        if trigger not in LL.all():
+            raise TypeError(
+                f"trigger must be an attribute in <class 'LL'>. Valid options include {', '.join(LL.all())}"
+            )
+        if size < 1:
+            raise ValueError(f"size must be at least 1, was {size}")
+
+        self.size = size
+        self.raw = raw
+        self._triggers = {level: LL.ge(level, trigger) for level in LL.all()}
+        self._slots: list[Optional[tuple]] = [None] * size
+        self._index = 0
+        self._written = 0
+
+        self._map: Optional[mmap] = None
+        self._slot_bytes = slot_bytes
+        if path is not None:
+            self._map = self._open(path, size, slot_bytes)
+
+    @staticmethod
+    def _open(path: str, size: int, slot_bytes: int) -> mmap:
+        length = _HEADER.size + size * slot_bytes
+        with open(path, "a+b") as file:
+            file.truncate(length)
+            mapped = mmap(file.fileno(), length)
+        _HEADER.pack_into(mapped, 0, _MAGIC, slot_bytes, 0)
+        mapped[_HEADER.size :] = bytes(size * slot_bytes)
+        return mapped
+
+    def triggers(self, level: str) -> bool:
+        """Whether a record of the given level should dump the history.
+
+        Args:
+            level (str): The level of the record.
+
+        Returns:
+            bool: True if the history should be dumped.
+        """
+        return self._triggers.get(level, False)
+
+    def push(
+        self,
+        args: tuple,
+        level: str,
+        label: str,
+        clr: Optional[str],
+        context: Optional[dict[str, Any]],
+        now: float,
+    ):
+        """Record an event that was below the log's level.
+
+        Args:
+            args (tuple): The arguments given to the log method.
+            level (str): The level of the event.
+            label (str): The label of the event.
+            clr (Optional[str]): The color of the label.
+            context (Optional[dict[str, Any]]): The context given with the event.
+            now (float): The time of the event.
+        """
+        message = args if self.raw else join_message(args)
+        index = self._index
+        self._slots[index % self.size] = (level, label, clr, message, now, context)
+        self._index = index + 1
+
+        if self._map is not None:
+            text = message if isinstance(message, str) else join_message(message)
+            self._write(f"{now:.6f}\t{level}\t{text[:-1]}".encode("utf-8"))
+
+    def _write(self, data: bytes):
+        index = self._written
+        self._written = index + 1
+        width = self._slot_bytes - _LENGTH.size
+        if len(data) > width:
+            data = data[:width]
+        offset = _HEADER.size + (index % self.size) * self._slot_bytes
+        _LENGTH.pack_into(self._map, offset, len(data))
+        self._map[offset + _LENGTH.size : offset + _LENGTH.size + len(data)] = data
+        _HEADER.pack_into(self._map, 0, _MAGIC, self._slot_bytes, index + 1)
+
+    def dump(self) -> list[Record]:
+        """Take the recorded history, oldest first, and clear the recorder.
+
+        Returns:
+            list[Record]: The recorded events as records.
+        """
+        count = min(self._index, self.size)
+        start = self._index - count
+        records = []
+        for index in range(start, self._index):
+            slot = index % self.size
+            level, label, clr, message, now, context = self._slots[slot]
+            self._slots[slot] = None
+            if not isinstance(message, str):
+                message = join_message(message)
+            records.append(Record(level, label, clr, message, now, context))
+
+        self._index = 0
+        return records
+
+    def close(self):
+        """Close the memory mapped file, if there is one."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    @staticmethod
+    def read(path: str) -> list[str]:
+        """Read the history that a recorder left in a memory mapped file.
+
+        Args:
+            path (str): The path given to the recorder.
+
+        Raises:
+            ValueError: Raised when the file wasn't written by a flight recorder.
+
+        Returns:
+            list[str]: The recorded events, oldest first, as `{time}\\t{level}\\t{message}`.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, slot_bytes, index = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path!r} is not a flight recorder file")
+
+        size = (len(data) - _HEADER.size) // slot_bytes
+        lines = []
+        for slot in range(max(index - size, 0), index):
+            offset = _HEADER.size + (slot % size) * slot_bytes
+            (length,) = _LENGTH.unpack_from(data, offset)
+            start = offset + _LENGTH.size
+            lines.append(data[start : start + length].decode("utf-8", "replace"))
+        return lines
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,455 @@
+"""teddecor.Logger.sinks
+
+Sinks are destinations that a `Log` writes it's flushed records to. Each sink declares the
+representation it needs, colored text, plain text, or structured JSON lines, along with
+it's own level filter. On flush each record is rendered at most once per representation
+and the joined batch is handed to every sink that accepts it.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+from queue import Queue
+from re import compile as re_compile
+from threading import Lock, Thread
+from time import localtime, strftime, time
+from typing import TYPE_CHECKING, Callable, Optional, TextIO
+
+from .LL import LL
+
+if TYPE_CHECKING:
+    from .record import Record
+
+try:
+    import fcntl
+
+    def _lock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+except ImportError:  # pragma: no cover - windows
+    import msvcrt
+
+    def _lock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+__all__ = ["Rep", "Sink", "StreamSink", "RotatingFileSink"]
+
+
+class Rep:
+    """The representation that a sink needs records rendered as.
+
+    - ANSI       : Colored text, the same as what is written to the terminal
+    - PLAIN      : Text without any ansi sequences
+    - STRUCTURED : JSON lines, one object per record
+    """
+
+    ANSI: str = "ANSI"
+    PLAIN: str = "PLAIN"
+    STRUCTURED: str = "STRUCTURED"
+    _order = [ANSI, PLAIN, STRUCTURED]
+
+    @classmethod
+    def all(cls) -> list[str]:
+        """Get all of the representations.
+
+        Returns:
+            list[str]: List of all representations.
+        """
+        return cls._order
+
+
+class Sink:
+    """Base class for a destination that flushed records are written to.
+
+    Subclasses implement `write`, and optionally `flush` and `close`. Sinks that need the
+    records along with their rendered text, such as to index them, set `wants_records` and
+    implement `write_records`.
+    """
+
+    wants_records: bool = False
+    """Whether flushed batches are given to `write_records` instead of `write`."""
+
+    def __init__(
+        self,
+        rep: str = Rep.PLAIN,
+        level: str = LL.DEBUG,
+        compare: Callable = LL.ge,
+    ):
+        """
+        Args:
+            rep (str, optional): The representation this sink needs. Defaults to `Rep.PLAIN`.
+            level (str, optional): Level that records are compared against. Defaults to `LL.DEBUG`.
+            compare (Callable, optional): `LL.{gt,lt,eq,ge,le}` or `LL.within`. Defaults to `LL.ge`.
+
+        Raises:
+            TypeError: Raised when rep isn't an attribute in `<class 'Rep'>`
+            TypeError: Raised when level isn't an attribute in `<class 'LL'>`
+        """
+        if rep not in Rep.all():
+            raise TypeError(
+                f"rep must be an attribute in <class 'Rep'>. Valid options include {', '.join(Rep.all())}"
+            )
+        if level not in LL.all():
+            raise TypeError(
+                f"level must be an attribute in <class 'LL'>. Valid options include {', '.join(LL.all())}"
+            )
+
+        self.rep = rep
+        self._accepts = {_level: compare(_level, level) for _level in LL.all()}
+
+    def accepts(self, level: Optional[str]) -> bool:
+        """Whether a record of the given level should be written to this sink. Generic
+        messages, without a level, are always accepted.
+
+        Args:
+            level (Optional[str]): The level of the record.
+
+        Returns:
+            bool: True if the record should be written.
+        """
+        return level is None or self._accepts.get(level, False)
+
+    def write(self, text: str) -> int:
+        """Write a rendered batch of records.
+
+        Args:
+            text (str): The rendered records joined together.
+        """
+        raise NotImplementedError
+
+    def write_records(self, records: list[Record], texts: list[str]):
+        """Write a batch of records along with their rendered text.
+
+        Args:
+            records (list[Record]): The records of the batch.
+            texts (list[str]): The rendered text of each record.
+        """
+        self.write("".join(texts))
+
+    def flush(self):
+        """Flush anything that the sink buffered."""
+
+    def close(self):
+        """Close the sink."""
+
+
+class StreamSink(Sink):
+    """Writes batches to a TextIO stream such as `sys.stdout` or an open file."""
+
+    def __init__(
+        self,
+        stream: TextIO,
+        rep: str = Rep.ANSI,
+        level: str = LL.DEBUG,
+        compare: Callable = LL.ge,
+    ):
+        """
+        Args:
+            stream (TextIO): The stream to write to.
+            rep (str, optional): The representation this sink needs. Defaults to `Rep.ANSI`.
+            level (str, optional): Level that records are compared against. Defaults to `LL.DEBUG`.
+            compare (Callable, optional): `LL.{gt,lt,eq,ge,le}` or `LL.within`. Defaults to `LL.ge`.
+        """
+        super().__init__(rep, level, compare)
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.stream.close()
+
+
+COMPRESSION = {"gzip": ".gz", "lzma": ".xz"}
+"""Supported compression methods and the extension given to compressed segments."""
+
+_SEGMENT = re_compile(r"^\d{8}-\d{6}-\d{6}(-\d+)?(\.gz|\.xz)?$")
+
+
+class _Compressor:
+    """Single background worker that compresses closed segments and removes old ones.
+
+    The worker is shared by every `RotatingFileSink` in the process and is only
+    started once the first segment is closed.
+    """
+
+    def __init__(self):
+        self._jobs: Queue = Queue()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    def submit(self, segment: str, method: Optional[str], path: str, backups: int):
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="teddecor-compressor", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.join)
+        self._jobs.put((segment, method, path, backups))
+
+    def join(self):
+        """Wait for all submitted segments to be compressed and pruned."""
+        if self._thread is not None:
+            self._jobs.join()
+
+    def _run(self):
+        while True:
+            segment, method, path, backups = self._jobs.get()
+            try:
+                if method is not None:
+                    _compress(segment, method)
+                if backups > 0:
+                    _prune(path, backups)
+            except OSError:
+                pass
+            finally:
+                self._jobs.task_done()
+
+
+_compressor = _Compressor()
+
+
+def _compress(segment: str, method: str):
+    """Compress a closed segment into a temporary file and atomically move it in place."""
+    from shutil import copyfileobj
+
+    if method == "gzip":
+        from gzip import open as copen
+    else:
+        from lzma import open as copen
+
+    final = segment + COMPRESSION[method]
+    with open(segment, "rb") as source, copen(final + ".tmp", "wb") as dest:
+        copyfileobj(source, dest, 1024 * 1024)
+    os.replace(final + ".tmp", final)
+    os.remove(segment)
+
+
+def _prune(path: str, backups: int):
+    """Remove the oldest segments of a log until only `backups` are left."""
+    directory, name = os.path.split(os.path.abspath(path))
+    segments = sorted(
+        entry
+        for entry in os.listdir(directory)
+        if entry.startswith(name + ".") and _SEGMENT.match(entry[len(name) + 1 :])
+    )
+    for entry in segments[: max(len(segments) - backups, 0)]:
+        try:
+            os.remove(os.path.join(directory, entry))
+        except FileNotFoundError:
+            pass
+
+
+class RotatingFileSink(Sink):
+    """A log file that rotates based on size and/or time.
+
+    The sink is attached with `Log.sink(...)`, or passed to `Log.flush(file=...)`, and writes
+    plain text by default. Each flush is written with a single call so the logger's batching
+    carries through to the file.
+
+    When the file is rotated it is atomically renamed to `{path}.{YYYYmmdd-HHMMSS-ffffff}`
+    and a new file is started. Closed segments are compressed and the oldest are
+    removed on a background thread so the logging thread never pays for it.
+
+    Writes and rotation are guarded with a lock file, `{path}.lock`, so many `Log` instances,
+    in one or more processes, can share the same file. Before each write the sink checks that
+    the file it has open is still the one at `path`, and if another instance rotated it then the
+    sink reopens the new file, so nothing is written to a segment that is being compressed.
+
+    Example:
+        ```python
+        sink = RotatingFileSink("logs/app.log", max_bytes=10_000_000, backups=5)
+        Logger.sink(sink).info("Started").flush()
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 0,
+        interval: float = 0,
+        backups: int = 5,
+        compress: Optional[str] = "gzip",
+        encoding: str = "utf-8",
+        rep: str = Rep.PLAIN,
+        level: str = LL.DEBUG,
+        compare: Callable = LL.ge,
+    ):
+        """
+        Args:
+            path (str): The path of the active log file.
+            max_bytes (int, optional): Rotate before the file grows past this many bytes.
+            Defaults to 0, which disables size based rotation.
+            interval (float, optional): Rotate every `interval` seconds. Boundaries are aligned to
+            the epoch so every instance rotates at the same time. Defaults to 0, which disables
+            time based rotation.
+            backups (int, optional): Number of closed segments to keep. Defaults to 5. A value of 0
+            keeps every segment.
+            compress (Optional[str], optional): Compression for closed segments; `gzip`, `lzma`, or None.
+            Defaults to "gzip".
+            encoding (str, optional): Encoding used to write the file. Defaults to "utf-8".
+            rep (str, optional): The representation this sink needs. Defaults to `Rep.PLAIN`.
+            level (str, optional): Level that records are compared against. Defaults to `LL.DEBUG`.
+            compare (Callable, optional): `LL.{gt,lt,eq,ge,le}` or `LL.within`. Defaults to `LL.ge`.
+
+        Raises:
+            ValueError: Raised when compress isn't a supported compression method.
+        """
+        super().__init__(rep, level, compare)
+        if compress is not None and compress not in COMPRESSION:
+            raise ValueError(
+                f"compress must be one of {', '.join(COMPRESSION)} or None, was {compress!r}"
+            )
+
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backups = backups
+        self.compress = compress
+        self.encoding = encoding
+
+        self._lock = Lock()
+        self._stream = None
+        self._shared: Optional[int] = None
+        """The lock file shared with every other instance writing to the same path."""
+        self._rollover = 0.0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _open(self):
+        if self._shared is None:
+            self._shared = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT)
+        self._stream = open(self.path, "ab")
+        if self.interval:
+            self._rollover = (time() // self.interval + 1) * self.interval
+
+    def _size(self) -> int:
+        """The size of the file at the path, which is the file that will be written to."""
+        try:
+            return os.stat(self.path).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _should_rotate(self, incoming: int) -> bool:
+        size = self._size()
+        if size == 0:
+            return False
+        if self.interval and time() >= self._rollover:
+            return True
+        return bool(self.max_bytes) and size + incoming > self.max_bytes
+
+    def _stale(self) -> bool:
+        """True if another instance has already rotated the file this sink has open."""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        opened = os.fstat(self._stream.fileno())
+        return (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev)
+
+    def _segment_name(self) -> str:
+        now = time()
+        stamp = f"{strftime('%Y%m%d-%H%M%S', localtime(now))}-{int(now % 1 * 1_000_000):06d}"
+        name, count = f"{self.path}.{stamp}", 0
+        while any(os.path.exists(name + ext) for ext in ("", ".gz", ".xz")):
+            count += 1
+            name = f"{self.path}.{stamp}-{count}"
+        return name
+
+    def _reopen(self):
+        """Reopen the file at the path if another instance has rotated the open one. Must be
+        called with the lock file held."""
+        if self._stale():
+            self._stream.close()
+            self._open()
+
+    def _rotate(self) -> str:
+        """Rename the active file to a new segment and start a new file. Must be called with
+        the lock file held.
+
+        Returns:
+            str: The path of the closed segment.
+        """
+        self._stream.close()
+        segment = self._segment_name()
+        os.replace(self.path, segment)
+        self._open()
+        return segment
+
+    def write(self, text: str) -> int:
+        """Write a batch of plain text to the active log file, rotating first if needed.
+
+        Args:
+            text (str): The text to write.
+
+        Returns:
+            int: The number of characters written.
+        """
+        if len(text) == 0:
+            return 0
+
+        data = text.encode(self.encoding)
+        segment = None
+        with self._lock:
+            if self._stream is None:
+                self._open()
+            _lock(self._shared)
+            try:
+                self._reopen()
+                if self._should_rotate(len(data)):
+                    segment = self._rotate()
+                self._stream.write(data)
+                self._stream.flush()
+            finally:
+                _unlock(self._shared)
+
+        if segment is not None:
+            _compressor.submit(segment, self.compress, self.path, self.backups)
+        return len(text)
+
+    def flush(self):
+        """Data is flushed on every write. Here for file like compatibility."""
+
+    def rotate(self):
+        """Force the active file to be rotated."""
+        segment = None
+        with self._lock:
+            if self._stream is None:
+                self._open()
+            _lock(self._shared)
+            try:
+                self._reopen()
+                if self._size() > 0:
+                    segment = self._rotate()
+            finally:
+                _unlock(self._shared)
+
+        if segment is not None:
+            _compressor.submit(segment, self.compress, self.path, self.backups)
+
+    def close(self):
+        """Close the active log file and wait for any pending compression."""
+        with self._lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+            if self._shared is not None:
+                os.close(self._shared)
+                self._shared = None
+        _compressor.join()
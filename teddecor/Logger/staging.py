@@ -0,0 +1,111 @@
+"""teddecor.Logger.staging
+
+Per thread staging buffers for logs that are shared by many threads.
+
+Each thread appends its records to its own buffer, so logging never waits on a lock that other
+threads hold. Every record is tagged with a number from a global sequence, and when the log is
+flushed the buffers of all threads are collected and merged back into the order the records
+were logged in.
+
+A thread can take a number and be switched out before it's record is appended. Numbers are
+handed out without gaps, so a missing number means a record is still on it's way, and the
+records after it are held back until the next collect. A record is never written after one that
+was logged later.
+"""
+
+from __future__ import annotations
+
+from itertools import count
+from operator import itemgetter
+from threading import Lock, Thread, current_thread, local
+from typing import Iterable
+
+from .record import Record
+
+__all__ = ["Staging"]
+
+_SEQUENCE = itemgetter(0)
+
+
+class Staging:
+    """Thread local record buffers that are merged in logging order when collected."""
+
+    def __init__(self):
+        self._local = local()
+        self._sequence = count()
+        self._lock = Lock()
+        """Only held while a thread's buffer is registered or while collecting."""
+        self._buffers: list[tuple[Thread, list[tuple[int, Record]]]] = []
+        self._held: list[tuple[int, Record]] = []
+        """Collected records that come after a number whose record wasn't appended yet."""
+        self._next = 0
+        """The number of the next record to collect."""
+
+    def _buffer(self) -> list[tuple[int, Record]]:
+        buffer = []
+        self._local.buffer = buffer
+        with self._lock:
+            self._buffers.append((current_thread(), buffer))
+        return buffer
+
+    def append(self, record: Record):
+        """Stage a record in the current thread's buffer.
+
+        Args:
+            record (Record): The record to stage.
+        """
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._buffer()
+        buffer.append((next(self._sequence), record))
+
+    def extend(self, records: Iterable[Record]):
+        """Stage many records in the current thread's buffer, in order.
+
+        Args:
+            records (Iterable[Record]): The records to stage.
+        """
+        for record in records:
+            self.append(record)
+
+    def collect(self) -> list[Record]:
+        """Take the staged records of every thread.
+
+        Records that are staged while collecting, and records that come after one that is still
+        being staged, are left for the next collect.
+
+        Returns:
+            list[Record]: The records in the order they were logged.
+        """
+        with self._lock:
+            taken = self._held
+            runs = 1 if len(taken) > 0 else 0
+            alive = []
+            for thread, buffer in self._buffers:
+                # Only the owning thread appends, so the taken slice can be removed safely
+                staged = buffer[:]
+                del buffer[: len(staged)]
+                if len(staged) > 0:
+                    taken.extend(staged)
+                    runs += 1
+                if thread.is_alive() or len(buffer) > 0:
+                    alive.append((thread, buffer))
+            self._buffers = alive
+
+            if runs > 1:
+                # Each thread's records are already in order, which sorting takes advantage of
+                taken.sort(key=_SEQUENCE)
+
+            ready = 0
+            for number, _ in taken:
+                if number != self._next:
+                    break
+                self._next += 1
+                ready += 1
+            self._held = taken[ready:]
+
+        return [record for _, record in taken[:ready]]
+
+    def __len__(self) -> int:
+        return len(self._held) + sum(len(buffer) for _, buffer in self._buffers)
@@ -0,0 +1,140 @@
+"""teddecor.Logger.structured
+
+Serializes records as JSON lines. Each record becomes one JSON object on it's own line
+with the keys `level`, `label`, `message`, `time`, `thread`, `pid` and `process` when they are
+recorded, and any context given with the record.
+
+The serializer builds each line from precomputed fragments instead of building a dict and
+calling `json.dumps` for every record.
+"""
+
+from __future__ import annotations
+
+from json import dumps
+from json.encoder import encode_basestring
+from math import isfinite
+from re import compile as re_compile
+from typing import TYPE_CHECKING, Any, Iterable
+
+from teddecor import TED
+
+if TYPE_CHECKING:
+    from .record import Record
+
+__all__ = ["JSONSerializer", "encode_value", "strip_ansi"]
+
+_ANSI = re_compile(r"\x1b\[[0-9;]*m|\x1b\]8;;.*?\x1b\\")
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ansi sequences, colors and hyperlinks, from a string.
+
+    Args:
+        text (str): The string to strip.
+
+    Returns:
+        str: The text without ansi sequences.
+    """
+    if "\x1b" in text:
+        return _ANSI.sub("", text)
+    return text
+
+
+def encode_value(value: Any) -> str:
+    """Encode a context value as JSON. Common types are encoded directly and
+    everything else falls back to `json.dumps`.
+
+    Args:
+        value (Any): The value to encode.
+
+    Returns:
+        str: The JSON encoded value.
+    """
+    if isinstance(value, str):
+        return encode_basestring(strip_ansi(value))
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float) and isfinite(value):
+        return float.__repr__(value)
+    return dumps(value, default=str)
+
+
+class JSONSerializer:
+    """Turns records into JSON lines.
+
+    The opening of each object, `{"level":...,"label":...,"message":`, only depends on the level
+    and label so it is built once and cached. Context keys are also encoded once and reused.
+    """
+
+    def __init__(self):
+        self._prefixes: dict[tuple, str] = {}
+        self._keys: dict[str, str] = {}
+
+    def _prefix(self, record: Record) -> str:
+        key = (record.level, record.label)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            level = "null" if record.level is None else encode_basestring(record.level)
+            label = (
+                "null"
+                if record.label is None
+                else encode_basestring(strip_ansi(TED.strip(record.label)))
+            )
+            prefix = self._prefixes[key] = f'{{"level":{level},"label":{label},"message":'
+        return prefix
+
+    def _key(self, key: str) -> str:
+        fragment = self._keys.get(key)
+        if fragment is None:
+            fragment = self._keys[key] = f",{encode_basestring(str(key))}:"
+        return fragment
+
+    def serialize(self, record: Record) -> str:
+        """Serialize a single record into a JSON line.
+
+        Args:
+            record (Record): The record to serialize.
+
+        Returns:
+            str: The JSON object followed by a newline.
+        """
+        parts = [
+            self._prefix(record),
+            encode_basestring(record.plain[:-1]),
+            ',"time":',
+            float.__repr__(record.time),
+        ]
+        if record.thread is not None:
+            parts.append(',"thread":')
+            parts.append(encode_basestring(record.thread))
+        if record.process is not None:
+            parts.append(',"pid":')
+            parts.append(int.__repr__(record.process[0]))
+            parts.append(',"process":')
+            parts.append(encode_basestring(record.process[1]))
+        if record.prefix is not None:
+            parts.append(record.prefix.structured)
+        if record.context:
+            for key, value in record.context.items():
+                parts.append(self._key(key))
+                parts.append(encode_value(value))
+        parts.append("}\n")
+        return "".join(parts)
+
+    def batch(self, records: Iterable[Record]) -> str:
+        """Serialize many records into a single string of JSON lines.
+
+        Args:
+            records (Iterable[Record]): The records to serialize.
+
+        Returns:
+            str: All of the JSON lines joined together.
+        """
+        serialize = self.serialize
+        return "".join([serialize(record) for record in records])
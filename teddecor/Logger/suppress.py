@@ -0,0 +1,186 @@
+"""teddecor.Logger.suppress
+
+Suppress repeated log events before any formatting is done.
+
+Identical consecutive events are collapsed into a single `Last message repeated N times`
+record. Events are compared without formatting their arguments. Strings, numbers, and other
+simple values are compared by value and any other argument, like a list or a NumPy array, by
+it's identity and length, so an argument is never turned into text or compared element by
+element to find a duplicate. Each key, the label plus the message template, can be rate limited
+with a token bucket. Only the most recently used keys are kept, so templates built with
+f-strings don't grow the suppressor without limit. Everything that is suppressed is counted so
+it can be inspected later.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sized
+from time import monotonic
+from typing import Any, Optional
+
+from .record import Record
+from .staging import Staging
+
+__all__ = ["Suppressor"]
+
+
+class Suppressor:
+    """Collapses duplicate events and rate limits events per key."""
+
+    def __init__(
+        self,
+        duplicates: bool = True,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        keys: int = 1024,
+    ):
+        """
+        Args:
+            duplicates (bool, optional): Collapse identical consecutive events. Defaults to True.
+            rate (Optional[float], optional): Events per second allowed for each key. Defaults to
+            None, which disables rate limiting.
+            burst (Optional[int], optional): Events allowed at once for each key before the rate
+            applies. Defaults to `rate`.
+            keys (int, optional): The most keys whose rate limit and drop count are kept. The
+            least recently used key is forgotten first. Defaults to 1024.
+
+        Raises:
+            ValueError: Raised when keys is less than 1.
+        """
+        if keys < 1:
+            raise ValueError(f"Expected at least 1 key to be kept, was {keys}")
+
+        self.duplicates = duplicates
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(rate or 1, 1))
+        self.keys = keys
+
+        self.repeated = 0
+        """Total number of events collapsed as duplicates."""
+        self.dropped: OrderedDict[tuple[str, Any], int] = OrderedDict()
+        """Number of events dropped by the rate limit for each of the most recently dropped
+        `(label, template)` keys."""
+
+        self._last: Optional[tuple] = None
+        self._repeats = 0
+        self._buckets: OrderedDict[tuple[str, Any], list[float]] = OrderedDict()
+
+    @staticmethod
+    def key(label: str, args: tuple) -> tuple[str, Any]:
+        """The rate limit key of an event. The template is the first argument when it is a string.
+
+        Args:
+            label (str): The label of the event.
+            args (tuple): The arguments given to the log method.
+
+        Returns:
+            tuple[str, Any]: The key of the event.
+        """
+        template = args[0] if len(args) > 0 and isinstance(args[0], str) else None
+        return (label, template)
+
+    def admit(
+        self,
+        buffer: list[Record] | Staging,
+        level: str,
+        label: str,
+        clr: Optional[str],
+        args: tuple,
+        context: Optional[dict[str, Any]],
+        now: float,
+    ) -> bool:
+        """Decide whether an event should be logged. When a run of duplicates ends the
+        `Last message repeated N times` record is added to the buffer.
+
+        Args:
+            buffer (list[Record] | Staging): Where the log adds records.
+            level (str): The level of the event.
+            label (str): The label of the event.
+            clr (Optional[str]): The color of the label.
+            args (tuple): The arguments given to the log method.
+            context (Optional[dict[str, Any]]): The context given with the event.
+            now (float): The time of the event.
+
+        Returns:
+            bool: True if the event should be logged.
+        """
+        if self.duplicates:
+            identity = (level, label, _identity(args), _identity(context))
+            if self._last is not None and self._last[0] == identity:
+                self._repeats += 1
+                self.repeated += 1
+                return False
+
+            self.summarize(buffer, now)
+            self._last = None
+
+        if self.rate is not None:
+            key = self.key(label, args)
+            now = monotonic()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now]
+                _trim(self._buckets, self.keys)
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                self._buckets.move_to_end(key)
+
+            if bucket[0] < 1:
+                self.dropped[key] = self.dropped.pop(key, 0) + 1
+                _trim(self.dropped, self.keys)
+                return False
+            bucket[0] -= 1
+
+        if self.duplicates:
+            # Only shown events start a run, so repeats of a dropped event aren't reported
+            self._last = (identity, level, label, clr)
+        return True
+
+    def summarize(self, buffer: list[Record], now: float):
+        """Add the `Last message repeated N times` record to the buffer if there are repeats.
+
+        Args:
+            buffer (list[Record]): The buffer of the log.
+            now (float): The time to give the record.
+        """
+        if self._repeats > 0:
+            _, level, label, clr = self._last
+            times = "time" if self._repeats == 1 else "times"
+            buffer.append(
+                Record(
+                    level,
+                    label,
+                    clr,
+                    f"Last message repeated {self._repeats} {times}\n",
+                    now,
+                )
+            )
+            self._repeats = 0
+
+
+_SIMPLE = (str, int, float, bool, bytes, complex, type(None))
+
+
+def _identity(values: Optional[tuple | dict]) -> Optional[tuple]:
+    """What is compared of arguments or context. Simple values are kept as they are and any
+    other value is replaced by it's type, id, and length, which never formats the value or
+    keeps it alive."""
+    if values is None:
+        return None
+    if isinstance(values, dict):
+        return tuple((key, _argument(value)) for key, value in values.items())
+    return tuple(_argument(value) for value in values)
+
+
+def _argument(value: Any) -> Any:
+    if type(value) in _SIMPLE:
+        return value
+    return (type(value), id(value), len(value) if isinstance(value, Sized) else None)
+
+
+def _trim(keys: OrderedDict, limit: int):
+    """Forget the least recently used keys past the limit."""
+    while len(keys) > limit:
+        keys.popitem(last=False)
@@ -0,0 +1,86 @@
+"""teddecor.Logger.timestamps
+
+Formats record times for the text representations of a log.
+
+Formatting the date and time with `time.strftime` for every record is expensive. The wall clock
+prefix only changes once a second, so it is cached and only reformatted when the second changes.
+Milliseconds are appended to the cached prefix from a precomputed table.
+"""
+
+from __future__ import annotations
+
+from time import localtime, monotonic, strftime, time
+from typing import Callable
+
+__all__ = ["TimestampCache", "CLOCKS"]
+
+CLOCKS: dict[str, Callable[[], float]] = {"wall": time, "monotonic": monotonic}
+"""The clocks that records can be timed with."""
+
+_MILLISECONDS = [f".{ms:03d}" for ms in range(1000)]
+
+
+class TimestampCache:
+    """Turns record times into text, only calling `strftime` when the second changes.
+
+    With the `monotonic` clock the time is shown as seconds since the cache was created, which
+    is useful for measuring durations between records.
+    """
+
+    def __init__(
+        self,
+        fmt: str = "%Y-%m-%d %H:%M:%S",
+        milliseconds: bool = True,
+        clock: str = "wall",
+    ):
+        """
+        Args:
+            fmt (str, optional): The `time.strftime` format of the wall clock prefix.
+            Defaults to "%Y-%m-%d %H:%M:%S".
+            milliseconds (bool, optional): Append milliseconds to the prefix. Defaults to True.
+            clock (str, optional): Either `wall` or `monotonic`. Defaults to "wall".
+
+        Raises:
+            ValueError: Raised when clock isn't `wall` or `monotonic`
+        """
+        if clock not in CLOCKS:
+            raise ValueError(
+                f"clock must be one of {', '.join(CLOCKS)}, was {clock!r}"
+            )
+
+        self.fmt = fmt
+        self.milliseconds = milliseconds
+        self.clock = clock
+        self.now: Callable[[], float] = CLOCKS[clock]
+        """The clock function that record times should be taken with."""
+        self.start = self.now()
+        self.format: Callable[[float], str] = (
+            self._monotonic if clock == "monotonic" else self._wall
+        )
+        """Format a record time taken with `TimestampCache.now`."""
+        self._cached: tuple[int, str] = (-1, "")
+
+    def __call__(self, stamp: float) -> str:
+        """Format a record time.
+
+        Args:
+            stamp (float): The time taken with `TimestampCache.now`.
+
+        Returns:
+            str: The formatted time.
+        """
+        return self.format(stamp)
+
+    def _monotonic(self, stamp: float) -> str:
+        return f"+{stamp - self.start:.6f}"
+
+    def _wall(self, stamp: float) -> str:
+        second = int(stamp)
+        cached_second, prefix = self._cached
+        if second != cached_second:
+            prefix = strftime(self.fmt, localtime(second))
+            self._cached = (second, prefix)
+
+        if self.milliseconds:
+            return prefix + _MILLISECONDS[int((stamp - second) * 1000)]
+        return prefix
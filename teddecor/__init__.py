@@ -7,6 +7,6 @@ underlined text, hyperlinks and much more.
 
 __version__ = "1.2.0"
 from .TED import TED
-from .logger import LL, Log, Logger
+from .Logger import LL, Log, Logger
 from .pprint import p_value, pprint
 from . import decorators
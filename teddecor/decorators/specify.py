@@ -7,29 +7,33 @@ to give more context information to methods and classes.
 """
 
 from typing import Callable
-from teddecor.TED import TED
-from teddecor.logger import Logger
+from weakref import WeakKeyDictionary
+from teddecor.Logger import Logger
+from teddecor.pprint import Style, Theme, active_theme
 
-from .utility import parse_signature
+from .utility import parse_signature, themed_label
 
 __all__ = ["not_implemented", "deprecated"]
 
 
-def parse_qual_name(qual_name: str) -> str:
+def parse_qual_name(qual_name: str, decode: bool = False) -> str:
+    theme = active_theme()
+    style = theme.ansi if decode else theme.markup
     qual_name = qual_name.split(".")
-    if len(qual_name) > 1:
-        return (
-            "*"
-            + ".".join([f"[@F #f5a97f]{TED.encode(val)}[@F]" for val in qual_name[:-1]])
-            + f".[@F #8aadf4]{TED.encode(qual_name[-1])}[@F]*"
-        )
-    else:
-        return f"*[@F #8aadf4]{TED.encode(qual_name[0])}[@F]*"
+    names = [style.wrap("type", style.encode(val)) for val in qual_name[:-1]]
+    names.append(style.wrap("name", style.encode(qual_name[-1])))
+    return style.wrap("symbol", ".".join(names))
 
 
-def parse_bases(cls) -> str:
+def parse_bases(cls, decode: bool = False) -> str:
+    theme = active_theme()
+    style = theme.ansi if decode else theme.markup
     bases = [base.__name__ for base in cls.__bases__ if base.__name__ != "object"]
-    return f"[@F #ee99a0]([@F]{', '.join([f'[@F #f5a97f]{TED.encode(val)}[@F]'] for val in bases)}[@F #ee99a0])[@F]"
+    return (
+        style.wrap("bracket", "(")
+        + ", ".join(style.wrap("type", style.encode(val)) for val in bases)
+        + style.wrap("bracket", ")")
+    )
 
 
 def not_implemented(obj: Callable | type):
@@ -38,10 +42,10 @@ def not_implemented(obj: Callable | type):
     if isinstance(obj, Callable) and not isinstance(obj, type):
 
         def inner(*args, **kwargs):
+            style = active_theme().ansi
             raise NotImplementedError(
-                TED.parse(
-                    f"*[@F #8aadf4]{TED.encode(obj.__name__)}[@F]{parse_signature(obj)} is not yet implemented"
-                )
+                style.wrap("name", style.encode(obj.__name__))
+                + f"{parse_signature(obj, decode=True)} is not yet implemented"
             )
 
         return inner
@@ -53,15 +57,22 @@ def not_implemented(obj: Callable | type):
             in class but raises a not implemented error if the class is used/initialized."""
 
             def __init__(self, *args, **kwargs):
+                style = active_theme().ansi
                 raise NotImplementedError(
-                    TED.parse(
-                        f"*Class [@F #f5a97f]{obj.__name__}[@F] is not yet implemented"
-                    )
+                    f"Class {style.wrap('type', style.encode(obj.__name__))} is not yet implemented"
                 )
 
         return Inner
 
 
+_DEPRECATED_DEF: WeakKeyDictionary[Theme, str] = WeakKeyDictionary()
+_DEPRECATED_CLASS: WeakKeyDictionary[Theme, str] = WeakKeyDictionary()
+
+
+def _deprecated(style: Style, keyword: str) -> str:
+    return style.wrap("deprecated", "Deprecated") + "." + style.wrap("keyword", keyword)
+
+
 def deprecated(obj: Callable | type):
     """Write to stderr that a specific method is deprecated."""
 
@@ -69,9 +80,8 @@ def deprecated(obj: Callable | type):
 
         def inner(*args, **kwargs):
             Logger.custom(
-                TED.parse(f"{parse_qual_name(obj.__qualname__)}{parse_signature(obj)}"),
-                label="Deprecated[@F].[@F #ed8796]def",
-                clr="#eed49f",
+                parse_qual_name(obj.__qualname__, True) + parse_signature(obj, decode=True),
+                label=themed_label(_DEPRECATED_DEF, lambda style: _deprecated(style, "def")),
             )
             Logger.flush()
             return obj(*args, **kwargs)
@@ -85,10 +95,13 @@ def deprecated(obj: Callable | type):
             in class but calls stderr with a deprecation message."""
 
             def __init__(self, *args, **kwargs):
+                style = active_theme().ansi
                 Logger.custom(
-                    TED.parse(f"[@F #f5a97f]*{obj.__name__}*[@F]{parse_bases(obj)}"),
-                    label="Deprecated[@F].[@F #ed8796]class",
-                    clr="#eed49f",
+                    style.wrap("type", style.wrap("symbol", style.encode(obj.__name__)))
+                    + parse_bases(obj, True),
+                    label=themed_label(
+                        _DEPRECATED_CLASS, lambda style: _deprecated(style, "class")
+                    ),
                 )
                 Logger.flush()
                 super().__init__(*args, **kwargs)
@@ -4,27 +4,151 @@ This modules provides decorators that provide utility. This includes
 decorators that time execution, prints debug information, and much more.
 """
 
-from time import monotonic
-from typing import Callable
+from atexit import register
+from collections import Counter
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Optional
 from sys import stdout
+from threading import Lock
 from inspect import signature, _empty
+from weakref import WeakKeyDictionary
 from teddecor.TED import TED
-from teddecor.logger import Log, LL
+from teddecor.Logger import Log, LL, LatencyHistogram
 
-from teddecor.pprint import p_value
+from teddecor.pprint import Style, Theme, p_value, active_theme
 
-__all__ = ["Time", "debug", "parse_signature"]
+__all__ = ["Time", "Timing", "BATCH", "TIMINGS", "time_summary", "debug", "parse_signature"]
 
 logger = Log(level=LL.DEBUG)
 
 
-def Time(func: Callable):
-    """Time a given function execution and write the results to stdout."""
+def themed_label(labels: WeakKeyDictionary[Theme, str], build: Callable[[Style], str]) -> str:
+    """A log label styled with the active theme. The label is built once per theme and kept in
+    `labels`. It is escaped, so the log shows the rendered sequences as they are.
+
+    Args:
+        labels (WeakKeyDictionary[Theme, str]): The label of each theme it was built for.
+        build (Callable[[Style], str]): Builds the label with the ansi style of a theme.
+
+    Returns:
+        str: The label as TED markup.
+    """
+    theme = active_theme()
+    label = labels.get(theme)
+    if label is None:
+        label = labels[theme] = TED.encode(build(theme.ansi))
+    return label
+
+
+class Timing(LatencyHistogram):
+    """The call count, total, min, max, and a histogram of the durations of a function, in
+    nanoseconds. Percentiles come from the log linear buckets and are within about 6%.
+
+    Calls only append their duration to `samples`, which is folded into the counters once
+    `BATCH` durations are waiting and before a summary, so call `fold()` before reading the
+    counters directly.
+    """
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+        """The qualified name of the function."""
+        self.min = 0
+        self.samples: list[int] = []
+        """Durations that haven't been folded into the counters yet."""
+        self._lock = Lock()
+
+    def record(self, value: int):
+        """Record the duration of a call.
+
+        Args:
+            value (int): The duration in nanoseconds.
+        """
+        self.samples.append(value)
+        self.fold()
+
+    def fold(self):
+        """Fold the waiting durations into the counters. Safe to call from any thread."""
+        with self._lock:
+            # Calls on other threads only append, so the durations after the copy are kept
+            samples = self.samples[:]
+            if len(samples) == 0:
+                return
+            del self.samples[: len(samples)]
+
+            low, high = min(samples), max(samples)
+            if low < self.min or self.count == 0:
+                self.min = low
+            if high > self.max:
+                self.max = high
+            self.count += len(samples)
+            self.total += sum(samples)
+            for index, count in Counter(map(self.index, samples)).items():
+                self.counts[index] = self.counts.get(index, 0) + count
+
+
+BATCH = 4096
+"""The number of durations a `Timing` keeps before folding them into it's counters."""
+TIMINGS: dict[str, Timing] = {}
+"""The timings of every function decorated with `Time(aggregate=True)` by qualified name.
+Closures and functions defined in other functions share the timing of their name, so making
+many of them adds a single row to the summary and keeps none of them alive."""
+_EXIT: list[bool] = []
+
+
+def Time(func: Optional[Callable] = None, aggregate: bool = False, at_exit: bool = True):
+    """Time a given function execution and write the results to stdout.
+
+    With `aggregate` nothing is written per call. Each call is timed with `perf_counter_ns` and
+    recorded in the function's `Timing`, see `TIMINGS`, and a summary of every timed function
+    is shown by `time_summary()`.
+
+    Example:
+        ```python
+        @Time(aggregate=True)
+        def handle(request): ...
+        ```
+
+    Args:
+        func (Optional[Callable], optional): The function when used as `@Time`.
+        aggregate (bool, optional): Keep statistics in memory instead of writing every call.
+        Defaults to False.
+        at_exit (bool, optional): Print the summary when the interpreter exits. Only used with
+        `aggregate`. Defaults to True.
+    """
+    if func is None:
+        return lambda func: Time(func, aggregate, at_exit)
+
+    if aggregate:
+        name = f"{func.__module__}.{func.__qualname__}"
+        timing = TIMINGS.get(name)
+        if timing is None:
+            timing = TIMINGS.setdefault(name, Timing(name))
+        if at_exit and len(_EXIT) == 0:
+            _EXIT.append(True)
+            register(_summary_at_exit)
+
+        samples = timing.samples
+
+        @wraps(func)
+        def time_aggregate(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                samples.append(perf_counter_ns() - start)
+                if len(samples) >= BATCH:
+                    timing.fold()
+
+        time_aggregate.timing = timing
+        return time_aggregate
+
     # Method: def {signature(func)}
     def time_inner(*args, **kwargs):
-        start = monotonic()
+        start = perf_counter_ns()
         result = func(*args, **kwargs)
-        final = monotonic() - start
+        final = (perf_counter_ns() - start) / 1e9
         stdout.write(
             f"""
 Time: {final}s
@@ -37,28 +161,106 @@ Method: {func.__name__}
     return time_inner
 
 
-def parse_signature(obj: Callable) -> str:
-    """Parse and format the signature of a function."""
+def time_summary(decode: bool = True) -> str:
+    """A table of the calls, total, min, mean, p50, p90, p99, and max duration of every function
+    timed with `Time(aggregate=True)`, slowest total first. Styled with the active theme.
+
+    Args:
+        decode (bool, optional): Whether to render to ansi sequences instead of TED markup.
+        Defaults to True.
+
+    Returns:
+        str: The summary table.
+    """
+    theme = active_theme()
+    style = theme.ansi if decode else theme.markup
+    timings = list(TIMINGS.values())
+    for timing in timings:
+        timing.fold()
+
+    header = ["function", "calls", "total", "min", "mean", "p50", "p90", "p99", "max"]
+    rows = [
+        [
+            timing.name,
+            f"{timing.count:,}",
+            _duration(timing.total),
+            _duration(timing.min),
+            _duration(timing.total // timing.count),
+            _duration(timing.percentile(50)),
+            _duration(timing.percentile(90)),
+            _duration(timing.percentile(99)),
+            _duration(timing.max),
+        ]
+        for timing in sorted(timings, key=lambda timing: -timing.total)
+        if timing.count > 0
+    ]
+    widths = [max(len(row[column]) for row in [header, *rows]) for column in range(len(header))]
+
+    lines = [
+        "  ".join(
+            style.symbol(text.ljust(width) if column == 0 else text.rjust(width))
+            for column, (text, width) in enumerate(zip(header, widths))
+        )
+    ]
+    for row in rows:
+        lines.append(
+            "  ".join(
+                style.wrap("name", style.encode(text.ljust(width)))
+                if column == 0
+                else style.wrap("number", text.rjust(width))
+                for column, (text, width) in enumerate(zip(row, widths))
+            )
+        )
+    return "\n".join(lines)
+
+
+def _duration(nanoseconds: int) -> str:
+    if nanoseconds < 1_000:
+        return f"{nanoseconds} ns"
+    if nanoseconds < 1_000_000:
+        return f"{nanoseconds / 1e3:.1f} µs"
+    if nanoseconds < 1_000_000_000:
+        return f"{nanoseconds / 1e6:.2f} ms"
+    return f"{nanoseconds / 1e9:.3f} s"
+
+
+def _summary_at_exit():
+    if any(timing.count > 0 or len(timing.samples) > 0 for timing in list(TIMINGS.values())):
+        stdout.write(time_summary() + "\n")
+        stdout.flush()
+
+
+def parse_signature(obj: Callable, decode: bool = False) -> str:
+    """Parse and format the signature of a function with the active theme.
+
+    Args:
+        obj (Callable): The function.
+        decode (bool, optional): Whether to return ansi sequences instead of TED markup.
+        Defaults to False.
+
+    Returns:
+        str: The styled signature.
+    """
+    theme = active_theme()
+    style = theme.ansi if decode else theme.markup
 
     values = []
     for key, value in signature(obj).parameters.items():
         # value = Parameter
         if str(value.kind) != "POSITIONAL_OR_KEYWORD":
-            t = (
-                "[@F #91d7e3]\\*[@F]"
-                if str(value.kind) == "VAR_POSITIONAL"
-                else "[@F #91d7e3]\\*\\*[@F]"
+            t = style.wrap(
+                "variadic", style.encode("*" if str(value.kind) == "VAR_POSITIONAL" else "**")
             )
         else:
             t = ""
         a = (
-            f": [@F #f5a97f]{value.annotation.__name__}[@F]"
+            ": " + style.wrap("type", style.encode(value.annotation.__name__))
             if value.default is not _empty
             else ""
         )
-        n = f"[@F #f5bde6]{TED.encode(value.name)}[@F]"
+        n = style.wrap("parameter", style.encode(value.name))
         d = (
-            f" [@F #7dc4e4]=[@F] {p_value(value.default, decode=False)}"
+            f" {style.wrap('operator', '=')} {p_value(value.default, style=style)}"
             if value.default is not _empty
             else ""
         )
@@ -74,9 +276,9 @@ def parse_signature(obj: Callable) -> str:
         for _type in finditer(r"(\s?\|\s+)?([a-zA-Z]+)", ra):
 
             if _type in ["None", "NoneType"]:
-                rvalues.append(p_value(None, decode=False))
+                rvalues.append(p_value(None, style=style))
             else:
-                rvalues.append(f"[@F #f5a97f]{TED.encode(_type.group(2))}[@F]")
+                rvalues.append(style.wrap("type", style.encode(_type.group(2))))
         return_anno = " | ".join(rvalues)
     else:
         from re import match, split
@@ -87,58 +289,98 @@ def parse_signature(obj: Callable) -> str:
 
             for _type in [val for val in split(r"(, )(?![a-zA-Z, _.]+\])", types) if val != ", "]:
                 if _type in ["None", "NoneType"]:
-                    rtypes.append(p_value(None, decode=False))
+                    rtypes.append(p_value(None, style=style))
                 elif "[" in _type:
                     rtypes.append(parse_types(_type))
                 else:
-                    rtypes.append(
-                        f"[@F #f5a97f]{TED.encode(_type.split('.')[-1])}[@F]"
-                    )
+                    rtypes.append(style.wrap("type", style.encode(_type.split(".")[-1])))
 
-            return f"[@F #f5a97f]{TED.encode(name)}[@F]\\[{', '.join(rtypes)}\\]"
+            return (
+                style.wrap("type", style.encode(name))
+                + style.encode("[")
+                + ", ".join(rtypes)
+                + style.encode("]")
+            )
 
         return_anno = parse_types(ra)
 
     # Construct colored signature
-    return f"[@F #ee99a0]([@F]{', '.join(values)}[@F #ee99a0])[@F] -> {return_anno}"
+    return (
+        style.wrap("bracket", "(")
+        + ", ".join(values)
+        + style.wrap("bracket", ")")
+        + f" -> {return_anno}"
+    )
 
 
-def debug(depth: int = 1):
-    """Debug the taken args and kwargs along with dispaying the results"""
+def debug(
+    depth: int = 1,
+    max_items: Optional[int] = None,
+    max_string: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
+):
+    """Debug the taken args and kwargs along with dispaying the results
+
+    Args:
+        depth (int, optional): Amount of nesting shown for each value. Defaults to 1.
+        max_items (Optional[int], optional): Show at most this many items of each container.
+        Defaults to None.
+        max_string (Optional[int], optional): Show at most this many characters of each string.
+        Defaults to None.
+        max_total_chars (Optional[int], optional): Stop formatting a value once roughly this many
+        characters have been produced. Defaults to None.
+    """
+    limits = {
+        "max_items": max_items,
+        "max_string": max_string,
+        "max_total_chars": max_total_chars,
+    }
 
     def decorator(obj: Callable | type):
+        calls: WeakKeyDictionary[Theme, str] = WeakKeyDictionary()
+        returns: WeakKeyDictionary[Theme, str] = WeakKeyDictionary()
+
         def debug_wrapper(*args, **kwargs):
-            definition = "[@F #ed8796]def"
-            name = f"[@F #8aadf4]{TED.encode(obj.__name__)}[@F]"
-            sig = f"{parse_signature(obj)}"
+            style = active_theme().ansi
+            definition = style.wrap("keyword", "def")
+            name = style.wrap("name", style.encode(obj.__name__))
+            sig = parse_signature(obj, decode=True)
 
             logger.custom(
-                label=f"{TED.encode(obj.__qualname__)} [@F green]🡆",
-                clr="yellow",
+                label=themed_label(
+                    calls,
+                    lambda style: style.wrap("debug", obj.__qualname__)
+                    + " "
+                    + style.wrap("call", "🡆"),
+                ),
             )
 
-            logger.message("\n" + TED.parse(f"  {definition} {name}{sig}"))
+            logger.message(f"\n  {definition} {name}{sig}")
 
             logger.message(
                 f"""  args: {p_value([
                         arg for arg in args
                         if not (isinstance(arg, Callable)
                         and arg.__name__ != obj.__qualname__.split('.')[0])
-                    ], depth=depth, indent=4)}\n""",
+                    ], depth=depth, indent=4, style=style, **limits)}\n""",
             )
 
             for key, value in kwargs.items():
-                logger.message(f"  {key}={p_value(value, depth=depth, indent=4)}\n")
+                logger.message(
+                    f"  {key}={p_value(value, depth=depth, indent=4, style=style, **limits)}\n"
+                )
 
             result = obj(*args, **kwargs)
             logger.message(
-                TED.parse(
-                    f"  *returns*: {p_value(result, decode=False, depth=depth, indent=4)}\n"
-                ),
+                f"  {style.symbol('returns')}: "
+                f"{p_value(result, depth=depth, indent=4, style=style, **limits)}\n"
             )
             logger.custom(
-                label=f"[@F red]🡄[@F yellow]{TED.encode(obj.__qualname__)}",
-                clr="yellow",
+                label=themed_label(
+                    returns,
+                    lambda style: style.wrap("return", "🡄")
+                    + style.wrap("debug", obj.__qualname__),
+                ),
             )
             logger.flush()
             input()
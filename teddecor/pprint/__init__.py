@@ -0,0 +1,23 @@
+"""teddecor.pprint
+
+Pretty print values with formatting and color.
+"""
+
+from .pretty import (
+    pprint,
+    p_iter,
+    p_value,
+    p_def,
+    p_type,
+    p_dict,
+    p_none,
+    p_num,
+    p_bool,
+    p_str,
+    p_symbol,
+    p_list_tuple,
+)
+from .diff import p_diff
+from .registry import Container, register_pprint
+from . import arrays
+from .styles import ANSI, MARKUP, PLAIN, Style, Theme, active_theme, use_theme
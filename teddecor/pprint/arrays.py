@@ -0,0 +1,260 @@
+"""teddecor.pprint.arrays
+
+Summaries of NumPy arrays, `array.array`, and `memoryview`.
+
+Arrays are shown as a header with their type, shape, and strides, their first and last
+`EDGE_ITEMS` elements, and the min, max, mean, and number of NaNs of numeric arrays. Only the
+shown elements are copied out of the array and they are converted to text together, so the
+cost of the text doesn't depend on the size of the array. The stats are reduced block by block
+so each block is read from memory once while it is still in cache.
+
+NumPy is an optional dependency and isn't imported with this module. The NumPy formatter is
+registered by name so it is only resolved once an `ndarray` is formatted. `array.array` and
+`memoryview` are viewed as NumPy arrays, without a copy, when NumPy can be imported and
+otherwise fall back to slicing and the builtin `min`, `max`, and `sum`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Optional
+
+from .registry import register_pprint
+from .styles import Style
+
+__all__ = ["EDGE_ITEMS", "BLOCK"]
+
+EDGE_ITEMS = 3
+"""The number of elements shown from the start and from the end of an array."""
+BLOCK = 1 << 16
+"""The number of elements reduced at a time when computing the stats of an array."""
+
+_NUMPY: list = []
+_TYPECODES = "bBhHiIlLqQfd"
+"""The `array.array` typecodes that are also NumPy dtype codes."""
+
+
+def _numpy() -> Optional[Any]:
+    """The numpy module, or None when it isn't installed. The import is only tried once."""
+    if len(_NUMPY) == 0:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _NUMPY.append(numpy)
+    return _NUMPY[0]
+
+
+def _header(style: Style, name: str, fields: list[tuple[str, str]]) -> str:
+    return (
+        style.wrap("type", style.encode(name))
+        + style.symbol("(")
+        + ", ".join(style.wrap("name", key) + "=" + value for key, value in fields)
+        + style.symbol(")")
+    )
+
+
+def _elements(
+    style: Style, head: list[str], tail: list[str], total: int, role: str = "number"
+) -> str:
+    """The shown elements in brackets, with the number of elided elements between them."""
+    opened, closed = style.open[role], style.close[role]
+    shown = [opened + style.encode(text) + closed for text in head]
+    if total > len(head) + len(tail):
+        shown.append(style.wrap("ellipsis", f"… {total - len(head) - len(tail):,} more …"))
+    shown.extend(opened + style.encode(text) + closed for text in tail)
+    return style.symbol("[") + ", ".join(shown) + style.symbol("]")
+
+
+def _summary(style: Style, stats: Optional[tuple]) -> str:
+    if stats is None:
+        return ""
+    low, high, mean, nans = stats
+    fields = [("min", str(low)), ("max", str(high)), ("mean", f"{mean:.6g}")]
+    if nans is not None:
+        fields.append(("nan", f"{nans:,}"))
+    return " " + " ".join(
+        style.wrap("name", key) + "=" + style.wrap("number", value) for key, value in fields
+    )
+
+
+def _edges(value: Any) -> tuple[list[str], list[str]]:
+    """The first and last elements of an array in C order as text. Only those elements are
+    copied, even when the array isn't contiguous."""
+    size = value.size
+    if size <= 2 * EDGE_ITEMS:
+        return _text(value.flat[:size]), []
+    return _text(value.flat[:EDGE_ITEMS]), _text(value.flat[size - EDGE_ITEMS : size])
+
+
+def _text(elements: Any) -> list[str]:
+    try:
+        return elements.astype(str).tolist()
+    except (TypeError, ValueError):
+        # Structured and other dtypes that can't be cast to strings
+        return [str(element) for element in elements.tolist()]
+
+
+def _stats(numpy: Any, value: Any) -> Optional[tuple]:
+    """The min, max, mean, and number of NaNs of a numeric array, reduced in a single pass over
+    blocks of `BLOCK` elements. NaNs are left out of the other stats and are only counted for
+    floating point arrays."""
+    if value.size == 0 or value.dtype.kind not in "biuf":
+        return None
+
+    floating = value.dtype.kind == "f"
+    flat = value.reshape(-1) if value.flags.c_contiguous else None
+    low = high = None
+    total, count, nans = 0.0, 0, 0
+    for start in range(0, value.size, BLOCK):
+        stop = min(start + BLOCK, value.size)
+        block = flat[start:stop] if flat is not None else value.flat[start:stop]
+        if floating:
+            missing = numpy.isnan(block)
+            found = int(numpy.count_nonzero(missing))
+            if found > 0:
+                nans += found
+                block = block[~missing]
+                if block.size == 0:
+                    continue
+        smallest, largest = block.min(), block.max()
+        low = smallest if low is None or smallest < low else low
+        high = largest if high is None or largest > high else high
+        total += float(numpy.add.reduce(block, dtype=numpy.float64))
+        count += block.size
+
+    if count == 0:
+        return (float("nan"), float("nan"), float("nan"), nans)
+    return (low, high, total / count, nans if floating else None)
+
+
+def format_ndarray(value: Any, style: Style, name: Optional[str] = None) -> str:
+    """Summarize a NumPy array.
+
+    Args:
+        value (numpy.ndarray): The array.
+        style (Style): The style to format with.
+        name (Optional[str], optional): The type name to show. Defaults to the array's type.
+
+    Returns:
+        str: The styled summary.
+    """
+    import numpy
+
+    header = _header(
+        style,
+        name or type(value).__name__,
+        [
+            ("dtype", style.wrap("type", style.encode(str(value.dtype)))),
+            ("shape", style.encode(str(value.shape))),
+            ("strides", style.encode(str(value.strides))),
+        ],
+    )
+    head, tail = _edges(value)
+    return (
+        header
+        + " "
+        + _elements(
+            style, head, tail, value.size, "number" if value.dtype.kind in "biufc" else "string"
+        )
+        + _summary(style, _stats(numpy, value))
+    )
+
+
+def format_array(value: array, style: Style) -> str:
+    """Summarize an `array.array`.
+
+    Args:
+        value (array.array): The array.
+        style (Style): The style to format with.
+
+    Returns:
+        str: The styled summary.
+    """
+    numpy = _numpy()
+    if numpy is not None and len(value) > 0 and value.typecode in _TYPECODES:
+        return format_ndarray(numpy.frombuffer(value, dtype=value.typecode), style, "array")
+
+    header = _header(
+        style,
+        "array",
+        [
+            ("typecode", style.string(value.typecode)),
+            ("length", style.encode(str(len(value)))),
+            ("itemsize", style.encode(str(value.itemsize))),
+        ],
+    )
+    size = len(value)
+    if size <= 2 * EDGE_ITEMS:
+        head, tail = value, []
+    else:
+        head, tail = value[:EDGE_ITEMS], value[size - EDGE_ITEMS :]
+    text = value.typecode in "uw"
+    stats = None
+    if size > 0 and not text:
+        stats = (min(value), max(value), sum(value) / size, None)
+    return (
+        header
+        + " "
+        + _elements(
+            style,
+            [str(item) for item in head],
+            [str(item) for item in tail],
+            size,
+            "string" if text else "number",
+        )
+        + _summary(style, stats)
+    )
+
+
+def format_memoryview(value: memoryview, style: Style) -> str:
+    """Summarize a `memoryview`.
+
+    Args:
+        value (memoryview): The view.
+        style (Style): The style to format with.
+
+    Returns:
+        str: The styled summary.
+    """
+    try:
+        value.format
+    except ValueError:
+        # Released views can't be read
+        return _header(style, "memoryview", [("released", style.wrap("bool", "True"))])
+
+    numpy = _numpy()
+    if numpy is not None:
+        try:
+            return format_ndarray(numpy.asarray(value), style, "memoryview")
+        except (TypeError, ValueError):
+            # Formats that numpy doesn't understand are shown with the builtin fallback
+            pass
+
+    header = _header(
+        style,
+        "memoryview",
+        [
+            ("format", style.string(value.format)),
+            ("shape", style.encode(str(value.shape))),
+            ("strides", style.encode(str(value.strides))),
+        ],
+    )
+    if value.ndim != 1:
+        return header
+
+    size = len(value)
+    if size <= 2 * EDGE_ITEMS:
+        head, tail = value.tolist(), []
+    else:
+        head, tail = value[:EDGE_ITEMS].tolist(), value[size - EDGE_ITEMS :].tolist()
+    return (
+        header
+        + " "
+        + _elements(style, [str(item) for item in head], [str(item) for item in tail], size)
+    )
+
+
+register_pprint(array, format_array, leaf=True)
+register_pprint(memoryview, format_memoryview, leaf=True)
+register_pprint("numpy.ndarray", format_ndarray, leaf=True)
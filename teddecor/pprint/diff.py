@@ -0,0 +1,355 @@
+"""teddecor.pprint.diff
+
+A structural diff of two values that shows only the changed paths.
+
+Dicts are compared key by key, lists and tuples item by item after their common start and end
+are skipped, and sets by their differences. Subtrees that are the same object are skipped
+without being looked at, and hashable immutable ones, like tuples and strings, are compared by
+hash first. So when the two values share most of their structure the time taken depends on the
+size of the difference and not on the size of the values.
+
+Containers are compared depth first and the pairs that are open on the current path are kept,
+so a pair that is reached again inside itself, in self referential values, is shown as `<cycle>`
+instead of being compared forever.
+
+Changed items are shown with a red `-` and a green `+` and only `context` unchanged items are
+shown around them. The values themselves are formatted with the pprint formatters.
+"""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+from typing import Any, Optional
+
+from .engine import render
+from .styles import Style, active_theme
+
+__all__ = ["p_diff"]
+
+_ATOMS = (str, bytes, int, float, complex, bool, type(None))
+_SEQUENCES = {list: "[]", tuple: "()"}
+_SETS = {set: "{}", frozenset: "{}"}
+_CYCLE: Any = object()
+"""Stands in for a pair of containers that is already being compared further up the path."""
+
+
+class _Node:
+    """A pair of containers of the same type that differ.
+
+    `entries` holds, in order, `("=", run)` for a run of unchanged `(key, value)` pairs,
+    `("-", key, value)` and `("+", key, value)` for removed and added items, and
+    `("~", key, node)` for items that are containers which differ themselves.
+    """
+
+    __slots__ = ("a", "b", "brackets", "entries", "changed")
+
+    def __init__(self, a: Any, b: Any, brackets: str):
+        self.a = a
+        self.b = b
+        self.brackets = brackets
+        self.entries: list[tuple] = []
+        self.changed = False
+
+
+def p_diff(
+    a: Any,
+    b: Any,
+    context: int = 2,
+    depth: int = 1,
+    decode: bool = True,
+    max_items: Optional[int] = None,
+) -> str:
+    """Show the differences between two values.
+
+    Args:
+        a (Any): The old value.
+        b (Any): The new value.
+        context (int, optional): The number of unchanged items shown before and after each
+        change. Defaults to 2.
+        depth (int, optional): Amount of nesting shown for removed, added, and unchanged
+        values. Defaults to 1.
+        decode (bool, optional): Whether to render to ansi sequences instead of TED markup.
+        Defaults to True.
+        max_items (Optional[int], optional): Show at most this many items of each removed or
+        added container. Defaults to None.
+
+    Returns:
+        str: The changed paths, or an empty string when the values are the same.
+    """
+    hashes: dict[int, Optional[int]] = {}
+    if _same(a, b, hashes):
+        return ""
+
+    theme = active_theme()
+    style = theme.ansi if decode else theme.markup
+    root = _node(a, b)
+    if root is None:
+        lines = [
+            _line(style, "-", 0, None, a, depth, max_items),
+            _line(style, "+", 0, None, b, depth, max_items),
+        ]
+        return "\n".join(lines)
+
+    _compare(root, hashes)
+    if not root.changed:
+        return ""
+    return "\n".join(_lines(root, style, context, depth, max_items))
+
+
+def _same(a: Any, b: Any, hashes: dict[int, Optional[int]]) -> Optional[bool]:
+    """Whether two values are the same when that can be told without walking them, otherwise
+    None. Hashes of immutable containers are cached by id for the length of the diff."""
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, _ATOMS):
+        return a == b
+    if type(a) is tuple or type(a) is frozenset:
+        first, second = _hash(a, hashes), _hash(b, hashes)
+        if first is not None and second is not None:
+            return first == second and a == b
+    return None
+
+
+def _hash(value: Any, hashes: dict[int, Optional[int]]) -> Optional[int]:
+    key = id(value)
+    if key not in hashes:
+        try:
+            hashes[key] = hash(value)
+        except TypeError:
+            # Tuples of mutable values
+            hashes[key] = None
+    return hashes[key]
+
+
+def _node(a: Any, b: Any) -> Optional[_Node]:
+    """A node for two values that are compared item by item, or None when they are compared
+    as a whole."""
+    if type(a) is not type(b):
+        return None
+    if isinstance(a, dict):
+        return _Node(a, b, "{}")
+    brackets = _SEQUENCES.get(type(a)) or _SETS.get(type(a))
+    return _Node(a, b, brackets) if brackets is not None else None
+
+
+def _compare(root: _Node, hashes: dict[int, Optional[int]]):
+    """Fill in the entries of every node below the root. Nodes are compared depth first from an
+    explicit stack and then marked as changed from the bottom up."""
+    nodes: list[_Node] = []
+    path: set[tuple[int, int]] = set()
+    """The ids of the pairs of containers from the root to the current node."""
+    stack: list = [root]
+    while len(stack) > 0:
+        node = stack.pop()
+        if type(node) is tuple:
+            # Every child of the node has been compared
+            path.discard(node)
+            continue
+
+        pair = (id(node.a), id(node.b))
+        path.add(pair)
+        nodes.append(node)
+        stack.append(pair)
+        children: list[_Node] = []
+        if isinstance(node.a, dict):
+            _dict(node, hashes, children, path)
+        elif type(node.a) in _SEQUENCES:
+            _sequence(node, hashes, children, path)
+        else:
+            removed, added = node.a - node.b, node.b - node.a
+            if len(node.a) > len(removed):
+                node.entries.append(("=", [(None, item) for item in node.a if item not in removed]))
+            node.entries.extend(("-", None, item) for item in removed)
+            node.entries.extend(("+", None, item) for item in added)
+        stack.extend(reversed(children))
+
+    # Children always come after their parent in the list
+    for node in reversed(nodes):
+        for position, entry in enumerate(node.entries):
+            if entry[0] == "~":
+                if entry[2].changed:
+                    node.changed = True
+                else:
+                    node.entries[position] = ("=", [(entry[1], entry[2].a)])
+            elif entry[0] != "=":
+                node.changed = True
+        if node.changed:
+            node.entries = _merge(node.entries)
+
+
+def _pair(
+    key: Any, a: Any, b: Any, node: _Node, hashes: dict, nodes: list[_Node], path: set
+):
+    """Add the comparison of two items to a node."""
+    same = _same(a, b, hashes)
+    if same:
+        node.entries.append(("=", [(key, a)]))
+        return
+
+    child = _node(a, b)
+    if child is not None and (id(a), id(b)) in path:
+        node.entries.append(("=", [(key, _CYCLE)]))
+    elif child is not None:
+        node.entries.append(("~", key, child))
+        nodes.append(child)
+    elif same is None and a == b:
+        node.entries.append(("=", [(key, a)]))
+    else:
+        node.entries.append(("-", key, a))
+        node.entries.append(("+", key, b))
+
+
+def _dict(node: _Node, hashes: dict, nodes: list[_Node], path: set):
+    a, b = node.a, node.b
+    for key, value in a.items():
+        if key in b:
+            _pair(key, value, b[key], node, hashes, nodes, path)
+        else:
+            node.entries.append(("-", key, value))
+    node.entries.extend(("+", key, value) for key, value in b.items() if key not in a)
+
+
+def _sequence(node: _Node, hashes: dict, nodes: list[_Node], path: set):
+    """Compare two sequences. The common start and end are skipped first, so only the middle,
+    which holds the changes, is matched with `difflib`."""
+    a, b = node.a, node.b
+    start, end = 0, min(len(a), len(b))
+    while start < end and _same(a[start], b[start], hashes):
+        start += 1
+    stop = 0
+    while stop < end - start and _same(a[-1 - stop], b[-1 - stop], hashes):
+        stop += 1
+
+    if start > 0:
+        node.entries.append(("=", [(None, item) for item in a[:start]]))
+
+    middle = a[start : len(a) - stop], b[start : len(b) - stop]
+    matcher = SequenceMatcher(
+        None,
+        [_match(item, hashes) for item in middle[0]],
+        [_match(item, hashes) for item in middle[1]],
+        autojunk=False,
+    )
+    for tag, first, last, second, end in matcher.get_opcodes():
+        if tag == "equal":
+            node.entries.append(("=", [(None, item) for item in middle[0][first:last]]))
+            continue
+        paired = min(last - first, end - second) if tag == "replace" else 0
+        for offset in range(paired):
+            _pair(
+                None,
+                middle[0][first + offset],
+                middle[1][second + offset],
+                node,
+                hashes,
+                nodes,
+                path,
+            )
+        node.entries.extend(("-", None, item) for item in middle[0][first + paired : last])
+        node.entries.extend(("+", None, item) for item in middle[1][second + paired : end])
+
+    if stop > 0:
+        node.entries.append(("=", [(None, item) for item in a[len(a) - stop :]]))
+
+
+def _match(value: Any, hashes: dict) -> Any:
+    """What an item is matched by. Unhashable items are only matched with themselves."""
+    if isinstance(value, _ATOMS):
+        return (type(value), value)
+    hashed = _hash(value, hashes) if type(value) is tuple or type(value) is frozenset else None
+    return (type(value), hashed) if hashed is not None else (type(value), id(value))
+
+
+def _merge(entries: list[tuple]) -> list[tuple]:
+    """Join runs of unchanged items that are next to each other."""
+    merged: list[tuple] = []
+    for entry in entries:
+        if entry[0] != "=":
+            merged.append(entry)
+        elif len(merged) > 0 and merged[-1][0] == "=":
+            merged[-1][1].extend(entry[1])
+        else:
+            merged.append(("=", list(entry[1])))
+    return merged
+
+
+def _key(style: Style, key: Any) -> str:
+    if key is None:
+        return ""
+    if isinstance(key, str):
+        return style.string(key) + ": "
+    return style.wrap("string", style.encode(repr(key))) + ": "
+
+
+def _text(style: Style, key: Any, value: Any, level: int, depth: int, limit: Optional[int]) -> str:
+    """A key and value formatted with the pprint formatters."""
+    if value is _CYCLE:
+        return _key(style, key) + style.wrap("ellipsis", "<cycle>")
+    return _key(style, key) + render(value, style, depth, level * 2, max_items=limit)
+
+
+def _line(
+    style: Style,
+    mark: str,
+    level: int,
+    key: Any,
+    value: Any,
+    depth: int,
+    limit: Optional[int],
+) -> str:
+    """A removed, added, or unchanged item with it's mark at the start of every line."""
+    marker = (style.wrap("removed", "-") if mark == "-" else style.wrap("added", "+")) + " "
+    text = _text(style, key, value, level, depth, limit)
+    return marker + "  " * level + text.replace("\n", "\n" + marker)
+
+
+def _lines(
+    root: _Node, style: Style, context: int, depth: int, limit: Optional[int]
+) -> list[str]:
+    """The lines of the changed nodes, walked with an explicit stack."""
+    lines = ["  " + style.symbol(root.brackets[0])]
+    stack = [(root, 0, 1)]
+    while len(stack) > 0:
+        node, position, level = stack.pop()
+        entries = node.entries
+        while position < len(entries):
+            entry = entries[position]
+            position += 1
+            if entry[0] == "~":
+                lines.append(
+                    "  " + "  " * level + _key(style, entry[1]) + style.symbol(entry[2].brackets[0])
+                )
+                stack.append((node, position, level))
+                stack.append((entry[2], 0, level + 1))
+                break
+            if entry[0] == "=":
+                lines.extend(
+                    _unchanged(
+                        style, entry[1], level, context, position > 1, position < len(entries)
+                    )
+                )
+            else:
+                lines.append(_line(style, entry[0], level, entry[1], entry[2], depth, limit))
+        else:
+            lines.append("  " + "  " * (level - 1) + style.symbol(node.brackets[1]))
+    return lines
+
+
+def _unchanged(
+    style: Style, run: list[tuple], level: int, context: int, before: bool, after: bool
+) -> list[str]:
+    """The unchanged items around changes, with the ones that are left out counted."""
+    head = run[:context] if before else []
+    tail = run[max(len(head), len(run) - context) :] if after else []
+    lines = [
+        "  " + "  " * level + _text(style, key, value, level, 0, None) for key, value in head
+    ]
+    skipped = len(run) - len(head) - len(tail)
+    if skipped > 0:
+        lines.append("  " + "  " * level + style.wrap("ellipsis", f"… {skipped:,} unchanged …"))
+    lines.extend(
+        "  " + "  " * level + _text(style, key, value, level, 0, None) for key, value in tail
+    )
+    return lines
@@ -0,0 +1,473 @@
+"""teddecor.pprint.engine
+
+Formats values into styled text.
+
+Every value is formatted by the formatter registered for it's type, see
+`teddecor.pprint.registry`. Each element is written straight into a single output list with the
+ready made sequences of a `Style`, so nothing is escaped and parsed again afterwards. The output
+is only TED markup when the `MARKUP` style is used.
+
+Values are walked with an explicit stack instead of recursion, so the work is linear in the
+size of the output and any depth of nesting can be formatted.
+
+With a `width`, containers are buffered while they are open and are written on one line when
+they fit. Fitting is decided in the same walk from the visible width of each item,
+`Style.width`, that is added up as items are formatted, so colored and plain output are laid out
+the same. A container is spilled over multiple lines as soon as it's width goes past the limit,
+so at most a line's worth of items is ever buffered.
+
+Iterators can only be walked once, so their items are only pulled when `iterate` is set and
+they are shown as `<generator>`, or the name of their type, otherwise. Formatting a value, for
+example the arguments of a function, never uses up an iterator that is still needed.
+
+Containers and strings longer than the breadth limits are cut down with `len()` and slicing,
+or `itertools.islice` for iterators, before any of their elements are formatted. Only the head
+and tail are shown with the number of elided elements between them, so showing the shape of a
+huge container costs time in proportion to what is shown.
+
+A container that is already open further up the current path is shown as `<cycle>`. With
+`refs` every container that is reached more than once, at the same depth, is formatted the
+first time with a `#n` label and is shown as `<ref #n>` after that, so a graph of shared
+structures is formatted in time proportional to the number of unique containers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Reversible, Sized
+from itertools import chain, islice
+from typing import Any, Callable, Optional
+
+from .registry import CACHE, FALLBACKS, LEAVES
+from .styles import ANSI, Style
+
+__all__ = ["render", "walk"]
+
+
+def render(
+    value: Any,
+    style: Style = ANSI,
+    depth: int = 1,
+    indent: int = 0,
+    leading: bool = False,
+    handler: Optional[Callable] = None,
+    max_items: Optional[int] = None,
+    max_string: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
+    refs: bool = False,
+    width: Optional[int] = None,
+    iterate: bool = False,
+) -> str:
+    """Format a value into styled text.
+
+    Args:
+        value (Any): The value to format.
+        style (Style, optional): The style to format with. Defaults to `ANSI`.
+        depth (int, optional): Amount of nesting before containers are cut off. Defaults to 1.
+        indent (int, optional): The amount of spaces that nested lines are indented by.
+        Defaults to 0.
+        leading (bool, optional): Indent the first line as well. Defaults to False.
+        handler (Optional[Callable], optional): Called as
+        `handler(value, depth, indent, decode, leading)` for values without a built in or
+        registered format. Defaults to None.
+        max_items (Optional[int], optional): Show at most this many items of each container,
+        half from the start and half from the end. Defaults to None, which shows every item.
+        max_string (Optional[int], optional): Show at most this many characters of each string.
+        Defaults to None.
+        max_total_chars (Optional[int], optional): Stop formatting once roughly this many
+        characters, counting any ansi sequences, have been produced. Containers that are
+        buffered to fit on one line count with their visible width. Open containers are still
+        closed. Defaults to None.
+        refs (bool, optional): Format containers that are reached more than once only the first
+        time and refer back to them with `<ref #n>`. Defaults to False.
+        width (Optional[int], optional): Put containers on one line when they fit within this
+        many columns. Defaults to None, which puts every item on it's own line.
+        iterate (bool, optional): Pull and show the items of iterators, which uses them up.
+        Defaults to False, which shows them as `<generator>` or the name of their type.
+
+    Returns:
+        str: The formatted value.
+    """
+    return "".join(
+        walk(
+            value,
+            style,
+            depth,
+            indent,
+            leading,
+            handler,
+            max_items=max_items,
+            max_string=max_string,
+            max_total_chars=max_total_chars,
+            refs=refs,
+            width=width,
+            iterate=iterate,
+        )
+    )
+
+
+_END = object()
+_new = object.__new__
+
+
+class _Elided:
+    """Stands in for the items of a container that are not shown."""
+
+    __slots__ = ("count",)
+
+    def __init__(self, count: Optional[int]):
+        self.count = count
+
+    def text(self) -> str:
+        return "… more …" if self.count is None else f"… {self.count:,} more …"
+
+
+class _Frame:
+    """A container that is open on the stack of `walk`. Frames are made with `object.__new__`
+    and their fields are set by `walk`, since calling an `__init__` for every container costs
+    more than the fields themselves.
+
+    Attributes:
+        items (Iterator): The items that are left.
+        keys (Optional[str]): The `keys` of the container.
+        depth (int): The depth left for the items.
+        indent (int): The indent of the items.
+        separator (str): Written before the next item, the opening bracket before the first one.
+        close (str): The closing bracket on it's own line.
+        empty (str): The whole container when it has no items.
+        started (bool): Whether an item has been written.
+        ident (int): The id of the container.
+        parts (Optional[list[str]]): The items buffered while the container may fit on one
+        line, or None when it is written over multiple lines. The fields below are only set
+        with a `width`.
+        size (int): The visible width of the buffered items.
+        limit (int): The most width the container can have on one line.
+        lead (str): The key of the container in it's parent.
+        opening (str): The name and opening bracket.
+        closing (str): The closing bracket.
+    """
+
+    __slots__ = (
+        "items",
+        "keys",
+        "depth",
+        "indent",
+        "separator",
+        "close",
+        "empty",
+        "started",
+        "ident",
+        "parts",
+        "size",
+        "limit",
+        "lead",
+        "opening",
+        "closing",
+    )
+
+
+def walk(
+    value: Any,
+    style: Style = ANSI,
+    depth: int = 1,
+    indent: int = 0,
+    leading: bool = False,
+    handler: Optional[Callable] = None,
+    size: Optional[int] = None,
+    max_items: Optional[int] = None,
+    max_string: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
+    refs: bool = False,
+    width: Optional[int] = None,
+    iterate: bool = False,
+) -> Iterator[str]:
+    """Format a value into chunks of styled text. See `render` for the arguments.
+
+    Args:
+        size (Optional[int], optional): Yield a chunk once this many fragments are buffered.
+        Defaults to None, which yields everything as one chunk.
+
+    Yields:
+        str: Chunks of the formatted value.
+    """
+    out = [" " * indent] if leading else []
+    stack: list[_Frame] = []
+    """The open containers."""
+    path: set[int] = set()
+    """The ids of the open containers."""
+    shared = _shared(value, style, depth, max_items) if refs else None
+    labels: dict[tuple[int, int], int] = {}
+    cache = CACHE
+    special = handler is not None or max_string is not None
+    written, counted = 0, 0
+
+    compact = width is not None
+    flat = 0
+    """The index of the first open container that may still fit on one line. Every container
+    from there to the top of the stack buffers it's items in `parts`."""
+    lead, prefix = "", ""
+    """The key of the current value when it's container is buffered, and the key itself."""
+
+    while True:
+        formatter = cache[type(value)]
+        if not special:
+            result = formatter(value, style)
+        elif handler is not None and formatter in FALLBACKS:
+            result = handler(value, depth, indent, not style.markup, False)
+        elif (
+            max_string is not None
+            and isinstance(value, (str, bytes, bytearray))
+            and len(value) > max_string
+        ):
+            result = _clip(value, max_string, style, formatter)
+        else:
+            result = formatter(value, style)
+
+        if type(result) is not str:
+            items, name, brackets, keys = result
+            ident = id(value)
+            result = None
+            if ident in path:
+                result = style.wrap("ellipsis", "<cycle>")
+            elif items is value and not iterate and isinstance(value, Iterator):
+                result = style.wrap("ellipsis", f"<{style.encode(type(value).__name__)}>")
+            elif shared is not None and (ident, depth) in shared:
+                label = labels.get((ident, depth))
+                if label is not None:
+                    result = style.wrap("ellipsis", f"<ref #{label}>")
+                else:
+                    label = labels[(ident, depth)] = len(labels) + 1
+                    name = style.wrap("ellipsis", f"#{label} ") + name
+
+            if result is not None:
+                pass
+            elif depth == 0:
+                result = (
+                    name
+                    + style.symbol(brackets[0])
+                    + style.wrap("ellipsis", "…")
+                    + style.symbol(brackets[1])
+                )
+            else:
+                if max_items is not None:
+                    items = _limit(items, max_items)
+                # Items are pulled one at a time so lazy iterables are never materialized
+                frame = _new(_Frame)
+                frame.items = iter(items)
+                frame.keys = keys
+                frame.depth = depth - 1
+                frame.indent = indent + 2
+                frame.separator = name + style.symbol(brackets[0]) + "\n" + " " * (indent + 2)
+                frame.close = "\n" + " " * indent + style.symbol(brackets[1])
+                frame.empty = name + style.symbol(brackets)
+                frame.started = False
+                frame.ident = ident
+                if compact:
+                    frame.parts = []
+                    frame.size = style.width(name) + 2
+                    frame.limit = width - indent - style.width(prefix) - 1
+                    frame.lead = lead
+                    frame.opening = name + style.symbol(brackets[0])
+                    frame.closing = style.symbol(brackets[1])
+                else:
+                    frame.parts = None
+                stack.append(frame)
+                path.add(ident)
+
+        if result is None:
+            pass
+        elif compact and flat < len(stack):
+            if not _fits(stack[-1], lead + result, style.width(lead + result)):
+                flat = _spill(stack, flat, out)
+        else:
+            out.append(result)
+
+        # Move to the next item of the innermost open container, closing finished ones
+        while len(stack) > 0:
+            frame = stack[-1]
+            item = next(frame.items, _END)
+            if item is _END:
+                stack.pop()
+                path.discard(frame.ident)
+                if not compact or frame.parts is None:
+                    out.append(frame.close if frame.started else frame.empty)
+                    flat = min(flat, len(stack))
+                    continue
+
+                # The container fit on one line
+                if len(frame.parts) > 0:
+                    text = frame.lead + frame.opening + ", ".join(frame.parts) + frame.closing
+                else:
+                    text = frame.lead + frame.empty
+                if len(stack) > 0 and stack[-1].parts is not None:
+                    # The width of the container is carried up instead of measuring it again
+                    if not _fits(stack[-1], text, frame.size + style.width(frame.lead)):
+                        flat = _spill(stack, flat, out)
+                else:
+                    out.append(text)
+                    flat = len(stack)
+                continue
+
+            buffered = compact and frame.parts is not None
+            if not buffered:
+                out.append(frame.separator)
+                if not frame.started:
+                    frame.separator = ",\n" + " " * frame.indent
+                    frame.started = True
+            if type(item) is _Elided:
+                text = style.wrap("ellipsis", item.text())
+                if not buffered:
+                    out.append(text)
+                elif not _fits(frame, text, style.width(text)):
+                    flat = _spill(stack, flat, out)
+                continue
+
+            text = ""
+            if frame.keys is not None:
+                key, item = item
+                if frame.keys == "attr":
+                    text = style.wrap("name", style.encode(key)) + "="
+                elif isinstance(key, str):
+                    text = style.string(key) + ": "
+                else:
+                    text = style.wrap("string", style.encode(repr(key))) + ": "
+            if compact:
+                lead, prefix = (text if buffered else ""), text
+            if not buffered and text:
+                out.append(text)
+            value, depth, indent = item, frame.depth, frame.indent
+            break
+        else:
+            break
+
+        if max_total_chars is not None:
+            written += sum(map(len, out[counted:]))
+            counted = len(out)
+            # Buffered containers count with their width so far, which is only written later
+            buffered = sum([frame.size for frame in stack[flat:]]) if compact else 0
+            if written + buffered >= max_total_chars:
+                if compact and flat < len(stack):
+                    flat = _spill(stack, flat, out, room=True)
+                out.append(style.wrap("ellipsis", "…"))
+                while len(stack) > 0:
+                    frame = stack.pop()
+                    out.append(frame.close if frame.started else frame.empty)
+                break
+
+        if size is not None and len(out) >= size:
+            yield "".join(out)
+            out.clear()
+            counted = 0
+
+    yield "".join(out)
+
+
+def _fits(frame: _Frame, text: str, width: int) -> bool:
+    """Add an item, and it's visible width, to a buffered container and check that the
+    container still fits on one line."""
+    parts = frame.parts
+    parts.append(text)
+    frame.size += width + (2 if len(parts) > 1 else 0)
+    return frame.size <= frame.limit
+
+
+def _spill(stack: list[_Frame], start: int, out: list[str], room: bool = False) -> int:
+    """Lay out the buffered containers from `start` to the top of the stack over multiple lines.
+    A container doesn't fit when any container inside it doesn't, so they are spilled together.
+    With `room` a line is started for the next item of the top container as well.
+
+    Returns:
+        int: The new index of the first buffered container, which is the size of the stack.
+    """
+    for index in range(start, len(stack)):
+        frame = stack[index]
+        pad = " " * frame.indent
+        out.append(frame.lead + frame.opening)
+        separator = "\n"
+        for part in frame.parts:
+            out.append(separator + pad + part)
+            separator = ",\n"
+        if index < len(stack) - 1 or room:
+            # Make room for the open container inside this one
+            out.append(separator + pad)
+        frame.separator = ",\n" + pad
+        frame.started = True
+        frame.parts = None
+    return len(stack)
+
+
+def _limit(items: Any, limit: int) -> Any:
+    """The items of a container cut down to the first and last `limit // 2` items around an
+    `_Elided` marker. Only the items that are shown are ever sliced or pulled."""
+    if not isinstance(items, Sized):
+        return _head(iter(items), limit, None)
+
+    total = len(items)
+    if total <= limit:
+        return items
+    head = (limit + 1) // 2
+    tail = limit - head
+    if isinstance(items, (list, tuple)):
+        return chain(items[:head], (_Elided(total - limit),), items[total - tail :])
+    if isinstance(items, Reversible):
+        last = list(islice(reversed(items), tail))
+        last.reverse()
+        return chain(islice(items, head), (_Elided(total - limit),), last)
+    return _head(iter(items), limit, total)
+
+
+def _shared(
+    value: Any, style: Style, depth: int, max_items: Optional[int]
+) -> set[tuple[int, int]]:
+    """The id and depth of every container that is reached more than once when formatting a
+    value. A container is only walked again when it is reached with more depth left than
+    before, which also stops cycles, and the items of iterators are never pulled."""
+    counts: dict[tuple[int, int], int] = {}
+    walked: dict[int, int] = {}
+    stack = [(value, depth)]
+    while len(stack) > 0:
+        value, depth = stack.pop()
+        formatter = CACHE[type(value)]
+        if formatter in LEAVES:
+            continue
+        result = formatter(value, style)
+        if type(result) is str:
+            continue
+
+        key = (id(value), depth)
+        if key in counts:
+            counts[key] += 1
+            continue
+        counts[key] = 1
+        if depth == 0 or walked.get(key[0], -1) >= depth or isinstance(result.items, Iterator):
+            continue
+        walked[key[0]] = depth
+
+        items = result.items if max_items is None else _limit(result.items, max_items)
+        for item in items:
+            if type(item) is not _Elided:
+                stack.append((item if result.keys is None else item[1], depth - 1))
+
+    return {key for key, count in counts.items() if count > 1}
+
+
+def _head(items: Iterator, limit: int, total: Optional[int]) -> Iterator:
+    """The first `limit` items of an iterator followed by an `_Elided` marker when there are
+    more. Iterators can't be walked from the end so no tail is shown."""
+    yield from islice(items, limit)
+    for _ in items:
+        yield _Elided(None if total is None else total - limit)
+        break
+
+
+def _clip(value: str | bytes | bytearray, limit: int, style: Style, formatter: Callable) -> str:
+    """A styled string cut down to its first and last characters around the elided count."""
+    head = (limit + 1) // 2
+    tail = limit - head
+    marker = f" … {len(value) - limit:,} more …"
+    if tail == 0:
+        return formatter(value[:head], style) + style.wrap("ellipsis", marker)
+    return (
+        formatter(value[:head], style)
+        + style.wrap("ellipsis", marker + " ")
+        + formatter(value[len(value) - tail :], style)
+    )
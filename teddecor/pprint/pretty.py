@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+from .engine import render, walk
+from .styles import PLAIN, Style, active_theme
+
+
+CHUNK = 4096
+"""The number of fragments that are joined into each chunk when streaming."""
+_DECODE: Any = object()
+"""The default `style`, the ansi or markup style of the active theme depending on `decode`."""
+
+
+def _style(decode: bool, style: Optional[Style] = _DECODE) -> Style:
+    if style is _DECODE:
+        theme = active_theme()
+        return theme.ansi if decode else theme.markup
+    return PLAIN if style is None else style
+
+
+def pprint(
+    *values: Any,
+    depth: int = 2,
+    end: str = "\n",
+    seperator: str = " ",
+    handler: Optional[Callable] = None,
+    stream: Optional[TextIO] = None,
+    max_items: Optional[int] = None,
+    max_string: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
+    refs: bool = False,
+    width: Optional[int] = None,
+    style: Optional[Style] = _DECODE,
+    iterate: bool = True,
+):
+    """Pretty print any value with formatting and color.
+
+    The output is written in chunks as it is formatted, so printing a huge value never
+    builds the whole string in memory. Generators and other iterators are printed item by
+    item without being turned into lists, which uses them up.
+
+    Args:
+        stream (Optional[TextIO], optional): Where to write the output. Defaults to stdout.
+        max_items (Optional[int], optional): Show at most this many items of each container,
+        half from the start and half from the end. Defaults to None.
+        max_string (Optional[int], optional): Show at most this many characters of each string.
+        Defaults to None.
+        max_total_chars (Optional[int], optional): Stop formatting each value once roughly this
+        many characters have been produced. Defaults to None.
+        refs (bool, optional): Format containers that are reached more than once only the first
+        time and refer back to them with `<ref #n>`. Defaults to False.
+        width (Optional[int], optional): Put containers on one line when they fit within this
+        many columns. Defaults to None.
+        style (Optional[Style], optional): The style to format with, or None for plain text
+        without any sequences or escaping. Defaults to the active theme.
+        iterate (bool, optional): Pull and print the items of iterators. Defaults to True.
+    """
+    if stream is None:
+        from sys import stdout
+
+        stream = stdout
+
+    for index, value in enumerate(values):
+        if index > 0:
+            stream.write(seperator)
+        for chunk in walk(
+            value,
+            _style(True, style),
+            depth,
+            handler=handler,
+            size=CHUNK,
+            max_items=max_items,
+            max_string=max_string,
+            max_total_chars=max_total_chars,
+            refs=refs,
+            width=width,
+            iterate=iterate,
+        ):
+            stream.write(chunk)
+    stream.write(end)
+
+
+def p_iter(
+    value: Any,
+    depth: int = 1,
+    indent: int = 0,
+    decode: bool = True,
+    leading: bool = False,
+    handler: Optional[Callable] = None,
+    max_items: Optional[int] = None,
+    max_string: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
+    refs: bool = False,
+    width: Optional[int] = None,
+    style: Optional[Style] = _DECODE,
+    iterate: bool = True,
+) -> Iterator[str]:
+    """Format a value in chunks as it is walked. Memory use depends on how deeply the value is
+    nested and not on the size of the output. Takes the same arguments as `p_value`, except that
+    the items of iterators are pulled unless `iterate` is False.
+
+    Yields:
+        str: The next chunk of the formatted value.
+    """
+    return walk(
+        value,
+        _style(decode, style),
+        depth,
+        indent,
+        leading,
+        handler,
+        CHUNK,
+        max_items,
+        max_string,
+        max_total_chars,
+        refs,
+        width,
+        iterate,
+    )
+
+
+def p_value(
+    value: Any,
+    depth: int = 1,
+    indent: int = 0,
+    decode: bool = True,
+    leading: bool = False,
+    handler: Optional[Callable] = None,
+    max_items: Optional[int] = None,
+    max_string: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
+    refs: bool = False,
+    width: Optional[int] = None,
+    style: Optional[Style] = _DECODE,
+    iterate: bool = False,
+) -> str:
+    """Take a given value and return the appropriatly encoded value.
+
+    Values are rendered straight to ansi sequences. TED markup is only produced when
+    `decode` is False. The `max_*` limits cut containers and strings down to their head and
+    tail before anything is formatted and `refs` shows containers that are reached more than
+    once as `<ref #n>`, see `teddecor.pprint.engine.render`. Containers that contain
+    themselves are shown as `<cycle>`. With a `width` containers that fit are put on one line.
+    A `style` overrides `decode` and `style=None` gives plain text with the same layout and no
+    markup or escaping. Iterators are shown as `<generator>`, or the name of their type, so
+    they aren't used up, unless `iterate` is set.
+    """
+    return render(
+        value,
+        _style(decode, style),
+        depth,
+        indent,
+        leading,
+        handler,
+        max_items,
+        max_string,
+        max_total_chars,
+        refs,
+        width,
+        iterate,
+    )
+
+
+def p_def(value: Callable, indent: int = 0, decode: bool = True) -> str:
+    """Construct an ansi encoded colored function name.
+
+    Args:
+        value (Callable): The function to encode.
+        indent (int): The amount of spaces added to the prefix of the value.
+        decode (bool): Whether to decode TED markup string to ansi.
+
+    Returns:
+        `[@F #8aadf4]{value.__name__}[@F]` == `\\x1b[38;2;138;173;244m{value.__name__}\\x1b[39m`
+    """
+    return render(value, _style(decode), indent=indent)
+
+
+def p_type(value: Any, indent: int = 0, decode: bool = True) -> str:
+    """Construct an ansi encoded str of an object. Objects without their own `__str__` are
+    shown as their colored type name.
+
+    Args:
+        value (Any): The object to encode.
+        indent (int): The amount of spaces added to the prefix of the value.
+        decode (bool): Whether to decode TED markup string to ansi.
+
+    Returns:
+        `[@F #f5a97f]{type}[@F]` == `\\x1b[38;2;245;169;127m{type}\\x1b[39m`
+    """
+    return render(value, _style(decode), indent=indent)
+
+
+def p_dict(
+    data: dict,
+    depth: int = 1,
+    indent: int = 0,
+    decode: bool = True,
+    leading: bool = False,
+    width: Optional[int] = None,
+) -> str:
+    """Construct an ansi encoded colored dictionary str.
+
+    Args:
+        data (dict): The dictionary to encode.
+        depth (int): Amount of recursion before cutting out data.
+        indent (int): The amount of spaces added to the prefix of the value. Indent
+        is appied to all lines but to the first line of a multiline string. If there
+        is only one line the indent is applied to the one line.
+        decode (bool): Whether to decode TED markup string to ansi.
+        width (Optional[int]): Put containers on one line when they fit within this many
+        columns. Defaults to None.
+
+    Returns:
+        `*{*...*}*` == `\\x1b[1m{\\x1b[22m...\\x1b[1m}\\x1b[22m`
+    """
+    return render(data, _style(decode), depth, indent, leading, width=width)
+
+
+def p_none(indent: int = 0, decode: bool = True) -> str:
+    """Construct an ansi encoded colored `None` str.
+
+    Args:
+        indent (int): The amount of spaces added to the prefix of the value.
+        decode (bool): Whether to decode TED markup string to ansi.
+
+    Returns:
+        `[@F 147]None` or `\\x1b[38;5;147mNone\\x1b[39m`
+    """
+    return _style(decode).wrap("none", "None")
+
+
+def p_num(num: int | float, indent: int = 0, decode: bool = True) -> str:
+    """Construct an ansi encoded colored int str.
+
+    Args:
+        num (int): The number to encode.
+        indent (int): The amount of spaces added to the prefix of the value.
+        decode (bool): Whether to decode TED markup string to ansi.
+
+    Returns:
+        `[@F yellow]{num}` == `\\x1b[33m{num}\\x1b[39m`
+    """
+    return _style(decode).wrap("number", str(num))
+
+
+def p_bool(value: bool, indent: int = 0, decode: bool = True) -> str:
+    """Construct an ansi encoded colored bool str.
+
+    Args:
+        value (bool): The bool to encode.
+        indent (int): The amount of spaces added to the prefix of the value.
+        decode (bool): Whether to decode TED markup string to ansi.
+
+    Returns:
+        `[@F 147]{value}` == `\\x1b[38;5;147m{value}\\x1b[39m`
+    """
+    return _style(decode).wrap("bool", str(value))
+
+
+def p_str(string: str, indent: int = 0, decode: bool = True) -> str:
+    """Construct an ansi encoded green repr of a string.
+
+    Args:
+        string (str): The string to encode.
+        indent (int): The amount of spaces added to the prefix of the value.
+        decode (bool): Whether to decode TED markup string to ansi.
+
+    Example:
+        `The \\n cat` == `\\x1b[32m'The \\x1b[36m\\n\\x1b[32m cat'\\x1b[39m`
+
+    Returns:
+        `[@F green]{repr(str)}` == `\\x1b[32m{repr(str)}\\x1b[39m`
+    """
+    return _style(decode).string(string)
+
+
+def p_symbol(sym: str, indent: int = 0, decode: bool = True) -> str:
+    """Construct an ansi encoded bold symbol.
+
+    Args:
+        sym (str): The symbol to encode.
+        indent (int): The amount of spaces added to the prefix of the value.
+        decode (bool): Whether to decode TED markup string to ansi.
+
+    Example:
+        `{` == `\\x1b[1m{\\x1b[22m`
+
+    Returns:
+        `*{symbol}*` == `\\x1b[1m{symbol}\\x1b[22m`
+    """
+    return _style(decode).symbol(sym)
+
+
+def p_list_tuple(
+    collection: list | tuple,
+    depth: int = 1,
+    indent: int = 0,
+    decode: bool = True,
+    leading: bool = False,
+    width: Optional[int] = None,
+) -> str:
+    """Construct an ansi encoded colored list or tuple str.
+
+    Args:
+        collection (list | tuple): The list or tuple to encode.
+        depth (int): Amount of recursion before cutting out data.
+        indent (int): The amount of spaces added to the prefix of the value. Indent
+        is appied to all lines but to the first line of a multiline string. If there
+        is only one line the indent is applied to the one line.
+        decode (bool): Whether to decode TED markup string to ansi.
+        width (Optional[int]): Put containers on one line when they fit within this many
+        columns. Defaults to None.
+
+    Returns:
+        `*[*...*]*` == `\\x1b[1m[\\x1b[22m...\\x1b[1m]\\x1b[22m`
+    """
+    return render(collection, _style(decode), depth, indent, leading, width=width)
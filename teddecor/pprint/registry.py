@@ -0,0 +1,259 @@
+"""teddecor.pprint.registry
+
+Chooses how each type of value is formatted.
+
+A formatter is called as `formatter(value, style)` and returns either the styled text of the
+value or a `Container` whose items are formatted in turn. Formatters are looked up by the exact
+type of a value in a cache. A type that isn't cached is resolved once by walking it's MRO for a
+registered formatter, so after the first value of a type the lookup is a single dict access.
+
+Example:
+    ```python
+    from decimal import Decimal
+
+    register_pprint(Decimal, lambda value, style: style.wrap("number", str(value)))
+    ```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MappingView
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from io import IOBase
+from re import compile as re_compile
+from typing import Any, Callable, NamedTuple, Optional
+
+from .styles import Style
+
+__all__ = ["Container", "register_pprint", "formatter_for"]
+
+
+class Container(NamedTuple):
+    """A value whose items are formatted one at a time."""
+
+    items: Any
+    """The items, or `(key, value)` pairs when `keys` is set."""
+    name: str = ""
+    """Styled text shown before the opening bracket."""
+    brackets: str = "[]"
+    """The opening and closing bracket."""
+    keys: Optional[str] = None
+    """`None` for plain items, `"repr"` for pairs whose keys are shown like values, or
+    `"attr"` for pairs whose keys are attribute names."""
+
+
+Formatter = Callable[[Any, Style], "str | Container"]
+
+
+class _Cache(dict):
+    """Resolves the formatter of a type the first time it is looked up."""
+
+    def __missing__(self, cls: type) -> Formatter:
+        formatter = self[cls] = _resolve(cls)
+        return formatter
+
+
+_FORMATTERS: dict[type, Formatter] = {}
+"""Formatters registered for a type and it's subclasses."""
+_NAMED: dict[str, Formatter] = {}
+"""Formatters registered by the qualified name of a type."""
+CACHE: dict[type, Formatter] = _Cache()
+"""The resolved formatter of every type that has been formatted."""
+
+
+def register_pprint(cls: type | str, formatter: Formatter, leaf: bool = False) -> Formatter:
+    """Format values of a type, and of it's subclasses, with a formatter.
+
+    Args:
+        cls (type | str): The type of value. Types of optional dependencies can be given by
+        their qualified name, such as `"numpy.ndarray"`, so they are never imported.
+        formatter (Callable[[Any, Style], str | Container]): Returns the styled text of a value,
+        using the sequences of the given style, or a `Container` of it's items.
+        leaf (bool, optional): The formatter never returns a `Container`, so it isn't called
+        when only the containers of a value are looked for, such as with `refs`.
+        Defaults to False.
+
+    Raises:
+        TypeError: Raised when cls isn't a type or name or formatter isn't callable.
+
+    Returns:
+        Callable[[Any, Style], str | Container]: The formatter.
+    """
+    if not isinstance(cls, (type, str)):
+        raise TypeError(f"Expected a type or qualified name, was {type(cls).__name__}")
+    if not callable(formatter):
+        raise TypeError(f"Expected a callable formatter, was {type(formatter).__name__}")
+
+    if isinstance(cls, str):
+        _NAMED[cls] = formatter
+    else:
+        _FORMATTERS[cls] = formatter
+    if leaf:
+        LEAVES.add(formatter)
+    # Subclasses may have been resolved to the formatter of a base class
+    CACHE.clear()
+    return formatter
+
+
+def formatter_for(cls: type) -> Formatter:
+    """The formatter for values of a type.
+
+    Args:
+        cls (type): The type of value.
+
+    Returns:
+        Callable[[Any, Style], str | Container]: The formatter.
+    """
+    return CACHE[cls]
+
+
+def _resolve(cls: type) -> Formatter:
+    for base in cls.__mro__[:-1]:
+        formatter = _FORMATTERS.get(base)
+        if formatter is None and len(_NAMED) > 0:
+            formatter = _NAMED.get(f"{base.__module__}.{base.__qualname__}")
+        if formatter is not None:
+            # Subclasses of the builtin containers show their type, `OrderedDict{...}`
+            return _SUBCLASSES.get(formatter, formatter) if base is not cls else formatter
+        if issubclass(base, Enum):
+            return _enum
+        if is_dataclass(base):
+            return _dataclass(cls)
+        if issubclass(base, tuple) and "_fields" in base.__dict__:
+            return _namedtuple
+
+    if issubclass(cls, Mapping):
+        return _mapping
+    if issubclass(cls, (Iterator, MappingView)) and not issubclass(cls, IOBase):
+        return _lazy
+    if any("__call__" in base.__dict__ for base in cls.__mro__) and not issubclass(cls, type):
+        return _callable
+    return _object
+
+
+def _type(value: Any, style: Style) -> str:
+    return style.wrap("type", style.encode(type(value).__name__))
+
+
+def _none(value: None, style: Style) -> str:
+    return style.wrap("none", "None")
+
+
+def _string(value: str, style: Style) -> str:
+    return style.string(value)
+
+
+def _bytes(value: bytes | bytearray, style: Style) -> str:
+    return style.wrap("string", style.encode(repr(value)))
+
+
+def _bool(value: bool, style: Style) -> str:
+    return style.open["bool"] + str(value) + style.close["bool"]
+
+
+def _number(value: int | float | complex, style: Style) -> str:
+    return style.open["number"] + str(value) + style.close["number"]
+
+
+def _dict(value: dict, style: Style) -> Container:
+    return Container(value.items(), "", "{}", "repr")
+
+
+def _list(value: list, style: Style) -> Container:
+    return Container(value, "", "[]")
+
+
+def _tuple(value: tuple, style: Style) -> Container:
+    return Container(value, "", "()")
+
+
+def _set(value: set | frozenset, style: Style) -> str | Container:
+    if len(value) == 0:
+        return _type(value, style) + style.symbol("()")
+    return Container(value, "" if type(value) is set else _type(value, style), "{}")
+
+
+def _mapping(value: Mapping, style: Style) -> Container:
+    return Container(value.items(), _type(value, style), "{}", "repr")
+
+
+def _list_subclass(value: list, style: Style) -> Container:
+    return Container(value, _type(value, style), "[]")
+
+
+def _tuple_subclass(value: tuple, style: Style) -> Container:
+    return Container(value, _type(value, style), "()")
+
+
+def _namedtuple(value: tuple, style: Style) -> Container:
+    return Container(list(zip(value._fields, value)), _type(value, style), "()", "attr")
+
+
+def _dataclass(cls: type) -> Formatter:
+    """The formatter of a dataclass. The names of the fields are looked up once per class."""
+    names = tuple(field.name for field in fields(cls) if field.repr)
+
+    def format_dataclass(value: Any, style: Style) -> Container:
+        return Container(
+            [(name, getattr(value, name)) for name in names], _type(value, style), "()", "attr"
+        )
+
+    return format_dataclass
+
+
+def _enum(value: Enum, style: Style) -> str:
+    return (
+        _type(value, style)
+        + style.symbol(".")
+        + style.wrap("name", style.encode(str(value.name)))
+    )
+
+
+def _lazy(value: Any, style: Style) -> Container:
+    """Iterators and dict views have their items pulled one at a time, iterators only when
+    they are walked with `iterate`. Files are iterators too but are left to `_object`."""
+    return Container(value, _type(value, style), "[]")
+
+
+def _callable(value: Callable, style: Style) -> str:
+    name = getattr(value, "__name__", None) or type(value).__name__
+    return style.wrap("name", style.encode(name))
+
+
+_OBJECT = re_compile(r"^<([\w-]+\.)*\w+ object at 0x[0-9a-fA-F]+>$")
+
+
+def _object(value: Any, style: Style) -> str:
+    """Objects without their own `__str__` are shown as their type name."""
+    text = str(value)
+    if _OBJECT.match(text):
+        return _type(value, style)
+    return style.encode(text)
+
+
+FALLBACKS = frozenset((_lazy, _callable, _object))
+"""The formatters of values without a format of their own, which a `handler` replaces."""
+LEAVES: set[Formatter] = {_none, _string, _bytes, _bool, _number, _enum, _callable, _object}
+"""The formatters that never return a `Container`, the built in ones and those registered with
+`leaf`."""
+
+_SUBCLASSES = {_dict: _mapping, _list: _list_subclass, _tuple: _tuple_subclass}
+"""The formatters of subclasses of `dict`, `list`, and `tuple`, which show their type name."""
+
+for _cls, _formatter in (
+    (type(None), _none),
+    (str, _string),
+    (bytes, _bytes),
+    (bytearray, _bytes),
+    (bool, _bool),
+    (int, _number),
+    (float, _number),
+    (complex, _number),
+    (dict, _dict),
+    (list, _list),
+    (tuple, _tuple),
+    (set, _set),
+    (frozenset, _set),
+):
+    _FORMATTERS[_cls] = _formatter
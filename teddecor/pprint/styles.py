@@ -0,0 +1,326 @@
+"""teddecor.pprint.styles
+
+The styles that pretty printed values are rendered with.
+
+A style holds the opening and closing sequence of every kind of element, a string, a number,
+a symbol, and so on. The sequences are rendered from TED markup once, when the style is
+created, so formatting a value only concatenates ready made strings instead of building
+markup and parsing it again. The `PLAIN` style has no sequences at all and doesn't escape
+anything, so plain text costs only the walk over the value.
+
+A `Theme` maps each kind of element to TED markup and compiles it once into the styles used
+for ansi and markup output, reduced to the number of colors a terminal supports. pprint and the
+decorators look up the active theme once per call, so switching themes, or turning color off,
+adds nothing to the cost of each value. The labels that the decorators log are styled with the
+theme as well.
+
+Example:
+    ```python
+    use_theme(Theme({"number": "[@F #eed49f]"}, colors=8))
+    ```
+"""
+
+from __future__ import annotations
+
+from re import Match, Pattern, compile as re_compile, escape as re_escape
+from typing import Callable, Optional
+
+from teddecor.TED import TED
+
+__all__ = ["Style", "Theme", "ANSI", "MARKUP", "PLAIN", "use_theme", "active_theme"]
+
+ROLES = {
+    "string": "[@F green]",
+    "escape": "[@F cyan]",
+    "number": "[@F yellow]",
+    "bool": "[@F 147]",
+    "none": "[@F 147]",
+    "symbol": "*",
+    "type": "[@F #f5a97f]",
+    "name": "[@F #8aadf4]",
+    "ellipsis": "[@F 210]",
+    "added": "[@F green]",
+    "removed": "[@F red]",
+    "keyword": "[@F #ed8796]",
+    "parameter": "[@F #f5bde6]",
+    "operator": "[@F #7dc4e4]",
+    "variadic": "[@F #91d7e3]",
+    "bracket": "[@F #ee99a0]",
+    "deprecated": "[@F #eed49f]",
+    "debug": "[@F yellow]",
+    "call": "[@F green]",
+    "return": "[@F red]",
+}
+"""The TED markup that opens each kind of element."""
+
+_CLOSE = {"symbol": "*"}
+"""The markup that closes a kind of element. Colors are closed with `[@F]`."""
+
+
+class Style:
+    """The opening and closing sequences of each kind of element, ready to be concatenated."""
+
+    def __init__(
+        self,
+        roles: dict[str, str] = ROLES,
+        markup: bool = False,
+        plain: bool = False,
+        colors: int = 24,
+    ):
+        """
+        Args:
+            roles (dict[str, str], optional): The TED markup that opens each kind of element.
+            Defaults to `ROLES`.
+            markup (bool, optional): Keep the TED markup instead of rendering it to ansi
+            sequences. Text is then escaped with `TED.encode`. Defaults to False.
+            plain (bool, optional): Leave out every sequence so the output is plain text.
+            Defaults to False.
+            colors (int, optional): The color depth that ansi sequences are reduced to, 24 for
+            true color, 8 for the 256 xterm colors, or 4 for the 16 basic colors. Defaults to 24.
+        """
+        self.markup = markup
+        """Whether the output is TED markup instead of ansi sequences."""
+        self.encode: Callable[[str], str] = TED.encode if markup else _same
+        """Escape text so it is shown as is."""
+
+        self.open: dict[str, str] = {}
+        self.close: dict[str, str] = {}
+        for role, opening in roles.items():
+            closing = _CLOSE.get(role, "[@F]")
+            if plain:
+                self.open[role], self.close[role] = "", ""
+            elif markup:
+                self.open[role], self.close[role] = opening, closing
+            else:
+                self.open[role], self.close[role] = _sequences(opening, closing, colors)
+
+        self._hidden = _hidden(self.open, self.close) if markup else None if plain else _SGR
+        self._visible = _escaped if markup else ""
+
+        string, escape = self.open["string"], self.open["escape"]
+        self._special = None if plain else _SPECIAL_MARKUP if markup else _SPECIAL
+        self._highlight = lambda match: escape + match.group(0) + string
+        self._symbols: dict[str, str] = {}
+
+    def wrap(self, role: str, text: str) -> str:
+        """Wrap already escaped text in the sequences of a kind of element.
+
+        Args:
+            role (str): The kind of element, such as `number` or `symbol`.
+            text (str): The text to wrap.
+
+        Returns:
+            str: The styled text.
+        """
+        return self.open[role] + text + self.close[role]
+
+    def width(self, text: str) -> int:
+        """The visible width of styled text, which is the width of the same text rendered with
+        the `PLAIN` style. The style's own sequences, and the escapes of TED markup, are left
+        out.
+
+        Args:
+            text (str): The styled text.
+
+        Returns:
+            int: The number of columns the text takes up.
+        """
+        if self._hidden is None:
+            return len(text)
+        return len(self._hidden.sub(self._visible, text))
+
+    def symbol(self, text: str) -> str:
+        """A styled symbol, such as a bracket. Symbols are few so they are cached.
+
+        Args:
+            text (str): The symbol.
+
+        Returns:
+            str: The styled symbol.
+        """
+        styled = self._symbols.get(text)
+        if styled is None:
+            styled = self._symbols[text] = self.wrap("symbol", self.encode(text))
+        return styled
+
+    def string(self, value: str) -> str:
+        """A styled repr of a string with escape sequences, like `\\n`, highlighted.
+
+        Args:
+            value (str): The string.
+
+        Returns:
+            str: The styled repr.
+        """
+        text = self.encode(repr(value))
+        if "\\" in text and self._special is not None:
+            text = self._special.sub(self._highlight, text)
+        return self.open["string"] + text + self.close["string"]
+
+
+_SPECIAL = re_compile(r"\\(?:n|t|r|x1b(?:\[[0-9;]+m)?)")
+_SPECIAL_MARKUP = re_compile(r"\\\\(?:n|t|r|x1b(?:\\\[[0-9;]+m)?)")
+
+
+def _same(text: str) -> str:
+    return text
+
+
+_SGR = re_compile(r"\x1b\[[0-9;]*m")
+"""Any ansi color or style sequence."""
+
+
+def _hidden(opened: dict[str, str], closed: dict[str, str]) -> Pattern:
+    """A pattern that matches every markup sequence a style writes and every escaped character,
+    so the escape can be dropped and a `*` that is escaped isn't taken for a sequence."""
+    sequences = sorted({*opened.values(), *closed.values()} - {""}, key=len, reverse=True)
+    return re_compile("|".join([r"\\(.)", *map(re_escape, sequences)]))
+
+
+def _escaped(match: Match) -> str:
+    return match.group(1) or ""
+
+
+def _sequences(opening: str, closing: str, colors: int = 24) -> tuple[str, str]:
+    """Render the ansi sequences that open and close a kind of element."""
+    rendered = TED.parse(f"{opening}\x00{closing}")
+    opened, closed = rendered.split("\x00")
+    if closed.endswith("\x1b[0m"):
+        closed = closed[: -len("\x1b[0m")]
+    if colors < 24:
+        opened = _COLOR.sub(lambda match: _reduce(match, colors), opened)
+    return opened, closed
+
+
+_COLOR = re_compile(r"([34])8;(?:2;(\d+);(\d+);(\d+)|5;(\d+))")
+_CUBE = (0, 95, 135, 175, 215, 255)
+_BASIC = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+"""The usual xterm values of the 16 basic colors."""
+
+
+def _reduce(match: Match, colors: int) -> str:
+    """The closest color to a true color or xterm color parameter at a lower color depth."""
+    ground, index = match.group(1), match.group(5)
+    if index is not None:
+        if colors == 8:
+            return match.group(0)
+        rgb = _xterm(int(index))
+    else:
+        rgb = tuple(int(match.group(channel)) for channel in (2, 3, 4))
+
+    if colors == 8:
+        return f"{ground}8;5;{_closest_xterm(rgb)}"
+    basic = min(range(16), key=lambda color: _distance(_BASIC[color], rgb))
+    return f"{ground if basic < 8 else int(ground) + 6}{basic % 8}"
+
+
+def _xterm(index: int) -> tuple[int, int, int]:
+    if index < 16:
+        return _BASIC[index]
+    if index >= 232:
+        level = 8 + (index - 232) * 10
+        return (level, level, level)
+    index -= 16
+    return (_CUBE[index // 36], _CUBE[index // 6 % 6], _CUBE[index % 6])
+
+
+def _closest_xterm(rgb: tuple[int, int, int]) -> int:
+    """The closest of the 6x6x6 color cube and the 24 grays of the 256 xterm colors."""
+    cube = [min(range(6), key=lambda level: abs(_CUBE[level] - channel)) for channel in rgb]
+    color = 16 + cube[0] * 36 + cube[1] * 6 + cube[2]
+    gray = min(23, max(0, round((sum(rgb) / 3 - 8) / 10)))
+    if _distance(_xterm(232 + gray), rgb) < _distance(_xterm(color), rgb):
+        return 232 + gray
+    return color
+
+
+def _distance(first: tuple[int, int, int], second: tuple[int, int, int]) -> int:
+    return sum((a - b) ** 2 for a, b in zip(first, second))
+
+
+class Theme:
+    """The markup of each kind of element compiled into styles for a color depth."""
+
+    def __init__(self, roles: Optional[dict[str, str]] = None, colors: int = 24):
+        """
+        Args:
+            roles (Optional[dict[str, str]], optional): The TED markup that opens each kind of
+            element, such as `{"number": "[@F #eed49f]"}`. Kinds that aren't given keep the
+            markup from `ROLES`. Defaults to None.
+            colors (int, optional): The color depth of the terminal, 24 for true color, 8 for
+            the 256 xterm colors, 4 for the 16 basic colors, or 0 for no color at all.
+            Defaults to 24.
+
+        Raises:
+            ValueError: Raised when colors isn't 24, 8, 4, or 0.
+        """
+        if colors not in (24, 8, 4, 0):
+            raise ValueError(f"Expected a color depth of 24, 8, 4, or 0, was {colors}")
+
+        self.roles: dict[str, str] = {**ROLES, **(roles or {})}
+        """The TED markup that opens each kind of element."""
+        self.colors = colors
+        """The color depth the theme is compiled for."""
+        self.ansi = Style(self.roles, plain=colors == 0, colors=colors)
+        """Renders values with ansi sequences."""
+        self.markup = Style(self.roles, markup=True, plain=colors == 0)
+        """Renders values as TED markup."""
+
+
+DEFAULT = Theme()
+"""The theme that is active until another one is used."""
+ANSI = DEFAULT.ansi
+"""Renders values with ansi sequences."""
+MARKUP = DEFAULT.markup
+"""Renders values as TED markup, for callers that parse the result themselves."""
+PLAIN = Style(plain=True)
+"""Renders values as plain text, for log files and snapshots."""
+
+_active = DEFAULT
+
+
+def use_theme(theme: Theme) -> Theme:
+    """Style pretty printed values and the decorators with a theme.
+
+    Args:
+        theme (Theme): The theme to use.
+
+    Raises:
+        TypeError: Raised when theme isn't a `Theme`.
+
+    Returns:
+        Theme: The theme that was active before.
+    """
+    global _active
+
+    if not isinstance(theme, Theme):
+        raise TypeError(f"Expected a Theme, was {type(theme).__name__}")
+
+    previous, _active = _active, theme
+    return previous
+
+
+def active_theme() -> Theme:
+    """The theme that values are currently styled with.
+
+    Returns:
+        Theme: The active theme.
+    """
+    return _active
@@ -0,0 +1,9 @@
+from io import StringIO
+
+from teddecor.Logger import LL, Log, Rep, StreamSink
+
+
+def plain(level: LL = LL.DEBUG) -> tuple[Log, StringIO]:
+    """A log at `level` whose output is written as plain text to the returned `StringIO`."""
+    output = StringIO()
+    return Log(output=StreamSink(output, Rep.PLAIN), level=level), output
@@ -0,0 +1,65 @@
+from asyncio import create_task, run, sleep
+from io import StringIO
+from time import perf_counter, sleep as block
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, AsyncLog, StreamSink
+
+
+class SlowSink(StreamSink):
+    """Sink that blocks on every write like a slow disk or a full pipe."""
+
+    def write(self, text: str) -> int:
+        block(0.05)
+        return super().write(text)
+
+
+async def log_with_lag(records: int) -> tuple[float, str]:
+    output = StringIO()
+    logger = AsyncLog(output=SlowSink(output), level=LL.INFO, max_pending=4)
+    lag, running = 0.0, True
+
+    async def ticker():
+        nonlocal lag
+        while running:
+            start = perf_counter()
+            await sleep(0.001)
+            lag = max(lag, perf_counter() - start - 0.001)
+
+    task = create_task(ticker())
+    for i in range(records):
+        logger.info("Record", i)
+        if i % 100 == 99:
+            await logger.flush()
+    await logger.close()
+
+    running = False
+    await task
+    return lag, output.getvalue()
+
+
+@test
+def loop_lag() -> None:
+    """Logging at a high rate to a blocking sink must not hold up the event loop."""
+    lag, output = run(log_with_lag(2_000))
+    assertThat(output.count("\n"), eq(2_000))
+    assertThat(lag < 0.03, eq(True))
+
+
+@test
+def child_writer() -> None:
+    """Children of an `AsyncLog` flush through the root's writer thread."""
+
+    async def log() -> tuple[AsyncLog, AsyncLog, str]:
+        output = StringIO()
+        logger = AsyncLog(output=StreamSink(output), level=LL.INFO)
+        child = logger.child("db")
+        child.info("Connected")
+        await child.flush()
+        await logger.drain()
+        return logger, child, output.getvalue()
+
+    logger, child, output = run(log())
+    assertThat(isinstance(child, AsyncLog), eq(True))
+    assertThat(child._executor is logger._executor is not None, eq(True))
+    assertThat("db" in output and "Connected" in output, eq(True))
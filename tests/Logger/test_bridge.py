@@ -0,0 +1,162 @@
+import logging
+from io import StringIO
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, Rep, StreamSink, TEDFormatter, TEDHandler
+from teddecor.Logger.bridge import LEVELS
+
+from conftest import plain
+
+
+def bridged(name: str, **handler) -> tuple[logging.Logger, TEDHandler, StringIO]:
+    log, output = plain()
+    logger = logging.getLogger(f"tests.bridge.{name}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    ted = TEDHandler(log, **handler)
+    logger.addHandler(ted)
+    return logger, ted, output
+
+
+@test
+def records() -> None:
+    """Records are added to the log with their level, label, and logger name."""
+    logger, handler, output = bridged("records")
+    logger.info("Retrying %s", "request")
+    logger.warning("Slow")
+    handler.flush()
+
+    assertThat(
+        output.getvalue().splitlines(),
+        eq(
+            [
+                "[Info] tests.bridge.records: Retrying request",
+                "[Warning] tests.bridge.records: Slow",
+            ]
+        ),
+    )
+
+
+@test
+def batching() -> None:
+    """The log is flushed after `capacity` records or right away at `flush_level`."""
+    logger, _, output = bridged("batching", capacity=3)
+    logger.info("1")
+    logger.info("2")
+    assertThat(output.getvalue(), eq(""))
+    logger.info("3")
+    assertThat(len(output.getvalue().splitlines()), eq(3))
+
+    logger.error("Failed")
+    assertThat(output.getvalue().splitlines()[-1], eq("[Error] tests.bridge.batching: Failed"))
+
+
+@test
+def exceptions() -> None:
+    """Tracebacks are added to the message."""
+    logger, handler, output = bridged("exceptions")
+    try:
+        raise ValueError("bad value")
+    except ValueError:
+        logger.exception("Failed")
+    handler.flush()
+
+    lines = output.getvalue().splitlines()
+    assertThat(lines[0], eq("[Error] tests.bridge.exceptions: Failed"))
+    assertThat(lines[-1], eq("ValueError: bad value"))
+
+
+@test
+def level_table() -> None:
+    """Level numbers between the named levels use the closest named level below them."""
+    assertThat(LEVELS[logging.INFO][0], eq(LL.INFO))
+    assertThat(LEVELS[25][:2], eq((LL.INFO, "Info")))
+    assertThat(LEVELS[logging.CRITICAL][:2], eq((LL.ERROR, "Critical")))
+    assertThat(LEVELS[0][0], eq(LL.DEBUG))
+
+
+@test
+def formatter() -> None:
+    """The markup of a format string is parsed once and it's placeholders are kept."""
+    assertThat(
+        TEDFormatter.compile("[@F red]%(levelname)-8s[@F] %(message)s"),
+        eq("\x1b[31m%(levelname)-8s\x1b[39m %(message)s\x1b[0m"),
+    )
+    assertThat(
+        TEDFormatter.compile("*\\[{levelname}\\]* {message}", "{", plain=True),
+        eq("[{levelname}] {message}"),
+    )
+    assertThat(wrap(TEDFormatter, style="#"), raises(ValueError))
+
+
+@test
+def formatted_records() -> None:
+    """With a formatter the formatted text is the whole line."""
+    logger, handler, output = bridged("formatted")
+    handler.setFormatter(TEDFormatter("%(name)s | %(message)s", plain=True))
+    logger.info("Hello")
+    handler.flush()
+
+    assertThat(output.getvalue(), eq("tests.bridge.formatted | Hello\n"))
+
+
+@test
+def filtered_records() -> None:
+    """Handler filters still apply, and a `logging.Formatter`'s text is used as it is."""
+    logger, handler, output = bridged("filtered")
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    handler.addFilter(lambda record: record.levelno >= logging.WARNING)
+    logger.info("Hidden")
+    logger.warning("Shown")
+    handler.flush()
+
+    assertThat(output.getvalue(), eq("WARNING Shown\n"))
+
+
+@test
+def formatted_at_flush() -> None:
+    """Records are formatted when the log is flushed, once for each representation."""
+    log, output = plain()
+    colored = StringIO()
+    log.sink(StreamSink(colored, Rep.ANSI))
+    logger = logging.getLogger("tests.bridge.lazy")
+    logger.handlers.clear()
+    logger.propagate = False
+    handler = TEDHandler(log)
+    handler.setFormatter(TEDFormatter("[@F red]%(levelname)s[@F] %(message)s"))
+    logger.addHandler(handler)
+
+    formatted = []
+    format = TEDFormatter.format
+    TEDFormatter.format = lambda self, record: formatted.append(self) or format(self, record)
+    try:
+        logger.warning("Slow %s", "query")
+        assertThat(formatted, eq([]))
+        handler.flush()
+    finally:
+        TEDFormatter.format = format
+
+    assertThat(output.getvalue(), eq("WARNING Slow query\n"))
+    assertThat(colored.getvalue().startswith("\x1b[31mWARNING\x1b[39m Slow query"), eq(True))
+    assertThat(formatted, eq([handler.formatter.plain, handler.formatter]))
+
+
+@test
+def async_log() -> None:
+    """Flushing into an `AsyncLog` hands the records to it's writer without an event loop."""
+    from asyncio import run
+
+    from teddecor.Logger import AsyncLog
+
+    output = StringIO()
+    log = AsyncLog(output=StreamSink(output, Rep.PLAIN), level=LL.DEBUG)
+    logger = logging.getLogger("tests.bridge.async")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(TEDHandler(log, capacity=1))
+    logger.info("Handled")
+    run(log.drain())
+
+    assertThat(output.getvalue(), eq("[Info] tests.bridge.async: Handled\n"))
@@ -0,0 +1,115 @@
+from io import StringIO
+from json import loads
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, Log, Prefix, Rep, StreamSink
+
+from conftest import plain
+
+
+@test
+def prefixed() -> None:
+    """Records of a child are prefixed with it's path and context."""
+    log, output = plain()
+    db = log.child("db", table="users")
+    db.info("Connected")
+    db.child("query", id=7).warning("Slow", ms=5)
+    log.info("Done")
+    log.flush()
+
+    assertThat(
+        output.getvalue().splitlines(),
+        eq(
+            [
+                "[Info] db table=users: Connected",
+                "[Warning] db > query table=users id=7: Slow ms=5",
+                "[Info] Done",
+            ]
+        ),
+    )
+
+
+@test
+def shared_buffer() -> None:
+    """Children share the parent's buffer, so records stay in logging order."""
+    log, output = plain()
+    first, second = log.child("first"), log.child("second")
+    first.info("1")
+    second.info("2")
+    first.info("3")
+    second.flush()
+
+    assertThat(
+        output.getvalue().splitlines(),
+        eq(["[Info] first: 1", "[Info] second: 2", "[Info] first: 3"]),
+    )
+
+
+@test
+def structured() -> None:
+    """JSON lines name the child's path in `logger` and include it's context."""
+    output = StringIO()
+    log = Log(output=StreamSink(output, Rep.STRUCTURED), level=LL.DEBUG)
+    log.child("api").child("auth", user="ted").info("Login")
+    log.flush()
+
+    record = loads(output.getvalue())
+    assertThat(
+        (record["logger"], record["user"], record["message"]), eq(("api.auth", "ted", "Login"))
+    )
+
+
+@test
+def rendered_once() -> None:
+    """The prefix is rendered once, for every representation, when the child is created."""
+    prefix = Prefix(("a", "b"), {"n": 1}, "red")
+    assertThat(prefix.plain, eq("a > b n=1: "))
+    assertThat(prefix.structured, eq(',"logger":"a.b","n":1'))
+    assertThat("\x1b[" in prefix.ansi, eq(True))
+    assertThat(repr(prefix), eq("<Prefix: a.b>"))
+
+
+@test
+def parent_unchanged() -> None:
+    """Creating a child doesn't change the parent's prefix or context."""
+    log, output = plain()
+    log.child("child", key="value")
+    log.info("Parent")
+    log.flush()
+
+    assertThat(output.getvalue(), eq("[Info] Parent\n"))
+
+
+@test
+def parent_changes() -> None:
+    """Changes to the parent's output, sinks, level, and suppression reach existing children."""
+    log, first = plain()
+    child = log.child("db")
+    second, extra = StringIO(), StringIO()
+    log.output(StreamSink(second, Rep.PLAIN)).sink(StreamSink(extra, Rep.PLAIN))
+    log.level(LL.WARNING).suppress()
+    child.info("Hidden")
+    child.warning("Slow")
+    child.warning("Slow")
+    child.flush()
+
+    assertThat(first.getvalue(), eq(""))
+    assertThat(
+        second.getvalue().splitlines(),
+        eq(["[Warning] db: Slow", "[Warning] Last message repeated 1 time"]),
+    )
+    assertThat(extra.getvalue(), eq(second.getvalue()))
+
+
+@test
+def child_changes() -> None:
+    """Settings changed on a child are shared with the parent and the other children."""
+    log, output = plain()
+    first, second = log.child("first"), log.child("second")
+    first.level(LL.ERROR).staging()
+    second.warning("Hidden")
+    second.error("Shown")
+    log.flush()
+
+    assertThat(output.getvalue(), eq("[Error] second: Shown\n"))
+    assertThat(log._staging is not None, eq(True))
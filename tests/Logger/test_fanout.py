@@ -0,0 +1,84 @@
+from io import StringIO
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, Log, Rep, Sink, StreamSink
+
+
+class Counting(Sink):
+    """Counts the writes it gets and keeps the records of each batch."""
+
+    wants_records = True
+
+    def __init__(self, rep: str = Rep.PLAIN, level: str = LL.DEBUG):
+        super().__init__(rep, level)
+        self.writes = 0
+        self.records = []
+        self.texts = []
+
+    def write_records(self, records, texts):
+        self.writes += 1
+        self.records.extend(records)
+        self.texts.extend(texts)
+
+
+@test
+def every_sink() -> None:
+    """A flush writes the buffer to the main output and every attached sink."""
+    main, extra = StringIO(), StringIO()
+    log = Log(output=StreamSink(main, Rep.PLAIN), level=LL.DEBUG)
+    log.sink(StreamSink(extra, Rep.PLAIN))
+    log.info("Hello")
+    log.flush()
+
+    assertThat(main.getvalue(), eq("[Info] Hello\n"))
+    assertThat(extra.getvalue(), eq("[Info] Hello\n"))
+
+
+@test
+def levels_per_sink() -> None:
+    """Each sink only gets the records it's level accepts."""
+    main, errors = StringIO(), StringIO()
+    log = Log(output=StreamSink(main, Rep.PLAIN), level=LL.DEBUG)
+    log.sink(StreamSink(errors, Rep.PLAIN, level=LL.ERROR))
+    log.debug("Detail")
+    log.error("Failed")
+    log.flush()
+
+    assertThat(main.getvalue().splitlines(), eq(["[Debug] Detail", "[Error] Failed"]))
+    assertThat(errors.getvalue().splitlines(), eq(["[Error] Failed"]))
+
+
+@test
+def representations() -> None:
+    """Sinks get the representation they need, colored, plain, or JSON lines."""
+    colored, plain, structured = StringIO(), StringIO(), StringIO()
+    log = Log(output=StreamSink(colored, Rep.ANSI), level=LL.DEBUG)
+    log.sink(StreamSink(plain, Rep.PLAIN), StreamSink(structured, Rep.STRUCTURED))
+    log.warning("Careful")
+    log.flush()
+
+    assertThat("\x1b[" in colored.getvalue(), eq(True))
+    assertThat(plain.getvalue(), eq("[Warning] Careful\n"))
+    assertThat(structured.getvalue().startswith('{"level":"WARNING"'), eq(True))
+
+
+@test
+def one_write_per_batch() -> None:
+    """Each sink gets the whole batch in one write, rendered once per representation."""
+    first, second = Counting(), Counting()
+    log = Log(output=first, level=LL.DEBUG).sink(second)
+    for i in range(5):
+        log.info("Record", i)
+    log.flush()
+
+    assertThat((first.writes, second.writes), eq((1, 1)))
+    assertThat(len(second.records), eq(5))
+    assertThat(all(a is b for a, b in zip(first.texts, second.texts)), eq(True))
+
+
+@test
+def invalid_sink() -> None:
+    """Only sinks can be attached and sinks only take known representations."""
+    log = Log(output=StringIO())
+    assertThat(wrap(log.sink, StringIO()), raises(TypeError))
+    assertThat(wrap(StreamSink, StringIO(), "html"), raises(TypeError))
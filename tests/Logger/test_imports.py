@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+from teddecor.UnitTest import *
+
+
+def imported_after(code: str) -> list[str]:
+    """The heavy standard library modules that are imported after running code."""
+    check = (
+        f"import sys; {code}; "
+        "print(' '.join(m for m in ('asyncio', 'logging', 'argparse') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+@test
+def lazy_members() -> None:
+    """Importing teddecor doesn't import asyncio, logging, or argparse."""
+    assertThat(imported_after("import teddecor"), eq([]))
+
+
+@test
+def lazy_member_access() -> None:
+    """The lazy members are imported the first time they are used."""
+    assertThat("asyncio" in imported_after("from teddecor.Logger import AsyncLog"), eq(True))
+    assertThat("logging" in imported_after("from teddecor.Logger import TEDHandler"), eq(True))
+    assertThat("argparse" in imported_after("from teddecor.Logger import LogReader"), eq(True))
@@ -0,0 +1,141 @@
+import os
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, IndexedFileSink, LogReader, Record
+from teddecor.Logger.index import main
+
+LEVELS = [LL.INFO, LL.INFO, LL.WARNING, LL.ERROR]
+
+
+def write_log(path: str, count: int, block: int = 4, batch: int = 5):
+    """Write `count` records, in batches, whose time is their number."""
+    sink = IndexedFileSink(path, block=block)
+    for start in range(0, count, batch):
+        records = [
+            Record(LEVELS[i % 4], LEVELS[i % 4].title(), None, f"record {i}", float(i))
+            for i in range(start, min(start + batch, count))
+        ]
+        sink.write_records(records, [f"{record.message}\n" for record in records])
+    sink.close()
+
+
+@test
+def round_trip() -> None:
+    """Every record written by the sink is read back in order."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, 23)
+
+        with LogReader(path) as reader:
+            assertThat(reader.blocks, eq(9))
+            assertThat(len(reader), eq(23))
+            assertThat(
+                [record.text for record in reader.records()],
+                eq([f"record {i}\n" for i in range(23)]),
+            )
+
+
+@test
+def appends() -> None:
+    """A second sink on the same path appends blocks after the existing ones."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, 6)
+        write_log(path, 3)
+
+        with LogReader(path) as reader:
+            assertThat(len(reader), eq(9))
+            assertThat(list(reader.records())[-1].text, eq("record 2\n"))
+
+
+@test
+def queries() -> None:
+    """Level, label, and time range queries only return matching records."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, 40)
+
+        with LogReader(path) as reader:
+            errors = [record.text for record in reader.records(level=LL.ERROR)]
+            assertThat(errors, eq([f"record {i}\n" for i in range(3, 40, 4)]))
+
+            above = list(reader.records(level=LL.WARNING, compare=LL.ge))
+            assertThat(len(above), eq(20))
+
+            labeled = list(reader.records(label="Warning"))
+            assertThat(len(labeled), eq(10))
+
+            between = [record.time for record in reader.records(start=10, end=13)]
+            assertThat(between, eq([10.0, 11.0, 12.0, 13.0]))
+
+
+@test
+def last() -> None:
+    """`last` returns the newest matching records, oldest first."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, 40)
+
+        with LogReader(path) as reader:
+            newest = [record.text for record in reader.last(3, level=LL.ERROR)]
+            assertThat(newest, eq(["record 31\n", "record 35\n", "record 39\n"]))
+
+
+@test
+def bisected_times() -> None:
+    """Time ranges are found by bisecting the directory instead of reading every header."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, 4_000, batch=4)
+
+        with LogReader(path) as reader:
+            read = []
+            header = reader._header
+            reader._header = lambda number: read.append(number) or header(number)
+
+            between = [record.time for record in reader.records(start=2_001, end=2_006)]
+            assertThat(between, eq([2_001.0 + i for i in range(6)]))
+            assertThat(len(read) < 40, eq(True))
+            assertThat([record.time for record in reader.records(start=5_000)], eq([]))
+            assertThat([record.time for record in reader.last(2, end=1.5)], eq([0.0, 1.0]))
+
+
+@test
+def unflushed_block() -> None:
+    """A block in the directory whose entries were never written is skipped."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, 8)
+        with open(path + ".idx.entries", "r+b") as file:
+            file.truncate(os.path.getsize(path + ".idx.entries") - 1)
+
+        with LogReader(path) as reader:
+            assertThat(len(list(reader.records())), eq(5))
+
+
+@test
+def not_an_index() -> None:
+    """Opening a file that isn't an index raises a ValueError."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        for name in (path, path + ".idx", path + ".idx.entries"):
+            with open(name, "wb") as file:
+                file.write(b"not an index")
+
+        assertThat(wrap(LogReader, path), raises(ValueError))
+
+
+@test
+def command_line() -> None:
+    """The command line prints the records that match it's options."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, 40)
+
+        output = StringIO()
+        with redirect_stdout(output):
+            main([path, "--level", "error", "--last", "2"])
+        assertThat(output.getvalue(), eq("record 35\nrecord 39\n"))
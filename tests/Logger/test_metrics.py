@@ -0,0 +1,98 @@
+import os
+from tempfile import TemporaryDirectory
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, LatencyHistogram
+
+from conftest import plain
+
+
+@test
+def counters() -> None:
+    """Records per level, filtered events, bytes, and the high-water mark are counted."""
+    log, output = plain(LL.INFO)
+    log.measure()
+    log.debug("Hidden")
+    log.info("One")
+    log.info("Two")
+    log.error("Three")
+    log.flush()
+    log.info("Four").flush()
+
+    snapshot = log.metrics.snapshot()
+    assertThat(snapshot["records"][LL.INFO], eq(3))
+    assertThat(snapshot["records"][LL.ERROR], eq(1))
+    assertThat(snapshot["filtered"], eq(1))
+    assertThat(snapshot["high_water"], eq(3))
+    assertThat(snapshot["flushes"], eq(2))
+    assertThat(list(snapshot["bytes"].values()), eq([len(output.getvalue())]))
+
+
+@test
+def dropped() -> None:
+    """Events dropped by the suppressor are counted."""
+    log, _ = plain(LL.INFO)
+    log.measure()
+    log.suppress(duplicates=False, rate=1, burst=1)
+    for _ in range(4):
+        log.info("Same")
+    log.flush()
+
+    assertThat(log.metrics.snapshot()["dropped"], eq(3))
+
+
+@test
+def prometheus() -> None:
+    """The counters are written in the Prometheus text format."""
+    log, _ = plain(LL.INFO)
+    log.measure(name='web "1"')
+    log.warning("Careful").flush()
+
+    text = log.metrics.prometheus()
+    assertThat(
+        'teddecor_log_records_total{log="web \\"1\\"",level="WARNING"} 1' in text, eq(True)
+    )
+    assertThat("# TYPE teddecor_log_flush_seconds histogram" in text, eq(True))
+    assertThat('teddecor_log_flush_seconds_count{log="web \\"1\\""} 1' in text, eq(True))
+    assertThat(text.endswith("\n"), eq(True))
+
+
+@test
+def prometheus_file() -> None:
+    """The Prometheus file is written as the log is flushed, once the interval has passed."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "log.prom")
+        log, _ = plain(LL.INFO)
+        log.measure(path=path, interval=0)
+        log.info("Written").flush()
+
+        with open(path) as file:
+            assertThat("teddecor_log_records_total" in file.read(), eq(True))
+        assertThat(os.listdir(directory), eq(["log.prom"]))
+
+
+@test
+def histogram_precision() -> None:
+    """Percentiles are within about 6% of the recorded values."""
+    histogram = LatencyHistogram()
+    for value in range(1, 100_001):
+        histogram.record(value * 1_000)
+
+    for percent in (50, 90, 99):
+        exact = percent * 1_000_000
+        assertThat(abs(histogram.percentile(percent) - exact) <= exact * 0.0625, eq(True))
+    assertThat(histogram.percentile(100), eq(histogram.max))
+
+
+@test
+def histogram_buckets() -> None:
+    """Every value falls in the bucket whose upper bound is at or above it."""
+    index, upper = LatencyHistogram.index, LatencyHistogram.upper
+    for value in [1, 31, 32, 33, 1_000, 123_456_789, 2**40 + 5]:
+        assertThat(upper(index(value) - 1) < value <= upper(index(value)), eq(True))
+
+    histogram = LatencyHistogram()
+    for value in (10, 100, 1_000):
+        histogram.record(value)
+    edge = upper(index(100))
+    assertThat(histogram.cumulative([10, edge, 10_000]), eq([1, 2, 3]))
@@ -0,0 +1,92 @@
+from io import StringIO
+from multiprocessing import get_all_start_methods, get_context
+from queue import Queue
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, Log, LogListener, Rep, StreamSink
+
+from conftest import plain
+
+
+def messages(text: str) -> list[str]:
+    """The lines of plain output without the pid and process name of each record."""
+    return [line.split(" pid=")[0] for line in text.splitlines()]
+
+
+def work(queue, number: int):
+    Log(output=StringIO(), level=LL.DEBUG).forward(queue).info("Worker", number).flush()
+
+
+@test
+def forwarded() -> None:
+    """Records forwarded over the queue are written through the listener's log."""
+    log, output = plain()
+    with LogListener(log, Queue()) as listener:
+        worker = Log(output=StringIO(), level=LL.DEBUG).forward(listener.queue)
+        worker.info("First")
+        worker.error("Second").flush()
+
+    assertThat(messages(output.getvalue()), eq(["[Info] First", "[Error] Second"]))
+
+
+@test
+def not_rendered_locally() -> None:
+    """A forwarding log doesn't write to it's own output."""
+    local = StringIO()
+    queue = Queue()
+    Log(output=local, level=LL.DEBUG).forward(queue).info("Away").flush()
+
+    assertThat(local.getvalue(), eq(""))
+    assertThat(queue.qsize(), eq(1))
+
+
+@test
+def process_metadata() -> None:
+    """Forwarded records carry the pid and name of the process that logged them."""
+    output = StringIO()
+    log = Log(output=StreamSink(output, Rep.STRUCTURED), level=LL.DEBUG)
+    with LogListener(log, Queue()) as listener:
+        Log(output=StringIO()).forward(listener.queue).info("Hi").flush()
+
+    assertThat('"process":"MainProcess"' in output.getvalue(), eq(True))
+
+
+@test
+def batches() -> None:
+    """Flushes that are waiting together are written as one batch."""
+    writes = []
+
+    class Recording(StreamSink):
+        def write(self, text: str) -> int:
+            writes.append(text)
+            return len(text)
+
+    log = Log(output=Recording(StringIO(), Rep.PLAIN), level=LL.DEBUG)
+    listener = LogListener(log, Queue())
+    worker = Log(output=StringIO(), level=LL.DEBUG).forward(listener.queue)
+    for i in range(3):
+        worker.info("Flush", i).flush()
+    listener.start().stop()
+
+    assertThat(len(writes), eq(1))
+    assertThat(messages(writes[0]), eq([f"[Info] Flush {i}" for i in range(3)]))
+
+
+@test
+def processes() -> None:
+    """Records from worker processes are all collected and never interleave mid line."""
+    if "fork" not in get_all_start_methods():
+        return
+
+    context = get_context("fork")
+    log, output = plain()
+    with LogListener(log, context.Queue()) as listener:
+        workers = [context.Process(target=work, args=(listener.queue, i)) for i in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    lines = output.getvalue().splitlines()
+    assertThat(sorted(messages(output.getvalue())), eq([f"[Info] Worker {i}" for i in range(4)]))
+    assertThat(all("process=ForkProcess" in line for line in lines), eq(True))
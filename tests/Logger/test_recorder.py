@@ -0,0 +1,93 @@
+import os
+from tempfile import TemporaryDirectory
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, FlightRecorder
+
+from conftest import plain
+
+
+@test
+def quiet_until_triggered() -> None:
+    """Records below the level are kept but not written until the trigger level is logged."""
+    log, output = plain(LL.WARNING)
+    log.recorder()
+    log.debug("Connecting")
+    log.info("Connected")
+    log.flush()
+    assertThat(output.getvalue(), eq(""))
+
+    log.error("Lost connection")
+    log.flush()
+    assertThat(
+        output.getvalue().splitlines(),
+        eq(["[Debug] Connecting", "[Info] Connected", "[Error] Lost connection"]),
+    )
+
+
+@test
+def keeps_most_recent() -> None:
+    """Only the newest `size` records are kept, oldest first."""
+    log, output = plain(LL.WARNING)
+    log.recorder(size=3)
+    for i in range(10):
+        log.debug("Step", i)
+    log.error("Failed").flush()
+
+    assertThat(
+        output.getvalue().splitlines(),
+        eq(["[Debug] Step 7", "[Debug] Step 8", "[Debug] Step 9", "[Error] Failed"]),
+    )
+
+
+@test
+def dump_clears() -> None:
+    """The history is only written once."""
+    log, output = plain(LL.WARNING)
+    log.recorder()
+    log.info("Before")
+    log.error("First").flush()
+    log.error("Second").flush()
+
+    assertThat(
+        output.getvalue().splitlines(), eq(["[Info] Before", "[Error] First", "[Error] Second"])
+    )
+
+
+@test
+def raw_arguments() -> None:
+    """With `raw` the arguments are only joined into a message when they are dumped."""
+    recorder = FlightRecorder(size=2, raw=True)
+    recorder.push(("a", 1), LL.DEBUG, "Debug", None, None, 1.0)
+    records = recorder.dump()
+
+    assertThat([record.message for record in records], eq(["a 1\n"]))
+    assertThat(recorder.dump(), eq([]))
+
+
+@test
+def memory_mapped() -> None:
+    """The history is kept in a file that can be read back after the process is gone."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "flight")
+        recorder = FlightRecorder(size=2, path=path, slot_bytes=32)
+        for i in range(3):
+            recorder.push((f"event {i}",), LL.DEBUG, "Debug", None, None, float(i))
+        recorder.push(("x" * 100,), LL.INFO, "Info", None, None, 3.0)
+        recorder.close()
+
+        lines = FlightRecorder.read(path)
+        assertThat(lines[0], eq("2.000000\tDEBUG\tevent 2"))
+        assertThat(len(lines[1]), eq(28))
+
+
+@test
+def invalid() -> None:
+    """The trigger must be a level, the size positive, and the file a recorder's."""
+    assertThat(wrap(FlightRecorder, trigger="LOUD"), raises(TypeError))
+    assertThat(wrap(FlightRecorder, size=0), raises(ValueError))
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "other")
+        with open(path, "wb") as file:
+            file.write(bytes(64))
+        assertThat(wrap(FlightRecorder.read, path), raises(ValueError))
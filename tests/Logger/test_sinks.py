@@ -0,0 +1,99 @@
+import gzip
+import os
+from tempfile import TemporaryDirectory
+
+from teddecor.UnitTest import *
+from teddecor.Logger import RotatingFileSink
+
+
+def read_all(path: str) -> str:
+    """The text of the active file and every segment, compressed or not."""
+    directory, name = os.path.split(path)
+    text = []
+    for entry in sorted(os.listdir(directory)):
+        if not entry.startswith(name) or entry.endswith(".lock"):
+            continue
+        full = os.path.join(directory, entry)
+        opener = gzip.open if entry.endswith(".gz") else open
+        with opener(full, "rb") as file:
+            text.append(file.read().decode())
+    return "".join(text)
+
+
+@test
+def rotates_by_size() -> None:
+    """The active file is renamed to a compressed segment before it grows past max_bytes."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        sink = RotatingFileSink(path, max_bytes=100, backups=0)
+        for i in range(20):
+            sink.write(f"record {i:02d}\n")
+        sink.close()
+
+        segments = [entry for entry in os.listdir(directory) if entry.endswith(".gz")]
+        assertThat(len(segments) > 0, eq(True))
+        assertThat(os.path.getsize(path) <= 100, eq(True))
+        assertThat(
+            sorted(read_all(path).splitlines()), eq([f"record {i:02d}" for i in range(20)])
+        )
+
+
+@test
+def keeps_backups() -> None:
+    """Only the newest `backups` segments are kept."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        sink = RotatingFileSink(path, backups=2, compress=None)
+        for i in range(5):
+            sink.write(f"record {i}\n")
+            sink.rotate()
+        sink.close()
+
+        segments = [entry for entry in os.listdir(directory) if entry.startswith("app.log.2")]
+        assertThat(len(segments), eq(2))
+
+
+@test
+def shared_path() -> None:
+    """A sink keeps every record when another sink on the same path rotates the file and the
+    segment is compressed and removed."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        first = RotatingFileSink(path, max_bytes=10_000, backups=0)
+        second = RotatingFileSink(path, max_bytes=10_000, backups=0)
+
+        expected = []
+        for i in range(5):
+            for name, sink in (("first", first), ("second", second)):
+                line = f"{name} {i}"
+                expected.append(line)
+                sink.write(line + "\n")
+            first.rotate()
+            # Wait for the rotated segment to be compressed and removed
+            first.close()
+
+        first.close()
+        second.close()
+        assertThat(sorted(read_all(path).splitlines()), eq(sorted(expected)))
+
+
+@test
+def shared_path_stale_size() -> None:
+    """The size that decides rotation is the size of the file at the path, not of a file
+    another sink already rotated away."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        first = RotatingFileSink(path, max_bytes=1_000, backups=0, compress=None)
+        second = RotatingFileSink(path, max_bytes=1_000, backups=0, compress=None)
+
+        second.write("x" * 900 + "\n")
+        first.write("a\n")
+        first.rotate()
+        second.write("b\n")
+        first.close()
+        second.close()
+
+        with open(path) as file:
+            assertThat(file.read(), eq("b\n"))
+        segments = [entry for entry in os.listdir(directory) if entry.startswith("app.log.2")]
+        assertThat(len(segments), eq(1))
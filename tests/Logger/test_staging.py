@@ -0,0 +1,114 @@
+from threading import Barrier, Thread
+
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, Record, Staging
+
+from conftest import plain
+
+
+def record(message: str) -> Record:
+    return Record(LL.INFO, "Info", None, message + "\n", 0.0)
+
+
+@test
+def logging_order() -> None:
+    """Records staged by many threads are collected in the order they were logged."""
+    staging = Staging()
+    barrier = Barrier(4)
+
+    def stage(name: str):
+        barrier.wait()
+        for i in range(500):
+            staging.append(record(f"{name} {i}"))
+
+    threads = [Thread(target=stage, args=(f"t{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    messages = [staged.message for staged in staging.collect()]
+    assertThat(len(messages), eq(2000))
+    for n in range(4):
+        own = [message for message in messages if message.startswith(f"t{n} ")]
+        assertThat(own, eq([f"t{n} {i}\n" for i in range(500)]))
+
+
+@test
+def interleaved() -> None:
+    """Records from different threads are merged by when they were logged."""
+    staging = Staging()
+    staging.append(record("main 0"))
+    worker = Thread(target=lambda: staging.append(record("worker")))
+    worker.start()
+    worker.join()
+    staging.append(record("main 1"))
+
+    assertThat(
+        [staged.message for staged in staging.collect()],
+        eq(["main 0\n", "worker\n", "main 1\n"]),
+    )
+
+
+@test
+def collect_takes() -> None:
+    """Collected records are removed and buffers of finished threads are dropped."""
+    staging = Staging()
+    worker = Thread(target=lambda: staging.extend([record("a"), record("b")]))
+    worker.start()
+    worker.join()
+
+    assertThat(len(staging), eq(2))
+    assertThat(len(staging.collect()), eq(2))
+    assertThat((len(staging), staging.collect()), eq((0, [])))
+    assertThat(len(staging._buffers), eq(0))
+
+
+@test
+def staged_log() -> None:
+    """A staged log flushes the records of every thread, in order."""
+    log, output = plain()
+    log.staging()
+    log.info("Before")
+    worker = Thread(target=lambda: log.info("Worker"))
+    worker.start()
+    worker.join()
+    log.info("After")
+    log.flush()
+
+    assertThat(
+        output.getvalue().splitlines(), eq(["[Info] Before", "[Info] Worker", "[Info] After"])
+    )
+
+
+@test
+def disable() -> None:
+    """Turning staging off moves the staged records back to the buffer."""
+    log, output = plain()
+    log.staging()
+    log.info("Staged")
+    log.staging(False)
+    log.info("Buffered")
+
+    assertThat([buffered.message for buffered in log.buffer], eq(["Staged\n", "Buffered\n"]))
+
+
+@test
+def in_flight() -> None:
+    """Records after one that is still being staged are held back until it arrives."""
+    staging = Staging()
+    number = next(staging._sequence)
+    staging.append(record("later"))
+
+    assertThat((staging.collect(), len(staging)), eq(([], 1)))
+    staging._local.buffer.append((number, record("first")))
+    assertThat([staged.message for staged in staging.collect()], eq(["first\n", "later\n"]))
+
+
+@test
+def unstaged_defaults() -> None:
+    """The global `Logger` appends to it's buffer right away."""
+    from teddecor.Logger import Logger
+
+    assertThat(Logger._staging, eq(None))
+    assertThat(Logger._target is Logger.buffer, eq(True))
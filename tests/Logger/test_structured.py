@@ -0,0 +1,126 @@
+from io import StringIO
+from json import loads
+
+from teddecor import TED
+from teddecor.UnitTest import *
+from teddecor.Logger import LL, JSONSerializer, Log, Record, Rep, StreamSink
+from teddecor.Logger.structured import encode_value, strip_ansi
+
+
+def structured() -> tuple[Log, StringIO]:
+    output = StringIO()
+    return Log(output=StreamSink(output, Rep.STRUCTURED), level=LL.DEBUG), output
+
+
+def lines(output: StringIO) -> list[dict]:
+    return [loads(line) for line in output.getvalue().splitlines()]
+
+
+@test
+def one_object_per_line() -> None:
+    """Every record is a JSON object on it's own line with it's level, label, and message."""
+    log, output = structured()
+    log.info("Hello", 1)
+    log.error("Boom")
+    log.flush()
+
+    records = lines(output)
+    assertThat(len(records), eq(2))
+    assertThat(
+        [(record["level"], record["label"], record["message"]) for record in records],
+        eq([("INFO", "Info", "Hello 1"), ("ERROR", "Error", "Boom")]),
+    )
+    assertThat(isinstance(records[0]["time"], float), eq(True))
+
+
+@test
+def rendered_labels() -> None:
+    """Labels that hold rendered ansi sequences, escaped as markup, are plain in JSON."""
+    log, output = structured()
+    log.custom("Hello", label=TED.encode("\x1b[33mDeprecated\x1b[39m"))
+    log.flush()
+
+    assertThat(lines(output)[0]["label"], eq("Deprecated"))
+
+
+@test
+def context() -> None:
+    """Context values are encoded as JSON and unknown types fall back to their text."""
+
+    class Unknown:
+        def __str__(self) -> str:
+            return "unknown"
+
+    log, output = structured()
+    log.info("Request", user="ted", n=3, f=1.5, ok=True, none=None, items=[1, 2], obj=Unknown())
+    log.flush()
+
+    record = lines(output)[0]
+    assertThat(
+        {key: record[key] for key in ("user", "n", "f", "ok", "none", "items", "obj")},
+        eq(
+            {
+                "user": "ted",
+                "n": 3,
+                "f": 1.5,
+                "ok": True,
+                "none": None,
+                "items": [1, 2],
+                "obj": "unknown",
+            }
+        ),
+    )
+
+
+@test
+def ansi_is_stripped() -> None:
+    """Colors and hyperlinks are removed from messages and string values."""
+    log, output = structured()
+    log.info("\x1b[31mred\x1b[0m", link="\x1b]8;;https://example.com\x1b\\site\x1b]8;;\x1b\\")
+    log.flush()
+
+    record = lines(output)[0]
+    assertThat((record["message"], record["link"]), eq(("red", "site")))
+    assertThat(strip_ansi("plain"), eq("plain"))
+
+
+@test
+def escaping() -> None:
+    """Quotes, backslashes, and newlines in values are escaped."""
+    assertThat(loads(encode_value('a "quoted"\\\nvalue')), eq('a "quoted"\\\nvalue'))
+    assertThat(encode_value(10**20), eq("100000000000000000000"))
+
+
+@test
+def metadata() -> None:
+    """The thread, pid, and process name are included when they are recorded."""
+    log, output = structured()
+    log.metadata(thread=True, process=True).info("Started")
+    log.flush()
+
+    record = lines(output)[0]
+    assertThat(record["thread"], eq("MainThread"))
+    assertThat(isinstance(record["pid"], int), eq(True))
+
+
+@test
+def flush_structured() -> None:
+    """`flush(structured=True)` writes JSON lines to the given file only."""
+    main = StringIO()
+    log = Log(output=main, level=LL.DEBUG)
+    log.info("x")
+
+    output = StringIO()
+    log.flush(output, structured=True)
+    assertThat([record["message"] for record in lines(output)], eq(["x"]))
+    assertThat(main.getvalue(), eq(""))
+
+
+@test
+def batch() -> None:
+    """A batch is the records' lines joined together."""
+    records = [Record(LL.INFO, "Info", None, f"{message}\n", 1.0) for message in "ab"]
+    serializer = JSONSerializer()
+    assertThat(
+        serializer.batch(records), eq("".join(serializer.serialize(record) for record in records))
+    )
@@ -0,0 +1,112 @@
+from teddecor.UnitTest import *
+
+from conftest import plain
+
+
+class Expensive:
+    """Compares element by element like a NumPy array and counts how often it is formatted."""
+
+    def __init__(self, *values: int):
+        self.values = values
+        self.formatted = 0
+
+    def __eq__(self, other):
+        raise ValueError("The truth value of an array is ambiguous")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return str(list(self.values))
+
+
+@test
+def duplicates() -> None:
+    """Identical consecutive events are collapsed and counted."""
+    log, output = plain()
+    log.suppress()
+    for _ in range(4):
+        log.info("Connected", host="db")
+    log.info("Done")
+    log.flush()
+
+    assertThat(
+        output.getvalue().splitlines(),
+        eq(["[Info] Connected host=db", "[Info] Last message repeated 3 times", "[Info] Done"]),
+    )
+    assertThat(log.suppressor.repeated, eq(3))
+
+
+@test
+def mutated_argument() -> None:
+    """A list that changes between events is a different message."""
+    log, output = plain()
+    log.suppress()
+    items = [1]
+    log.info(items)
+    items.append(2)
+    log.info(items)
+    log.flush()
+
+    assertThat(output.getvalue().splitlines(), eq(["[Info] 1", "[Info] 1 2"]))
+
+
+@test
+def unformatted_arguments() -> None:
+    """Duplicates are found by identity without formatting them or comparing them with `==`."""
+    log, output = plain()
+    log.suppress()
+    array, other = Expensive(1, 2), Expensive(1, 2)
+    for _ in range(3):
+        log.info(array)
+    log.info(other)
+    log.flush()
+
+    assertThat(
+        output.getvalue().splitlines(),
+        eq(["[Info] [1, 2]", "[Info] Last message repeated 2 times", "[Info] [1, 2]"]),
+    )
+    assertThat(array.formatted, eq(1))
+
+
+@test
+def rate_limit() -> None:
+    """Events past the burst are dropped and counted per label and template."""
+    log, output = plain()
+    log.suppress(duplicates=False, rate=1, burst=2)
+    for i in range(5):
+        log.info("Request", i)
+    log.flush()
+
+    assertThat(output.getvalue().count("\n"), eq(2))
+    assertThat(log.suppressor.dropped, eq({("Info", "Request"): 3}))
+
+
+@test
+def dropped_repeats() -> None:
+    """Repeats of an event that was dropped by the rate limit aren't reported as repeats."""
+    log, output = plain()
+    log.suppress(rate=1, burst=1)
+    log.info("Request")
+    log.info("Other")
+    log.info("Request")
+    log.info("Request")
+    log.flush()
+
+    assertThat(output.getvalue().splitlines(), eq(["[Info] Request", "[Info] Other"]))
+
+
+@test
+def bounded_keys() -> None:
+    """Only the most recently used keys are kept for the rate limit and drop counts."""
+    log, _ = plain()
+    log.suppress(duplicates=False, rate=1, burst=1, keys=2)
+    for i in range(10):
+        log.info(f"Request {i}")
+        log.info(f"Request {i}")
+    log.info("Request 8")
+
+    assertThat(len(log.suppressor._buckets), eq(2))
+    assertThat(log.suppressor.dropped, eq({("Info", "Request 9"): 1, ("Info", "Request 8"): 2}))
+    assertThat(wrap(log.suppress, keys=0), raises(ValueError))
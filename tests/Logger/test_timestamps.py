@@ -0,0 +1,72 @@
+from re import fullmatch
+from time import localtime, mktime, strftime
+
+from teddecor.UnitTest import *
+from teddecor.Logger import TimestampCache
+
+from conftest import plain
+
+NOON = mktime((2024, 5, 17, 12, 30, 15, 0, 0, -1))
+"""An exact second in local time."""
+
+
+@test
+def wall_clock() -> None:
+    """Wall clock times are formatted with `strftime` and milliseconds."""
+    stamps = TimestampCache()
+    assertThat(stamps(NOON + 0.25), eq("2024-05-17 12:30:15.250"))
+    assertThat(stamps(NOON + 1.999), eq("2024-05-17 12:30:16.999"))
+
+
+@test
+def cached_per_second() -> None:
+    """The date and time are only formatted again when the second changes."""
+    stamps = TimestampCache(fmt="%H:%M:%S", milliseconds=False)
+    stamps(NOON)
+    second, prefix = stamps._cached
+
+    assertThat(stamps(NOON + 0.5), eq(prefix))
+    assertThat(stamps._cached[0], eq(second))
+    assertThat(stamps(NOON + 1), eq(strftime("%H:%M:%S", localtime(NOON + 1))))
+
+
+@test
+def monotonic() -> None:
+    """Monotonic times are shown as seconds since the cache was created."""
+    stamps = TimestampCache(clock="monotonic")
+    assertThat(stamps(stamps.start + 1.5), eq("+1.500000"))
+
+
+@test
+def invalid_clock() -> None:
+    """Only the wall and monotonic clocks can be used."""
+    assertThat(wrap(TimestampCache, clock="sundial"), raises(ValueError))
+
+
+@test
+def log_lines() -> None:
+    """Log lines show the time after the label, and the thread and process when recorded."""
+    log, output = plain()
+    log.metadata(thread=True, process=True).info("Started")
+    log.flush()
+
+    line = output.getvalue().rstrip("\n")
+    assertThat(
+        fullmatch(
+            r"\[Info\] \d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.\d{3} Started "
+            r"thread=MainThread pid=\d+ process=MainProcess",
+            line,
+        )
+        is not None,
+        eq(True),
+    )
+
+
+@test
+def without_timestamp() -> None:
+    """Timestamps can be left out while keeping the other metadata."""
+    log, output = plain()
+    log.metadata(timestamp=False, thread=True).info("Started")
+    log.flush()
+
+    assertThat(output.getvalue(), eq("[Info] Started thread=MainThread\n"))
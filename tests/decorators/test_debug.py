@@ -0,0 +1,31 @@
+import builtins
+import sys
+from io import StringIO
+from typing import Optional
+
+from teddecor.UnitTest import *
+from teddecor.decorators import debug
+from teddecor.decorators.utility import logger
+
+
+@test
+def whole_iterators() -> None:
+    """Showing the arguments doesn't use up an iterator before the function gets it."""
+    totals = []
+
+    @debug(depth=2)
+    def total(values) -> Optional[int]:
+        totals.append(sum(values))
+        return totals[-1]
+
+    output = StringIO()
+    prompt, builtins.input = builtins.input, lambda *_: ""
+    logger.output(output)
+    try:
+        total(number for number in range(5))
+    finally:
+        builtins.input = prompt
+        logger.output(sys.stdout)
+
+    assertThat(totals, eq([10]))
+    assertThat("<generator>" in output.getvalue(), eq(True))
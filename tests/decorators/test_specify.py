@@ -0,0 +1,34 @@
+import sys
+from io import StringIO
+from typing import Optional
+
+from teddecor.UnitTest import *
+from teddecor.Logger import Logger
+from teddecor.decorators import deprecated
+from teddecor.decorators.specify import _DEPRECATED_DEF
+from teddecor.pprint import Theme, use_theme
+
+
+@test
+def themed_labels() -> None:
+    """The deprecation label is styled with the active theme and is built once per theme."""
+
+    @deprecated
+    def old() -> Optional[int]:
+        return 1
+
+    output = StringIO()
+    theme = Theme(colors=0)
+    previous = use_theme(theme)
+    Logger.output(output)
+    try:
+        assertThat(old(), eq(1))
+        old()
+    finally:
+        use_theme(previous)
+        Logger.output(sys.stdout)
+
+    label = output.getvalue().splitlines()[0].split("]")[0]
+    assertThat(label.endswith("[Deprecated.def"), eq(True))
+    assertThat("\x1b[38" in output.getvalue(), eq(False))
+    assertThat(_DEPRECATED_DEF[theme], eq("Deprecated.def"))
@@ -0,0 +1,82 @@
+from threading import Thread
+
+from teddecor.UnitTest import *
+from teddecor.TED import TED
+from teddecor.decorators import BATCH, TIMINGS, Time, time_summary
+
+
+def handler(number: int):
+    @Time(aggregate=True, at_exit=False)
+    def handle():
+        return number
+
+    return handle
+
+
+@test
+def counts_calls() -> None:
+    """Every call is counted once the waiting durations are folded."""
+
+    @Time(aggregate=True, at_exit=False)
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    for i in range(BATCH + 10):
+        assertThat(add(i, 1), eq(i + 1))
+    add.timing.fold()
+
+    assertThat(add.timing.count, eq(BATCH + 10))
+    assertThat(add.timing.min <= add.timing.percentile(50) <= add.timing.max, eq(True))
+
+
+@test
+def threads() -> None:
+    """Calls from many threads, folding as they go, are all counted."""
+
+    @Time(aggregate=True, at_exit=False)
+    def work():
+        pass
+
+    def run():
+        for _ in range(BATCH * 2):
+            work()
+
+    threads = [Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    work.timing.fold()
+
+    assertThat(work.timing.count, eq(8 * BATCH * 2))
+    assertThat(sum(work.timing.counts.values()), eq(8 * BATCH * 2))
+
+
+@test
+def closures() -> None:
+    """Closures with the same qualified name share one timing and one row of the summary."""
+    handlers = [handler(number) for number in range(10_000)]
+    for handle in handlers:
+        handle()
+    first = handlers[0]
+    first.timing.fold()
+
+    assertThat(all(handle.timing is first.timing for handle in handlers), eq(True))
+    assertThat(first.timing.count, eq(10_000))
+    assertThat(TIMINGS[first.timing.name] is first.timing, eq(True))
+    rows = TED.strip(time_summary(decode=False)).splitlines()[1:]
+    assertThat(sum(row.split()[0] == first.timing.name for row in rows), eq(1))
+
+
+@test
+def summary() -> None:
+    """The summary has a row for every timed function that was called."""
+
+    @Time(aggregate=True, at_exit=False)
+    def summarized():
+        pass
+
+    summarized()
+    lines = TED.strip(time_summary()).splitlines()
+    assertThat(lines[0].split()[:2], eq(["function", "calls"]))
+    assertThat(any(line.split()[0].endswith("summarized") for line in lines[1:]), eq(True))
@@ -0,0 +1,13 @@
+from re import sub
+
+from teddecor.pprint import p_value
+
+
+def plain(value, **options) -> str:
+    """`value` formatted without any styling."""
+    return p_value(value, style=None, **options)
+
+
+def uncolored(text: str) -> str:
+    """`text` without it's ANSI color sequences."""
+    return sub(r"\x1b\[[0-9;]*m", "", text)
@@ -0,0 +1,47 @@
+from teddecor.UnitTest import *
+from teddecor.TED import TED
+from teddecor.pprint import ANSI, MARKUP, p_value
+
+from conftest import uncolored
+
+VALUE = {
+    "numbers": [1, 2.5, 3j],
+    "constants": (None, True, False),
+    "text": "line\n\x1b[31m*bold* _under_ [@F red]",
+    "bytes": b"raw",
+    "empty": {},
+}
+
+
+@test
+def same_as_markup() -> None:
+    """Values rendered straight to ansi look the same as their markup once it is parsed."""
+    ansi = p_value(VALUE, depth=3)
+    markup = p_value(VALUE, depth=3, decode=False)
+
+    assertThat("[@F yellow]" in ansi, eq(False))
+    assertThat(uncolored(ansi), eq(uncolored(TED.parse(markup))))
+
+
+@test
+def markup_is_escaped() -> None:
+    """Text that looks like markup is escaped in markup output and left alone in ansi."""
+    text = "*bold* _under_ [@F red]"
+    assertThat(uncolored(p_value(text)), eq(repr(text)))
+    assertThat(uncolored(TED.parse(p_value(text, decode=False))), eq(repr(text)))
+
+
+@test
+def escapes_highlighted() -> None:
+    """Escape sequences in strings are highlighted in their own color."""
+    string, escape = ANSI.open["string"], ANSI.open["escape"]
+    expected = f"{string}'a{escape}\\n{string}b'{ANSI.close['string']}"
+    assertThat(p_value("a\nb", style=ANSI), eq(expected))
+
+
+@test
+def ready_made_sequences() -> None:
+    """Styles render their sequences once, so formatting only concatenates them."""
+    assertThat(ANSI.wrap("number", "1"), eq(ANSI.open["number"] + "1" + ANSI.close["number"]))
+    assertThat(ANSI.symbol("[") is ANSI.symbol("["), eq(True))
+    assertThat(MARKUP.wrap("number", "1"), eq("[@F yellow]1[@F]"))
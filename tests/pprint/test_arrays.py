@@ -0,0 +1,80 @@
+from array import array
+
+from teddecor.UnitTest import *
+from teddecor.pprint import PLAIN, arrays, p_value
+from teddecor.pprint.registry import LEAVES
+
+
+def numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@test
+def ndarray() -> None:
+    """NumPy arrays show their header, edge elements, and stats."""
+    np = numpy()
+    if np is None:
+        return
+
+    text = p_value(np.arange(10, dtype=np.int64), style=PLAIN)
+    assertThat(
+        text,
+        eq(
+            "ndarray(dtype=int64, shape=(10,), strides=(8,)) "
+            "[0, 1, 2, … 4 more …, 7, 8, 9] min=0 max=9 mean=4.5"
+        ),
+    )
+    assertThat(p_value(np.array([1.0, np.nan, 3.0]), style=PLAIN).endswith("nan=1"), eq(True))
+
+
+@test
+def text_array() -> None:
+    """`array.array` of characters shows it's characters without stats."""
+    assertThat(
+        p_value(array("u", "hello"), style=PLAIN),
+        eq("array(typecode='u', length=5, itemsize=4) [h, e, l, l, o]"),
+    )
+
+
+@test
+def released_memoryview() -> None:
+    """A released `memoryview` is shown without reading it."""
+    view = memoryview(b"abc")
+    view.release()
+    assertThat(p_value(view, style=PLAIN), eq("memoryview(released=True)"))
+
+
+@test
+def leaves() -> None:
+    """The array formatters are registered as leaves."""
+    for formatter in (arrays.format_ndarray, arrays.format_array, arrays.format_memoryview):
+        assertThat(formatter in LEAVES, eq(True))
+
+
+@test
+def refs_stats_once() -> None:
+    """With `refs`, the stats of an array are computed once per time it is shown."""
+    np = numpy()
+    if np is None:
+        return
+
+    calls = []
+    stats = arrays._stats
+
+    def counted(module, value):
+        calls.append(value)
+        return stats(module, value)
+
+    shared = np.zeros(4)
+    arrays._stats = counted
+    try:
+        text = p_value({"a": shared, "b": [shared]}, depth=3, style=PLAIN, refs=True)
+    finally:
+        arrays._stats = stats
+
+    assertThat(len(calls), eq(2))
+    assertThat(text.count("ndarray"), eq(2))
@@ -0,0 +1,76 @@
+from re import sub
+
+from teddecor.UnitTest import *
+from teddecor.pprint import p_diff
+
+
+def diff(a, b, **options) -> str:
+    return sub(r"\x1b\[[0-9;]*m", "", p_diff(a, b, **options))
+
+
+@test
+def same() -> None:
+    """Values that are the same give an empty string."""
+    shared = [1, 2]
+    assertThat(p_diff(shared, shared), eq(""))
+    assertThat(p_diff([1, (2, 3)], [1, (2, 3)]), eq(""))
+    assertThat(p_diff({1, 2}, {2, 1}), eq(""))
+
+
+@test
+def changed_keys() -> None:
+    """Only the changed keys of a dict are marked."""
+    assertThat(
+        diff({"a": 1, "b": 2}, {"a": 1, "b": 3}),
+        eq("  {\n    'a': 1\n-   'b': 2\n+   'b': 3\n  }"),
+    )
+
+
+@test
+def context() -> None:
+    """Unchanged items further than `context` from a change are counted."""
+    assertThat(
+        diff([1, 2, 3, 4, 5, 6, 7], [1, 2, 3, 9, 5, 6, 7], context=1),
+        eq("  [\n    … 2 unchanged …\n    3\n-   4\n+   9\n    5\n    … 2 unchanged …\n  ]"),
+    )
+    assertThat(diff([1], [1, 2]), eq("  [\n    1\n+   2\n  ]"))
+
+
+@test
+def nested() -> None:
+    """Containers that differ are followed down to the changed items."""
+    assertThat(
+        diff({"x": {"y": [1, 2]}}, {"x": {"y": [1, 3]}}),
+        eq("  {\n    'x': {\n      'y': [\n        1\n-       2\n+       3\n      ]\n    }\n  }"),
+    )
+
+
+@test
+def replaced() -> None:
+    """Values of different types are replaced as a whole."""
+    assertThat(diff(1, "1"), eq("- 1\n+ '1'"))
+    assertThat(diff({1, 2}, {2, 3}), eq("  {\n    2\n-   1\n+   3\n  }"))
+
+
+@test
+def limits() -> None:
+    """Removed and added containers are cut down with `max_items`."""
+    assertThat(
+        diff({"a": [1, 2, 3, 4]}, {}, depth=2, max_items=2),
+        eq("  {\n-   'a': [\n-     1,\n-     … 2 more …,\n-     4\n-   ]\n  }"),
+    )
+
+
+@test
+def cycles() -> None:
+    """A pair of containers that is reached again inside itself is shown as `<cycle>`."""
+    a, b = [1], [2]
+    a.append(a)
+    b.append(b)
+    assertThat(diff(a, b), eq("  [\n-   1\n+   2\n    <cycle>\n  ]"))
+
+    shared, other = [1], [2]
+    assertThat(
+        diff([shared, shared], [other, other]),
+        eq("  [\n    [\n-     1\n+     2\n    ]\n    [\n-     1\n+     2\n    ]\n  ]"),
+    )
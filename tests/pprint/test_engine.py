@@ -0,0 +1,57 @@
+from teddecor.UnitTest import *
+
+from conftest import plain
+
+
+def nested(levels: int) -> list:
+    outer = inner = []
+    for _ in range(levels):
+        inner.append([])
+        inner = inner[0]
+    return outer
+
+
+@test
+def layout() -> None:
+    """Every item is on it's own line, indented by it's depth."""
+    assertThat(
+        plain({"a": [1, 2], "b": ()}, depth=2),
+        eq("{\n  'a': [\n    1,\n    2\n  ],\n  'b': ()\n}"),
+    )
+
+
+@test
+def depth() -> None:
+    """Containers past the depth are cut off."""
+    assertThat(plain([[1], 2], depth=1), eq("[\n  […],\n  2\n]"))
+    assertThat(plain([1], depth=0), eq("[…]"))
+
+
+@test
+def indent() -> None:
+    """Nested lines are indented by `indent` and the first line only with `leading`."""
+    assertThat(plain([1], indent=2), eq("[\n    1\n  ]"))
+    assertThat(plain([1], indent=2, leading=True), eq("  [\n    1\n  ]"))
+
+
+@test
+def deep_nesting() -> None:
+    """Values are walked without recursion, so any depth of nesting can be formatted."""
+    text = plain(nested(5_000), depth=10_000)
+    lines = text.splitlines()
+
+    assertThat(len(lines), eq(10_001))
+    assertThat(lines[5_000], eq(" " * 10_000 + "[]"))
+
+
+@test
+def handler() -> None:
+    """Values without a format of their own are given to the handler."""
+
+    class Custom:
+        pass
+
+    def handle(value, depth, indent, decode, leading):
+        return f"<{type(value).__name__}>"
+
+    assertThat(plain([Custom(), 1], handler=handle), eq("[\n  <Custom>,\n  1\n]"))
@@ -0,0 +1,61 @@
+from teddecor.UnitTest import *
+
+from conftest import plain
+
+
+@test
+def max_items() -> None:
+    """Containers keep their head and tail and the rest is counted as `… N more …`."""
+    assertThat(
+        plain(list(range(10)), max_items=4),
+        eq("[\n  0,\n  1,\n  … 6 more …,\n  8,\n  9\n]"),
+    )
+    assertThat(plain(list(range(10)), max_items=3), eq("[\n  0,\n  1,\n  … 7 more …,\n  9\n]"))
+    assertThat(
+        plain({n: n for n in range(6)}, max_items=2), eq("{\n  0: 0,\n  … 4 more …,\n  5: 5\n}")
+    )
+    assertThat(plain([1, 2], max_items=2), eq("[\n  1,\n  2\n]"))
+
+
+@test
+def max_string() -> None:
+    """Long strings keep their start and end around the number of characters left out."""
+    text = "abcdefghijklmnopqrstuvwxyz"
+    assertThat(plain(text, max_string=10), eq("'abcde' … 16 more … 'vwxyz'"))
+    assertThat(plain(text, max_string=26), eq(repr(text)))
+    assertThat(plain(text, max_string=1), eq("'a' … 25 more …"))
+    assertThat(plain(text, max_string=0), eq("'' … 26 more …"))
+
+
+@test
+def max_total_chars() -> None:
+    """Formatting stops after about `max_total_chars` and open containers are still closed."""
+    assertThat(
+        plain(list(range(1_000)), max_total_chars=30),
+        eq("[\n  0,\n  1,\n  2,\n  3,\n  4,\n  5,\n  …\n]"),
+    )
+    assertThat(
+        plain([[1, 2, 3]] * 50, depth=3, max_total_chars=30),
+        eq("[\n  [\n    1,\n    2,\n    3\n  ],\n  …\n]"),
+    )
+
+
+@test
+def max_total_chars_width() -> None:
+    """Containers that are still being fitted on one line count toward `max_total_chars`."""
+    text = plain(list(range(1_000)), width=10_000, max_total_chars=30)
+
+    assertThat(len(text) < 60, eq(True))
+    assertThat(text.endswith(",\n  …\n]"), eq(True))
+    assertThat(
+        plain([[1, 2], [3, 4]] * 100, depth=3, width=10_000, max_total_chars=30),
+        eq("[\n  [1, 2],\n  [3, 4],\n  [1, 2],\n  [3, 4],\n  …\n]"),
+    )
+
+
+@test
+def unlimited() -> None:
+    """Without limits everything is shown."""
+    value = {"items": list(range(100)), "text": "x" * 1_000}
+    assertThat(plain(value, depth=2).count("\n"), eq(104))
+    assertThat("…" in plain(value, depth=2), eq(False))
@@ -0,0 +1,37 @@
+from re import sub
+
+from teddecor.UnitTest import *
+from teddecor.pprint import PLAIN, p_value
+
+VALUE = {"text": "*b* [@F red] \x1b[31m", "items": [1, 2.5, None, True, b"x"]}
+
+
+@test
+def plain_text() -> None:
+    """With `style=None` values have the same layout without any sequences or escaping."""
+    assertThat(
+        p_value(VALUE, depth=2, style=None),
+        eq(
+            "{\n  'text': '*b* [@F red] \\x1b[31m',\n  'items': [\n    1,\n    2.5,\n"
+            "    None,\n    True,\n    b'x'\n  ]\n}"
+        ),
+    )
+
+
+@test
+def overrides_decode() -> None:
+    """A style is used whatever `decode` is, and `None` is the same as `PLAIN`."""
+    text = p_value(VALUE, depth=2, style=None)
+    assertThat(p_value(VALUE, depth=2, style=PLAIN), eq(text))
+    assertThat(p_value(VALUE, depth=2, decode=False, style=None), eq(text))
+
+
+@test
+def plain_width() -> None:
+    """Plain text is measured by it's length, so it's laid out like styled text."""
+    assertThat(PLAIN.width("'abc'"), eq(5))
+    assertThat(p_value([1, [2, 3]], depth=2, width=20, style=None), eq("[1, [2, 3]]"))
+    assertThat(
+        p_value([1, [2, 3]], depth=2, width=20, style=None),
+        eq(sub(r"\x1b\[[0-9;]*m", "", p_value([1, [2, 3]], depth=2, width=20))),
+    )
@@ -0,0 +1,51 @@
+from teddecor.UnitTest import *
+
+from conftest import plain
+
+
+@test
+def cycles() -> None:
+    """Containers that contain themselves are shown as `<cycle>`, with or without `refs`."""
+    items = [1]
+    items.append(items)
+    mapping = {}
+    mapping["self"] = mapping
+
+    assertThat(plain(items, depth=3), eq("[\n  1,\n  <cycle>\n]"))
+    assertThat(plain(items, refs=True, depth=3), eq("[\n  1,\n  <cycle>\n]"))
+    assertThat(plain(mapping, depth=3), eq("{\n  'self': <cycle>\n}"))
+
+
+@test
+def shared() -> None:
+    """Without `refs` a container reached twice is formatted every time."""
+    items = [1, 2]
+    assertThat(
+        plain([items, items], depth=3),
+        eq("[\n  [\n    1,\n    2\n  ],\n  [\n    1,\n    2\n  ]\n]"),
+    )
+
+
+@test
+def refs() -> None:
+    """With `refs` a shared container is labeled `#n` and shown as `<ref #n>` after that."""
+    items, pair = [1, 2], (3,)
+    assertThat(
+        plain([items, pair, items, pair], refs=True, depth=3),
+        eq(
+            "[\n  #1 [\n    1,\n    2\n  ],\n  #2 (\n    3\n  ),\n  <ref #1>,\n  <ref #2>\n]"
+        ),
+    )
+
+
+@test
+def refs_by_depth() -> None:
+    """Containers are only referred back to when they are reached at the same depth."""
+    items = [1, 2]
+    assertThat(
+        plain([items, items, {"k": items}], refs=True, depth=3),
+        eq(
+            "[\n  #1 [\n    1,\n    2\n  ],\n  <ref #1>,\n  {\n    'k': [\n      1,\n      2\n"
+            "    ]\n  }\n]"
+        ),
+    )
@@ -0,0 +1,99 @@
+from collections import Counter, OrderedDict, defaultdict, namedtuple
+from dataclasses import dataclass, field
+from enum import Enum
+
+from teddecor.UnitTest import *
+from teddecor.pprint import register_pprint
+from teddecor.pprint.registry import CACHE, LEAVES, formatter_for
+
+from conftest import plain
+
+Point = namedtuple("Point", "x y")
+
+
+class Items(list):
+    pass
+
+
+class Pair(tuple):
+    pass
+
+
+class Color(Enum):
+    RED = 1
+
+
+@dataclass
+class User:
+    name: str
+    secret: str = field(default="", repr=False)
+
+
+def flat(value) -> str:
+    return plain(value, depth=3, width=80)
+
+
+@test
+def builtin_formats() -> None:
+    """Builtin containers are shown without their type name."""
+    assertThat(flat({"a": [1, (2, 3)]}), eq("{'a': [1, (2, 3)]}"))
+    assertThat(flat({1, 2}), eq("{1, 2}"))
+    assertThat(flat(frozenset()), eq("frozenset()"))
+
+
+@test
+def mapping_subclasses() -> None:
+    """Subclasses of dict show their type name."""
+    assertThat(flat(OrderedDict(a=1)), eq("OrderedDict{'a': 1}"))
+    assertThat(flat(defaultdict(int, a=1)), eq("defaultdict{'a': 1}"))
+    assertThat(flat(Counter("aab")), eq("Counter{'a': 2, 'b': 1}"))
+
+
+@test
+def sequence_subclasses() -> None:
+    """Subclasses of list and tuple show their type name and namedtuples their fields."""
+    assertThat(flat(Items([1, 2])), eq("Items[1, 2]"))
+    assertThat(flat(Pair((1, 2))), eq("Pair(1, 2)"))
+    assertThat(flat(Point(1, 2)), eq("Point(x=1, y=2)"))
+
+
+@test
+def records() -> None:
+    """Dataclasses show their repr fields and enums their member."""
+    assertThat(flat(User("ted", "hidden")), eq("User(name='ted')"))
+    assertThat(flat(Color.RED), eq("Color.RED"))
+
+
+@test
+def register() -> None:
+    """A registered formatter is used for the type and it's subclasses."""
+
+    class Money(float):
+        pass
+
+    class Cents(Money):
+        pass
+
+    formatter = register_pprint(Money, lambda value, style: f"${value:.2f}", leaf=True)
+    assertThat(flat([Money(1.5), Cents(2)]), eq("[$1.50, $2.00]"))
+    assertThat(formatter_for(Cents) is formatter, eq(True))
+    assertThat(formatter in LEAVES, eq(True))
+    assertThat(CACHE[Cents] is formatter, eq(True))
+
+
+@test
+def register_by_name() -> None:
+    """A formatter can be registered by the qualified name of a type."""
+
+    class Named:
+        pass
+
+    register_pprint(f"{__name__}.{Named.__qualname__}", lambda value, style: "named")
+    assertThat(flat(Named()), eq("named"))
+
+
+@test
+def register_errors() -> None:
+    """Only types or names and callables can be registered."""
+    assertThat(wrap(register_pprint, 1, str), raises(TypeError))
+    assertThat(wrap(register_pprint, int, "not callable"), raises(TypeError))
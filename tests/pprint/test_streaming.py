@@ -0,0 +1,72 @@
+from io import StringIO
+
+from teddecor.UnitTest import *
+from teddecor.pprint import p_iter, p_value, pprint
+
+
+class Writes(StringIO):
+    """A stream that counts how often it is written to."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def numbers(count: int, pulled: list):
+    for number in range(count):
+        pulled.append(number)
+        yield number
+
+
+@test
+def chunks() -> None:
+    """Large values are formatted in several chunks that join to the whole value."""
+    value = list(range(10_000))
+    chunks = list(p_iter(value, style=None))
+
+    assertThat(len(chunks) > 1, eq(True))
+    assertThat("".join(chunks), eq(p_value(value, style=None)))
+
+
+@test
+def stream() -> None:
+    """Values are written to the stream in chunks with the seperator and end between them."""
+    output = Writes()
+    pprint(list(range(10_000)), stream=output, style=None)
+
+    assertThat(output.writes > 2, eq(True))
+    assertThat(output.getvalue(), eq(p_value(list(range(10_000)), style=None) + "\n"))
+
+    output = StringIO()
+    pprint([1, 2], "x", stream=output, seperator=" | ", end="", style=None)
+    assertThat(output.getvalue(), eq("[\n  1,\n  2\n] | 'x'"))
+
+
+@test
+def lazy_iterators() -> None:
+    """Iterators are formatted item by item and only pulled as far as they are shown."""
+    pulled = []
+    text = "".join(p_iter(numbers(100, pulled), style=None, max_items=3))
+
+    assertThat(text, eq("generator[\n  0,\n  1,\n  2,\n  … more …\n]"))
+    assertThat(pulled, eq([0, 1, 2, 3]))
+
+
+@test
+def unpulled_iterators() -> None:
+    """`p_value` shows iterators by their type without using them up unless asked to."""
+    pulled = []
+    values = numbers(3, pulled)
+
+    assertThat(
+        p_value([values, iter([1])], style=None),
+        eq("[\n  <generator>,\n  <list_iterator>\n]"),
+    )
+    assertThat(pulled, eq([]))
+    assertThat(p_value({"a": 1}.keys(), style=None), eq("dict_keys[\n  'a'\n]"))
+    assertThat(p_value(values, style=None, iterate=True), eq("generator[\n  0,\n  1,\n  2\n]"))
+    assertThat(pulled, eq([0, 1, 2]))
@@ -0,0 +1,39 @@
+from teddecor.UnitTest import *
+from teddecor.pprint import Theme, active_theme, p_value, use_theme
+
+RED = {"number": "[@F #ff0000]"}
+
+
+@test
+def color_depths() -> None:
+    """True colors are brought down to the closest color the terminal can show."""
+    assertThat(Theme(RED).ansi.wrap("number", "1"), eq("\x1b[38;2;255;0;0m1\x1b[39m"))
+    assertThat(Theme(RED, colors=8).ansi.wrap("number", "1"), eq("\x1b[38;5;196m1\x1b[39m"))
+    assertThat(Theme(RED, colors=4).ansi.wrap("number", "1"), eq("\x1b[91m1\x1b[39m"))
+    assertThat(Theme(RED, colors=0).ansi.wrap("number", "1"), eq("1"))
+    assertThat(wrap(Theme, RED, 16), raises(ValueError))
+
+
+@test
+def roles() -> None:
+    """Kinds of elements that aren't given keep their default markup."""
+    theme = Theme(RED)
+    assertThat(theme.roles["number"], eq("[@F #ff0000]"))
+    assertThat(theme.roles["string"], eq(Theme().roles["string"]))
+    assertThat(theme.markup.wrap("number", "1"), eq("[@F #ff0000]1[@F]"))
+
+
+@test
+def active() -> None:
+    """Values are styled with the active theme until another one is used."""
+    theme = Theme(RED)
+    previous = use_theme(theme)
+    try:
+        assertThat(active_theme() is theme, eq(True))
+        assertThat(p_value(5), eq("\x1b[38;2;255;0;0m5\x1b[39m"))
+        assertThat(p_value(5, decode=False), eq("[@F #ff0000]5[@F]"))
+    finally:
+        use_theme(previous)
+
+    assertThat(active_theme() is previous, eq(True))
+    assertThat(wrap(use_theme, RED), raises(TypeError))
@@ -0,0 +1,46 @@
+from teddecor.UnitTest import *
+from teddecor.TED import TED
+from teddecor.pprint import ANSI, MARKUP, PLAIN, Theme, p_value
+
+from conftest import uncolored
+
+PAYLOAD = {f"key_{i}": i * 1_000 for i in range(8)}
+LENGTH = len(p_value(PAYLOAD, style=PLAIN, width=1_000))
+"""The columns the payload takes on one line."""
+
+
+@test
+def fits() -> None:
+    """A container that fits before the last column is put on one line, and one that doesn't
+    isn't."""
+    assertThat(len(p_value(PAYLOAD, style=PLAIN, width=LENGTH + 1).splitlines()), eq(1))
+    assertThat(len(p_value(PAYLOAD, style=PLAIN, width=LENGTH).splitlines()), eq(10))
+
+
+@test
+def true_color() -> None:
+    """True color sequences don't count towards the width."""
+    text = p_value(PAYLOAD, style=ANSI, width=LENGTH + 1)
+    assertThat(len(text.splitlines()), eq(1))
+    assertThat(uncolored(text), eq(p_value(PAYLOAD, style=PLAIN, width=LENGTH + 1)))
+
+
+@test
+def same_layout() -> None:
+    """Every color depth and markup is laid out the same as plain text."""
+    value = {"name": "a*b_[c]\n" * 3, "items": list(range(12)), "nested": {"x": (1, 2)}}
+    styles = [Theme(colors=colors).ansi for colors in (24, 8, 4, 0)]
+    for width in (20, 40, 60, 80, 100):
+        plain = p_value(value, depth=3, style=PLAIN, width=width)
+        for style in styles:
+            assertThat(uncolored(p_value(value, depth=3, style=style, width=width)), eq(plain))
+        markup = p_value(value, depth=3, style=MARKUP, width=width)
+        assertThat(uncolored(TED.parse(markup)), eq(plain))
+
+
+@test
+def visible_width() -> None:
+    """`Style.width` is the length of the text without it's sequences and escapes."""
+    assertThat(ANSI.width(ANSI.wrap("type", "list") + ANSI.symbol("[")), eq(5))
+    assertThat(MARKUP.width(MARKUP.string("*[x]*")), eq(len(repr("*[x]*"))))
+    assertThat(PLAIN.width("plain"), eq(5))